@@ -24,7 +24,11 @@ from app.core.security import (
     get_access_token_cookie_settings,
     get_refresh_token_cookie_settings,
 )
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import (
+    get_current_active_user,
+    invalidate_membership_cache,
+    invalidate_user_cache,
+)
 from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["인증"])
@@ -283,6 +287,7 @@ async def oauth_callback(callback_data: CognitoCallbackRequest, response: Respon
                 user.email = email
                 user.name = name
                 await user.save()
+                invalidate_user_cache(user.id)
 
         # 4. 로컬 JWT 발급 (쿠키 설정)
         set_auth_cookies(response, user.id)
@@ -406,7 +411,9 @@ async def update_me(
     for key, value in update_data.items():
         setattr(current_user, key, value)
 
-    await current_user.save()
+    # 캐시된 스냅샷의 다른 필드로 덮어쓰지 않도록 변경된 필드만 저장
+    await current_user.save(update_fields=[*update_data.keys(), "modified_at"])
+    invalidate_user_cache(current_user.id)
 
     return UserResponse(
         id=current_user.id,
@@ -567,6 +574,7 @@ async def update_my_membership_in_club(
             )
 
     await membership.save()
+    invalidate_membership_cache(current_user.id, club_id)
 
     return ClubMembershipResponse(
         id=membership.id,
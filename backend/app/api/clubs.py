@@ -8,7 +8,12 @@ from app.schemas.schedule import ScheduleResponse
 from app.models.club import Club
 from app.models.schedule import ClubSchedule
 from app.models.user import User
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import (
+    get_current_active_user,
+    invalidate_membership_cache,
+    invalidate_club_cache,
+)
+from app.services.club_listing_service import invalidate_club_listing, list_club_page
 
 router = APIRouter(prefix="/clubs", tags=["동호회"])
 
@@ -44,6 +49,8 @@ async def list_clubs(
     limit: int = 20,
     page: int = None,
     page_size: int = None,
+    cursor: str = None,
+    include_total: bool = False,
 ):
     """
     동호회 목록 조회
@@ -51,32 +58,15 @@ async def list_clubs(
     - 검색: 이름에 검색어가 포함된 동호회
     - 회원수와 내 가입 상태 포함
     - page 파라미터로 페이지네이션 지원
+    - cursor 파라미터로 커서 페이지네이션 지원 (첫 페이지는 빈 값, 이후 next_cursor 전달)
     """
-    from app.models.member import ClubMember, MemberStatus
-    from tortoise.functions import Count
-    from tortoise.queryset import Q
-    from app.schemas.pagination import paginate_query
-
-    query = Club.filter(is_deleted=False)
-    if search:
-        query = query.filter(name__icontains=search)
-
-    # 활성 회원수를 annotate로 한 번에 조회 (N+1 방지)
-    annotated_query = query.annotate(
-        member_count=Count(
-            "members",
-            _filter=Q(members__status=MemberStatus.ACTIVE, members__is_deleted=False)
-        )
-    ).order_by("-created_at")
+    from app.models.member import ClubMember
 
-    if page is not None:
-        clubs, pagination = await paginate_query(annotated_query, page, page_size)
-    else:
-        clubs = await annotated_query.offset(skip).limit(limit)
-        pagination = None
+    # 클럽 정보와 회원수는 검색어/페이지별 캐시, 내 가입 상태는 요청마다 조회
+    clubs, pagination = await list_club_page(search, skip, limit, page, page_size, cursor, include_total)
 
     # 클럽 ID 목록으로 내 멤버십 일괄 조회
-    club_ids = [club.id for club in clubs]
+    club_ids = [club["id"] for club in clubs]
     my_memberships = await ClubMember.filter(
         club_id__in=club_ids,
         user=current_user,
@@ -86,20 +76,9 @@ async def list_clubs(
 
     result = []
     for club in clubs:
-        my_membership = membership_map.get(club.id)
+        my_membership = membership_map.get(club["id"])
         my_status = my_membership.status.value if my_membership else None
-
-        result.append(ClubSearchResponse(
-            id=club.id,
-            name=club.name,
-            description=club.description,
-            created_at=club.created_at,
-            location=club.location,
-            is_join_allowed=club.is_join_allowed,
-            requires_approval=club.requires_approval,
-            member_count=club.member_count,
-            my_status=my_status
-        ))
+        result.append(ClubSearchResponse(**club, my_status=my_status))
 
     if pagination:
         return {**pagination, "items": result}
@@ -152,6 +131,8 @@ async def create_club(
         status=MemberStatus.ACTIVE,
         gender=gender,
     )
+    invalidate_membership_cache(current_user.id, club.id)
+    invalidate_club_listing()
 
     return ClubResponse.model_validate(await get_club_with_schedules(club))
 
@@ -193,11 +174,15 @@ async def join_club(
                 existing_member.status = MemberStatus.PENDING
                 existing_member.role = MemberRole.MEMBER
                 await existing_member.save()
+                invalidate_membership_cache(current_user.id, club_id)
+                invalidate_club_listing()
                 return {"message": "재가입 요청이 완료되었습니다. 관리자의 승인을 기다려주세요."}
             else:
                 existing_member.status = MemberStatus.ACTIVE
                 existing_member.role = MemberRole.MEMBER
                 await existing_member.save()
+                invalidate_membership_cache(current_user.id, club_id)
+                invalidate_club_listing()
                 return {"message": "재가입이 완료되었습니다."}
         elif existing_member.status in [MemberStatus.ACTIVE, MemberStatus.PENDING]:
             raise HTTPException(
@@ -223,6 +208,8 @@ async def join_club(
         status=initial_status,
         gender=gender,
     )
+    invalidate_membership_cache(current_user.id, club_id)
+    invalidate_club_listing()
 
     if club.requires_approval:
         return {"message": "가입 요청이 완료되었습니다. 관리자의 승인을 기다려주세요."}
@@ -267,6 +254,8 @@ async def leave_club(
 
     member.status = MemberStatus.LEFT
     await member.save()
+    invalidate_membership_cache(current_user.id, club_id)
+    invalidate_club_listing()
 
     return {"message": "동호회를 탈퇴했습니다"}
 
@@ -311,6 +300,8 @@ async def approve_member(
         
     target_member.status = MemberStatus.ACTIVE
     await target_member.save()
+    invalidate_membership_cache(target_member.user_id, club_id)
+    invalidate_club_listing()
     
     return {"message": "회원 가입을 승인했습니다"}
 
@@ -393,6 +384,7 @@ async def update_club(
                 end_time=schedule.end_time,
                 is_active=schedule.is_active,
             )
+    invalidate_club_listing()
 
     return ClubResponse.model_validate(await get_club_with_schedules(club))
 
@@ -425,3 +417,5 @@ async def delete_club(
     # Soft delete
     club.is_deleted = True
     await club.save()
+    invalidate_club_cache(club_id)
+    invalidate_club_listing()
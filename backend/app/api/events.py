@@ -21,15 +21,20 @@ async def list_events(
     limit: int = 100,
     page: int = None,
     page_size: int = None,
+    cursor: str = None,
+    include_total: bool = False,
 ):
-    """일정 목록 조회 (page 파라미터로 페이지네이션 지원)"""
+    """일정 목록 조회 (page 또는 cursor 파라미터로 페이지네이션 지원)"""
     from app.schemas.pagination import paginate_query
 
     await get_club_or_404(club_id)
     query = Event.filter(club_id=club_id, is_deleted=False)
 
-    if page is not None:
-        events, pagination = await paginate_query(query, page, page_size)
+    if cursor is not None or page is not None:
+        events, pagination = await paginate_query(
+            query, page, page_size,
+            cursor=cursor, cursor_fields=("-created_at", "-id"), include_total=include_total
+        )
         items = [EventResponse.model_validate(event) for event in events]
         return {**pagination, "items": items}
 
@@ -16,8 +16,6 @@ from app.models.club import Club
 from app.models.guest import Guest
 from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
 from app.models.user import User
-from app.models.match import MatchParticipant, ParticipantCategory
-from app.models.event import SessionParticipant
 from app.core.dependencies import (
     get_current_active_user,
     require_club_manager,
@@ -47,6 +45,18 @@ class GuestLinkRequest(PydanticBase):
     transfer_records: bool = True  # 경기 기록 이전 여부
 
 
+class GuestLinkItem(PydanticBase):
+    """일괄 연결 항목"""
+    guest_id: int
+    member_id: int
+
+
+class GuestBulkLinkRequest(PydanticBase):
+    """게스트-회원 일괄 연결 요청"""
+    links: List[GuestLinkItem]
+    transfer_records: bool = True
+
+
 class GuestResponse(PydanticBase):
     id: int
     name: str
@@ -256,6 +266,66 @@ async def update_guest(
     return {"message": "게스트 정보가 수정되었습니다"}
 
 
+async def _validate_links(club_id: int, links: List[GuestLinkItem]) -> dict:
+    """
+    게스트-회원 연결 요청 검증 (요청 수와 무관하게 조회 3회)
+
+    Returns:
+        {guest_id: member_id}
+    """
+    guest_ids = [link.guest_id for link in links]
+    member_ids = [link.member_id for link in links]
+    if len(set(guest_ids)) != len(guest_ids) or len(set(member_ids)) != len(member_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="같은 게스트나 회원을 중복해서 연결할 수 없습니다"
+        )
+
+    guests = {
+        row["id"]: row["linked_member_id"]
+        for row in await Guest.filter(
+            id__in=guest_ids, club_id=club_id, is_deleted=False
+        ).values("id", "linked_member_id")
+    }
+    members = dict(await ClubMember.filter(
+        id__in=member_ids, club_id=club_id, is_deleted=False
+    ).values_list("id", "status"))
+    # 해당 회원이 이미 다른 게스트와 연결되어 있는지 확인 (같은 동호회 내에서)
+    already_linked = set(await Guest.filter(
+        linked_member_id__in=member_ids, club_id=club_id, is_deleted=False
+    ).values_list("linked_member_id", flat=True))
+
+    for link in links:
+        if link.guest_id not in guests:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="게스트를 찾을 수 없습니다"
+            )
+        if guests[link.guest_id]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 다른 회원과 연결된 게스트입니다"
+            )
+        if link.member_id not in members:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="연결할 회원을 찾을 수 없습니다"
+            )
+        if link.member_id in already_linked:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="해당 회원은 이미 다른 게스트와 연결되어 있습니다"
+            )
+        # 대상 회원이 활성 상태인지 확인
+        if members[link.member_id] != MemberStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="활성 상태인 회원만 연결할 수 있습니다"
+            )
+
+    return {link.guest_id: link.member_id for link in links}
+
+
 @router.post("/{guest_id}/link")
 async def link_guest_to_member(
     club_id: int,
@@ -267,91 +337,58 @@ async def link_guest_to_member(
     게스트를 회원과 연결 (매니저만)
 
     - 미가입 게스트가 서비스에 가입한 후 기존 기록과 연결
-    - transfer_records=True: 경기 기록을 회원에게 이전
+    - transfer_records=True: 경기 기록을 회원에게 이전 (전적/랭킹/레이팅/요약 통계 함께 갱신)
     """
-    guest = await Guest.get_or_none(id=guest_id, club_id=club_id, is_deleted=False)
-    if not guest:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="게스트를 찾을 수 없습니다"
-        )
+    from app.services.guest_link_service import link_guests
 
-    if guest.linked_member_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 다른 회원과 연결된 게스트입니다"
-        )
+    links = await _validate_links(club_id, [GuestLinkItem(guest_id=guest_id, member_id=link_data.member_id)])
 
-    # 연결할 회원 확인
-    target_member = await ClubMember.get_or_none(
-        id=link_data.member_id,
-        club_id=club_id,
-        is_deleted=False
-    )
-    if not target_member:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="연결할 회원을 찾을 수 없습니다"
-        )
+    async with in_transaction():
+        transferred = await link_guests(club_id, links, link_data.transfer_records)
 
-    # 해당 회원이 이미 다른 게스트와 연결되어 있는지 확인 (같은 동호회 내에서)
-    existing_link = await Guest.get_or_none(
-        linked_member_id=link_data.member_id,
-        club_id=club_id,
-        is_deleted=False
-    )
-    if existing_link:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="해당 회원은 이미 다른 게스트와 연결되어 있습니다"
-        )
+    return {
+        "message": "게스트가 회원과 연결되었습니다",
+        "guest_id": guest_id,
+        "member_id": link_data.member_id,
+        "records_transferred": transferred[guest_id] > 0
+    }
 
-    # 대상 회원이 활성 상태인지 확인
-    if target_member.status != MemberStatus.ACTIVE:
+
+@router.post("/bulk-link")
+async def bulk_link_guests_to_members(
+    club_id: int,
+    link_data: GuestBulkLinkRequest,
+    membership: ClubMember = Depends(require_club_manager)
+):
+    """
+    여러 게스트를 회원과 한 번에 연결 (매니저만)
+
+    - 모든 연결을 먼저 검증하고, 하나라도 실패하면 아무것도 연결하지 않음
+    - 기록 이전과 랭킹/통계 갱신은 하나의 트랜잭션에서 처리
+    """
+    from app.services.guest_link_service import link_guests
+
+    if not link_data.links:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="활성 상태인 회원만 연결할 수 있습니다"
+            detail="연결할 게스트를 지정해주세요"
         )
 
+    links = await _validate_links(club_id, link_data.links)
+
     async with in_transaction():
-        # 게스트와 회원 연결
-        guest.linked_member = target_member
-        await guest.save()
-
-        # 경기 기록 이전
-        if link_data.transfer_records and guest.total_games > 0:
-            target_member.total_games += guest.total_games
-            target_member.wins += guest.wins
-            target_member.losses += guest.losses
-            target_member.draws += guest.draws
-            await target_member.save()
-
-            # MatchParticipant 참조 업데이트: guest → club_member
-            match_participants = await MatchParticipant.filter(
-                guest_id=guest.id,
-                is_deleted=False
-            )
-            for mp in match_participants:
-                mp.guest = None
-                mp.club_member = target_member
-                mp.participant_category = ParticipantCategory.MEMBER
-                await mp.save()
-
-            # SessionParticipant 참조 업데이트: guest → club_member
-            session_participants = await SessionParticipant.filter(
-                guest_id=guest.id,
-                is_deleted=False
-            )
-            for sp in session_participants:
-                sp.guest = None
-                sp.club_member = target_member
-                await sp.save()
+        transferred = await link_guests(club_id, links, link_data.transfer_records)
 
     return {
-        "message": "게스트가 회원과 연결되었습니다",
-        "guest_id": guest.id,
-        "member_id": target_member.id,
-        "records_transferred": link_data.transfer_records and guest.total_games > 0
+        "message": f"{len(links)}명의 게스트가 회원과 연결되었습니다",
+        "linked": [
+            {
+                "guest_id": guest_id,
+                "member_id": member_id,
+                "records_transferred": transferred[guest_id],
+            }
+            for guest_id, member_id in links.items()
+        ],
     }
 
 
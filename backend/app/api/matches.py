@@ -18,6 +18,8 @@ from app.models.event import Session
 from app.models.user import User
 from app.models.member import ClubMember, MemberRole, MemberStatus
 from app.core.dependencies import get_current_active_user, require_club_manager, get_club_or_404
+from app.services.ranking_service import result_outcome, apply_outcome_changes, lock_match_outcome
+from tortoise.transactions import in_transaction
 
 router = APIRouter(tags=["매칭"])
 
@@ -25,8 +27,8 @@ router = APIRouter(tags=["매칭"])
 async def get_match_with_club_check(match_id: int, club_id: int) -> Match:
     """매치 조회 및 클럽 소속 확인"""
     match = await Match.get_or_none(
-        id=match_id, is_deleted=False
-    ).prefetch_related("session__event__club", "session__season")
+        id=match_id, club_id=club_id, is_deleted=False
+    ).prefetch_related("session")
 
     if not match:
         raise HTTPException(
@@ -34,20 +36,6 @@ async def get_match_with_club_check(match_id: int, club_id: int) -> Match:
             detail="매치를 찾을 수 없습니다"
         )
 
-    # 클럽 소속 확인
-    match_club_id = None
-    if match.session:
-        if match.session.event:
-            match_club_id = match.session.event.club_id
-        elif match.session.season:
-            match_club_id = match.session.season.club_id
-
-    if match_club_id != club_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="매치를 찾을 수 없습니다"
-        )
-
     return match
 
 
@@ -130,17 +118,26 @@ async def update_match(
     await get_club_or_404(club_id)
     await verify_club_manager(club_id, current_user)
 
-    match = await get_match_with_club_check(match_id, club_id)
-
-    # 수정
-    if match_data.court_number is not None:
-        match.court_number = match_data.court_number
-    if match_data.scheduled_datetime is not None:
-        match.scheduled_datetime = match_data.scheduled_datetime
-    if match_data.status is not None:
-        match.status = match_data.status
-
-    await match.save()
+    season_id = (await get_match_with_club_check(match_id, club_id)).session.season_id
+
+    async with in_transaction():
+        match, result = await lock_match_outcome(match_id)
+        outcome_before = result_outcome(match, result)
+
+        # 수정
+        if match_data.court_number is not None:
+            match.court_number = match_data.court_number
+        if match_data.scheduled_datetime is not None:
+            match.scheduled_datetime = match_data.scheduled_datetime
+        if match_data.status is not None:
+            match.status = match_data.status
+
+        await match.save()
+        # 상태 변경(완료 ↔ 미완료)에 따른 랭킹 증분 반영
+        await apply_outcome_changes(
+            club_id, season_id,
+            [(match.id, outcome_before, result_outcome(match, result))]
+        )
     return MatchResponse.model_validate(match)
 
 
@@ -154,10 +151,21 @@ async def delete_match(
     await get_club_or_404(club_id)
     await verify_club_manager(club_id, current_user)
 
-    match = await get_match_with_club_check(match_id, club_id)
+    season_id = (await get_match_with_club_check(match_id, club_id)).session.season_id
 
-    match.is_deleted = True
-    await match.save()
+    async with in_transaction():
+        match, result = await lock_match_outcome(match_id)
+        if match.is_deleted:
+            return
+        outcome_before = result_outcome(match, result)
+
+        match.is_deleted = True
+        await match.save()
+        # 삭제된 경기의 랭킹 반영분 되돌리기
+        await apply_outcome_changes(
+            club_id, season_id,
+            [(match.id, outcome_before, None)]
+        )
 
 
 # 매치 참가자
@@ -189,15 +197,7 @@ async def create_match_result(
     await get_club_or_404(club_id)
     await verify_club_manager(club_id, current_user)
 
-    await get_match_with_club_check(match_id, club_id)
-
-    # 이미 결과가 있는지 확인
-    existing_result = await MatchResult.get_or_none(match_id=match_id)
-    if existing_result:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 등록된 결과가 있습니다"
-        )
+    season_id = (await get_match_with_club_check(match_id, club_id)).session.season_id
 
     # 점수 검증
     if result_data.team_a_score < 0 or result_data.team_b_score < 0:
@@ -206,14 +206,28 @@ async def create_match_result(
             detail="점수는 0 이상이어야 합니다"
         )
 
-    result = await MatchResult.create(
-        match_id=match_id,
-        team_a_score=result_data.team_a_score,
-        team_b_score=result_data.team_b_score,
-        sets_detail=result_data.sets_detail,
-        winner_team=result_data.winner_team,
-        recorded_by=current_user
-    )
+    async with in_transaction():
+        # 이미 결과가 있는지 확인 (경기 행을 잠근 뒤 확인하여 동시 등록 방지)
+        match, existing_result = await lock_match_outcome(match_id)
+        if existing_result:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이미 등록된 결과가 있습니다"
+            )
+
+        result = await MatchResult.create(
+            match_id=match_id,
+            team_a_score=result_data.team_a_score,
+            team_b_score=result_data.team_b_score,
+            sets_detail=result_data.sets_detail,
+            winner_team=result_data.winner_team,
+            recorded_by=current_user
+        )
+        # 랭킹 증분 반영 (완료된 경기만 반영됨)
+        await apply_outcome_changes(
+            club_id, season_id,
+            [(match.id, None, result_outcome(match, result))]
+        )
 
     return MatchResultResponse.model_validate(result)
 
@@ -15,8 +15,10 @@ from app.models.member import ClubMember, MemberRole, MemberStatus
 from app.core.dependencies import (
     require_club_member_not_guest,
     require_club_manager,
+    invalidate_membership_cache,
 )
 from app.core.timezone import serialize_to_kst
+from app.services.club_listing_service import invalidate_club_listing
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +60,8 @@ async def list_members(
     status_filter: Optional[str] = None,
     page: Optional[int] = None,
     page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     membership: ClubMember = Depends(require_club_member_not_guest)
 ):
     """
@@ -66,6 +70,7 @@ async def list_members(
     - 게스트는 조회 불가 (403)
     - 매니저/일반회원만 조회 가능
     - page 파라미터로 페이지네이션 지원
+    - cursor 파라미터로 커서 페이지네이션 지원 (가입일 최신순)
     """
     try:
         from app.schemas.pagination import paginate_query
@@ -82,7 +87,10 @@ async def list_members(
                 )
             query = query.filter(status=status_filter)
 
-        members, pagination = await paginate_query(query, page, page_size)
+        members, pagination = await paginate_query(
+            query, page, page_size,
+            cursor=cursor, cursor_fields=("-created_at", "-id"), include_total=include_total
+        )
 
         items = [MemberResponse(
             id=m.id,
@@ -130,6 +138,8 @@ async def approve_member(
 
     member.status = MemberStatus.ACTIVE
     await member.save()
+    invalidate_membership_cache(member.user_id, club_id)
+    invalidate_club_listing()
 
     return {"message": "회원 가입을 승인했습니다"}
 
@@ -181,6 +191,7 @@ async def update_member_role(
 
     member.role = MemberRole(new_role)
     await member.save()
+    invalidate_membership_cache(member.user_id, club_id)
 
     return {"message": "역할이 변경되었습니다", "new_role": new_role}
 
@@ -224,5 +235,7 @@ async def remove_member(
     # Soft delete
     member.is_deleted = True
     await member.save()
+    invalidate_membership_cache(member.user_id, club_id)
+    invalidate_club_listing()
 
     return {"message": "회원을 내보냈습니다"}
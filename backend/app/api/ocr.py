@@ -1,23 +1,30 @@
 """
 경기 결과지 OCR API
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel as PydanticBase, Field
 from app.models.user import User
 from app.models.club import Club
-from app.models.season import Season
-from app.models.event import Session, SessionParticipant, SessionStatus, SessionType, ParticipantCategory
-from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+from app.models.season import Season, SeasonStatus
+from app.models.event import Session, SessionStatus, SessionType
+from app.models.match import Match
 from app.models.member import ClubMember, MemberStatus
-from app.core.dependencies import get_current_active_user, require_club_manager, get_club_or_404
+from app.core.dependencies import get_current_active_user, require_club_manager, require_super_admin, get_club_or_404
+from app.services.gemini_client import GeminiTimeoutError, GeminiUnavailableError
 from app.services.ocr_service import ocr_service
+from app.services.ranking_service import result_outcome, apply_outcome_changes
 from datetime import date, time
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/clubs/{club_id}/ocr", tags=["OCR"])
 
+ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+MAX_IMAGE_BYTES = 10 * 1024 * 1024  # 10MB
+MAX_JOB_IMAGES = 10  # 비동기 작업 1건당 최대 이미지 수
+
 
 class MatchPlayerData(PydanticBase):
     """경기 선수 데이터"""
@@ -33,11 +40,23 @@ class ExtractedMatch(PydanticBase):
     team_b: MatchPlayerData
 
 
+class PlayerSuggestion(PydanticBase):
+    """선수 이름 매칭 후보"""
+    member_id: Optional[int] = None
+    guest_id: Optional[int] = None
+    name: str
+    confidence: float
+
+
 class OCRResult(PydanticBase):
     """OCR 추출 결과"""
     date: Optional[str] = None
     location: Optional[str] = None
     matches: List[ExtractedMatch]
+    # 추출된 선수 이름별 회원/게스트 후보 (클럽 활성 멤버에게만 제공)
+    player_suggestions: Dict[str, List[PlayerSuggestion]] = {}
+    # 같은 이미지의 이전 추출 결과를 재사용했는지 여부
+    cached: bool = False
 
 
 class PlayerMapping(PydanticBase):
@@ -89,47 +108,170 @@ async def extract_match_results(
 
     # 클럽 확인
     await get_club_or_404(club_id)
+    contents = await _read_image_upload(file)
+
+    try:
+        logger.info(f"[OCR] Gemini API 호출 시작...")
+        result, cached = await ocr_service.extract_with_cache(contents, file.content_type)
+        match_count = len(result.get("matches", []))
+        logger.info(f"[OCR] 추출 완료 - {match_count}개 매치 추출됨 (캐시 적중: {cached})")
+        ocr_result = OCRResult(**result, cached=cached)
+    except GeminiTimeoutError as e:
+        logger.warning(f"[OCR] {e}")
+        raise HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    except GeminiUnavailableError as e:
+        logger.warning(f"[OCR] {e}")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except ValueError as e:
+        logger.error(f"[OCR] 값 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error(f"[OCR] 처리 오류: {type(e).__name__}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="이미지 처리 중 오류가 발생했습니다"
+        )
+
+    await _attach_player_suggestions(club_id, current_user, ocr_result)
+    return ocr_result
+
 
+async def _read_image_upload(file: UploadFile) -> bytes:
+    """업로드 이미지 형식/크기 검증 후 바이트 반환"""
     # 파일 타입 확인
-    allowed_types = ["image/jpeg", "image/png", "image/gif", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_IMAGE_TYPES:
         logger.warning(f"[OCR] 지원하지 않는 파일 형식: {file.content_type}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(allowed_types)}"
+            detail=f"지원하지 않는 파일 형식입니다. 지원 형식: {', '.join(ALLOWED_IMAGE_TYPES)}"
         )
 
     # 파일 크기 확인 (10MB 제한)
     contents = await file.read()
     file_size_mb = len(contents) / (1024 * 1024)
-    logger.info(f"[OCR] 파일 읽기 완료 - 크기: {file_size_mb:.2f}MB")
+    logger.info(f"[OCR] 파일 읽기 완료 - {file.filename}, 크기: {file_size_mb:.2f}MB")
 
-    if len(contents) > 10 * 1024 * 1024:
+    if len(contents) > MAX_IMAGE_BYTES:
         logger.warning(f"[OCR] 파일 크기 초과: {file_size_mb:.2f}MB")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="파일 크기가 10MB를 초과합니다"
         )
+    return contents
+
+
+async def _attach_player_suggestions(club_id: int, current_user: User, ocr_result: OCRResult) -> None:
+    """클럽 활성 멤버에게만 회원/게스트 이름 후보 제공"""
+    if current_user.is_super_admin or await ClubMember.exists(
+        club_id=club_id, user_id=current_user.id, is_deleted=False, status=MemberStatus.ACTIVE
+    ):
+        from app.services.ocr_import_service import load_name_index, suggest_players
+
+        _, _, name_index = await load_name_index(club_id)
+        names = [
+            name
+            for match in ocr_result.matches
+            for name in match.team_a.players + match.team_b.players
+        ]
+        ocr_result.player_suggestions = {
+            name: [PlayerSuggestion(**suggestion) for suggestion in suggestions]
+            for name, suggestions in suggest_players(name_index, names).items()
+        }
+
+
+@router.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def submit_ocr_job(
+    club_id: int,
+    files: List[UploadFile] = File(...),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    경기 결과지 추출 작업을 제출합니다 (비동기).
+
+    - 작업 ID를 즉시 반환하고 백그라운드에서 Gemini 추출을 진행합니다.
+    - 여러 장(최대 10장)을 한 번에 제출하면 페이지별로 병렬 처리합니다.
+    - 처리 중인 작업이 사용자별/전체 제한을 넘으면 429/503을 반환합니다.
+    - GET /ocr/jobs/{job_id}로 상태와 결과를 조회합니다.
+    """
+    from app.services.ocr_jobs import ocr_job_queue, OCRJobLimitError
+
+    await get_club_or_404(club_id)
+    if len(files) > MAX_JOB_IMAGES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MAX_JOB_IMAGES}장까지 제출할 수 있습니다"
+        )
 
     try:
-        logger.info(f"[OCR] Gemini API 호출 시작...")
-        result = await ocr_service.extract_match_results(contents, file.content_type)
-        match_count = len(result.get("matches", []))
-        logger.info(f"[OCR] 추출 완료 - {match_count}개 매치 추출됨")
-        return OCRResult(**result)
-    except ValueError as e:
-        logger.error(f"[OCR] 값 오류: {e}")
+        # 제한 초과면 업로드를 메모리에 읽기 전에 거절
+        ocr_job_queue.check_capacity(current_user.id)
+        images = [(file.filename, file.content_type, await _read_image_upload(file)) for file in files]
+        job = await ocr_job_queue.submit(club_id, current_user.id, images)
+    except OCRJobLimitError as e:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS if e.per_user else status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(e)
         )
-    except Exception as e:
-        logger.error(f"[OCR] 처리 오류: {type(e).__name__}: {e}", exc_info=True)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "pages": [page.to_dict() for page in job.pages],
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def get_ocr_job(
+    club_id: int,
+    job_id: str,
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    추출 작업 상태/결과 조회
+
+    - status: pending, running, completed, failed
+    - 완료되면 result에 모든 페이지의 경기를 합친 추출 결과를 반환합니다.
+    """
+    from app.services.ocr_jobs import ocr_job_queue, COMPLETED
+
+    job = ocr_job_queue.get(job_id)
+    if (
+        job is None
+        or job.club_id != club_id
+        or (job.user_id != current_user.id and not current_user.is_super_admin)
+    ):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="이미지 처리 중 오류가 발생했습니다"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
         )
 
+    result = None
+    job_status = job.status
+    merged = job.merged_result() if job_status == COMPLETED else None
+    if merged is not None:
+        result = OCRResult(**merged, cached=all(p.cached for p in job.pages if p.result is not None))
+        await _attach_player_suggestions(club_id, current_user, result)
+
+    return {
+        "job_id": job.id,
+        "status": job_status,
+        "pages": [page.to_dict() for page in job.pages],
+        "result": result,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+
+
+@router.get("/cache-stats")
+async def get_ocr_cache_stats(
+    club_id: int,
+    current_user: User = Depends(require_super_admin)
+):
+    """OCR 결과 캐시 적중/미스 통계 (슈퍼 관리자 전용, 프로세스 단위)"""
+    return await asyncio.to_thread(ocr_service.cache.stats)
+
 
 @router.post("/save-matches")
 async def save_extracted_matches(
@@ -143,16 +285,58 @@ async def save_extracted_matches(
     - 기존 세션에 추가하거나 새 세션을 생성할 수 있습니다.
     - 새 시즌을 생성할 수 있습니다.
     - 선수 매핑 정보를 사용하거나 이름으로 회원을 매칭합니다.
+    - 선수 해석(계획) 후 경기/참가자/결과를 한 트랜잭션에서 일괄 저장합니다.
     """
-    from app.models.guest import Guest
-    from app.models.season import SeasonStatus
+    from tortoise.transactions import in_transaction
+    from app.services.ocr_import_service import (
+        load_name_index, build_name_resolver, suggest_players,
+        plan_extracted_matches, persist_extracted_plan
+    )
 
     club = await get_club_or_404(club_id)
 
-    # 시즌 결정
-    season = None
-    created_season_id = None
+    # 시즌/세션 검증과 생성, 경기 저장을 하나의 트랜잭션으로 처리
+    async with in_transaction():
+        season, created_season_id = await _resolve_season(club_id, request)
+        session = await _resolve_session(club_id, request, season)
+
+        # 이름 해석용 회원/게스트 인덱스 (요청당 1회 생성)
+        members, guests, name_index = await load_name_index(club_id)
+        resolve = build_name_resolver(members, guests, request.player_mappings, index=name_index)
+
+        # 계획 → 일괄 저장
+        match_count = await Match.filter(session=session).count()
+        plan = plan_extracted_matches(
+            request.matches, resolve,
+            first_match_number=match_count + 1,
+            scheduled_datetime=session.start_datetime,
+        )
+        saved = await persist_extracted_plan(session.id, plan, membership.user_id, club_id=club_id)
+
+        # 랭킹 증분 반영
+        await apply_outcome_changes(
+            club_id, session.season_id,
+            [(match.id, None, result_outcome(match, result)) for match, result in saved]
+        )
+
+    created_matches = [match.id for match, _ in saved]
+    response = {
+        "message": f"{len(created_matches)}개의 경기가 저장되었습니다",
+        "session_id": session.id,
+        "match_ids": created_matches,
+        "unmatched_players": plan["unmatched_players"] or None,
+        # 미매칭 선수별 후보 (수동 매핑용)
+        "player_suggestions": suggest_players(name_index, plan["unmatched_players"]),
+    }
 
+    if created_season_id:
+        response["created_season_id"] = created_season_id
+
+    return response
+
+
+async def _resolve_season(club_id: int, request: SaveMatchesRequest):
+    """요청에 따라 새 시즌 생성 또는 기존 시즌 조회 → (시즌, 생성된 시즌 ID)"""
     if request.create_new_season:
         # 새 시즌 생성
         if not request.new_season_name:
@@ -174,10 +358,10 @@ async def save_extracted_matches(
             description=request.new_season_description or "",
             status=SeasonStatus.ACTIVE
         )
-        created_season_id = season.id
         logger.info(f"새 시즌 생성: {season.name} (ID: {season.id})")
+        return season, season.id
 
-    elif request.season_id:
+    if request.season_id:
         # 기존 시즌 사용
         season = await Season.get_or_none(id=request.season_id, club_id=club_id, is_deleted=False)
         if not season:
@@ -185,9 +369,13 @@ async def save_extracted_matches(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="시즌을 찾을 수 없습니다"
             )
+        return season, None
+
+    return None, None
 
-    # 세션 결정
-    session = None
+
+async def _resolve_session(club_id: int, request: SaveMatchesRequest, season) -> Session:
+    """요청에 따라 새 세션 생성 또는 기존 세션 조회 (클럽 소속 검증 포함)"""
     if request.create_new_session:
         # 새 세션 생성
         if not request.session_date:
@@ -216,232 +404,37 @@ async def save_extracted_matches(
         end_time = request.session_end_time or time(12, 0)
         start_kst = datetime.combine(request.session_date, start_time, tzinfo=KST)
         end_kst = datetime.combine(request.session_date, end_time, tzinfo=KST)
-        start_datetime_utc = to_utc(start_kst)
-        end_datetime_utc = to_utc(end_kst)
 
-        session = await Session.create(
+        return await Session.create(
+            club_id=club_id,
             event=event,
             season=season,
             title=request.session_title or f"경기 결과 ({request.session_date})",
-            start_datetime=start_datetime_utc,
-            end_datetime=end_datetime_utc,
+            start_datetime=to_utc(start_kst),
+            end_datetime=to_utc(end_kst),
             location=request.session_location or "",
             num_courts=4,
             match_duration_minutes=30,
             session_type=SessionType.LEAGUE,
             status=SessionStatus.CONFIRMED
         )
-    else:
-        # 기존 세션 사용
-        if not request.session_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="세션 ID가 필요합니다"
-            )
-        session = await Session.get_or_none(
-            id=request.session_id, is_deleted=False
-        ).prefetch_related("event", "season")
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="세션을 찾을 수 없습니다"
-            )
-        # 세션이 해당 클럽 소속인지 검증
-        session_club_id = None
-        if session.event:
-            session_club_id = session.event.club_id
-        elif session.season:
-            session_club_id = session.season.club_id
-        if session_club_id != club_id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="해당 클럽의 세션이 아닙니다"
-            )
-
-    # 플레이어 매핑 딕셔너리 생성
-    player_mapping_dict = {}
-    if request.player_mappings:
-        for mapping in request.player_mappings:
-            player_mapping_dict[mapping.extracted_name] = mapping
-
-    # 클럽 회원 목록 조회 (이름 매칭용, 매핑이 없는 경우 폴백)
-    members = await ClubMember.filter(
-        club_id=club_id,
-        is_deleted=False,
-        status=MemberStatus.ACTIVE
-    ).prefetch_related("user")
-
-    # ID -> 회원 매핑
-    member_by_id = {member.id: member for member in members}
-
-    # 게스트 목록 조회
-    guests = await Guest.filter(club_id=club_id, is_deleted=False)
-    guest_by_id = {guest.id: guest for guest in guests}
-
-    # 이름 -> 회원 매핑 (폴백용)
-    name_to_member = {}
-    for member in members:
-        if member.user:
-            name = member.user.name
-            if name:
-                # 정규화된 이름으로 저장 (공백 제거, 소문자)
-                normalized_name = name.replace(" ", "").lower()
-                name_to_member[normalized_name] = member
-                # 원본 이름도 저장
-                name_to_member[name] = member
-
-    def find_participant(player_name: str):
-        """선수 이름으로 참가자 찾기 (회원 또는 게스트)"""
-        if not player_name:
-            return None, None
-
-        # 1. 매핑 정보가 있으면 사용
-        if player_name in player_mapping_dict:
-            mapping = player_mapping_dict[player_name]
-            if mapping.member_id and mapping.member_id in member_by_id:
-                return member_by_id[mapping.member_id], None
-            if mapping.guest_id and mapping.guest_id in guest_by_id:
-                return None, guest_by_id[mapping.guest_id]
-
-        # 2. 폴백: 이름으로 회원 찾기
-        # 정확한 매칭
-        if player_name in name_to_member:
-            return name_to_member[player_name], None
-        # 정규화된 이름으로 매칭
-        normalized = player_name.replace(" ", "").lower()
-        if normalized in name_to_member:
-            return name_to_member[normalized], None
-        # 부분 매칭
-        for name, member in name_to_member.items():
-            if player_name in name or name in player_name:
-                return member, None
-
-        return None, None
-
-    created_matches = []
-    unmatched_players = []
-
-    for match_data in request.matches:
-        # 매치 타입 변환
-        match_type_map = {
-            "mens_doubles": MatchType.MENS_DOUBLES,
-            "mixed_doubles": MatchType.MIXED_DOUBLES,
-            "singles": MatchType.SINGLES
-        }
-        match_type = match_type_map.get(match_data.match_type, MatchType.MENS_DOUBLES)
 
-        # 경기 생성
-        match_count = await Match.filter(session=session).count()
-        match = await Match.create(
-            session=session,
-            match_number=match_count + 1,
-            court_number=match_data.court_number,
-            scheduled_datetime=session.start_datetime,
-            match_type=match_type,
-            status=MatchStatus.COMPLETED
+    # 기존 세션 사용
+    if not request.session_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="세션 ID가 필요합니다"
         )
-
-        # 팀 A 선수 추가
-        for idx, player_name in enumerate(match_data.team_a.players, 1):
-            member, guest = find_participant(player_name)
-            if member:
-                await MatchParticipant.create(
-                    match=match,
-                    club_member=member,
-                    participant_category=ParticipantCategory.MEMBER,
-                    team=Team.A,
-                    position=idx
-                )
-                # 세션 참가자로도 추가
-                existing = await SessionParticipant.get_or_none(session=session, club_member=member)
-                if not existing:
-                    await SessionParticipant.create(
-                        session=session,
-                        club_member=member,
-                        participant_category=ParticipantCategory.MEMBER
-                    )
-            elif guest:
-                await MatchParticipant.create(
-                    match=match,
-                    guest=guest,
-                    participant_category=ParticipantCategory.GUEST,
-                    team=Team.A,
-                    position=idx
-                )
-                # 세션 참가자로도 추가
-                existing = await SessionParticipant.get_or_none(session=session, guest=guest)
-                if not existing:
-                    await SessionParticipant.create(
-                        session=session,
-                        guest=guest,
-                        participant_category=ParticipantCategory.GUEST
-                    )
-            else:
-                unmatched_players.append(player_name)
-
-        # 팀 B 선수 추가
-        for idx, player_name in enumerate(match_data.team_b.players, 1):
-            member, guest = find_participant(player_name)
-            if member:
-                await MatchParticipant.create(
-                    match=match,
-                    club_member=member,
-                    participant_category=ParticipantCategory.MEMBER,
-                    team=Team.B,
-                    position=idx
-                )
-                # 세션 참가자로도 추가
-                existing = await SessionParticipant.get_or_none(session=session, club_member=member)
-                if not existing:
-                    await SessionParticipant.create(
-                        session=session,
-                        club_member=member,
-                        participant_category=ParticipantCategory.MEMBER
-                    )
-            elif guest:
-                await MatchParticipant.create(
-                    match=match,
-                    guest=guest,
-                    participant_category=ParticipantCategory.GUEST,
-                    team=Team.B,
-                    position=idx
-                )
-                # 세션 참가자로도 추가
-                existing = await SessionParticipant.get_or_none(session=session, guest=guest)
-                if not existing:
-                    await SessionParticipant.create(
-                        session=session,
-                        guest=guest,
-                        participant_category=ParticipantCategory.GUEST
-                    )
-            else:
-                unmatched_players.append(player_name)
-
-        # 경기 결과 저장
-        winner = None
-        if match_data.team_a.score > match_data.team_b.score:
-            winner = Team.A
-        elif match_data.team_b.score > match_data.team_a.score:
-            winner = Team.B
-
-        await MatchResult.create(
-            match=match,
-            team_a_score=match_data.team_a.score,
-            team_b_score=match_data.team_b.score,
-            winner_team=winner,
-            recorded_by=membership.user
+    session = await Session.get_or_none(id=request.session_id, is_deleted=False)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="세션을 찾을 수 없습니다"
         )
-
-        created_matches.append(match.id)
-
-    response = {
-        "message": f"{len(created_matches)}개의 경기가 저장되었습니다",
-        "session_id": session.id,
-        "match_ids": created_matches,
-        "unmatched_players": list(set(unmatched_players)) if unmatched_players else None
-    }
-
-    if created_season_id:
-        response["created_season_id"] = created_season_id
-
-    return response
+    # 세션이 해당 클럽 소속인지 검증
+    if session.club_id != club_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="해당 클럽의 세션이 아닙니다"
+        )
+    return session
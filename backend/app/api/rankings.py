@@ -1,6 +1,7 @@
 """
 랭킹 API
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from typing import List
 from app.schemas.ranking import RankingResponse, RankingDetailResponse
@@ -10,6 +11,7 @@ from app.models.user import User
 from app.core.dependencies import get_current_active_user, require_club_manager, get_club_or_404
 from app.models.member import ClubMember
 
+logger = logging.getLogger(__name__)
 router = APIRouter(tags=["랭킹"])
 
 
@@ -84,83 +86,156 @@ async def get_member_ranking(
 @router.post("/clubs/{club_id}/rankings/update")
 async def update_rankings(
     club_id: int,
+    dry_run: bool = False,
     membership: ClubMember = Depends(require_club_manager)
 ):
-    """동호회 랭킹 갱신 (전체 경기 결과 기반)"""
-    from app.models.match import Match, MatchResult, MatchParticipant, Team, MatchStatus
-    from collections import defaultdict
+    """
+    동호회 랭킹 전체 재계산 (정합성 점검)
+
+    랭킹은 경기 결과 등록/수정 시 증분 갱신되며, 이 엔드포인트는
+    전체 경기 결과 기반으로 다시 집계하여 증분 상태와의 차이(drift)를 점검/보정한다.
+    - dry_run=True: 보정 없이 drift만 보고
+    """
+    from tortoise.transactions import in_transaction
+    from app.services.ranking_service import rebuild_club_rankings
+
+    await get_club_or_404(club_id)
+
+    async with in_transaction():
+        report = await rebuild_club_rankings(club_id, dry_run=dry_run)
+
+    drifted = report["drifted_member_ids"]
+    if drifted:
+        logger.warning(f"랭킹 drift 감지 - club_id={club_id}, members={drifted[:20]}")
+
+    return {
+        "message": "랭킹 점검이 완료되었습니다" if dry_run else "랭킹이 갱신되었습니다",
+        "updated_members": 0 if dry_run else len(drifted),
+        "total_members": report["total_members"],
+        "drifted_members": len(drifted),
+        "drifted_member_ids": drifted,
+    }
+
+
+@router.post("/clubs/{club_id}/player-stats/rebuild")
+async def rebuild_player_stats(
+    club_id: int,
+    dry_run: bool = False,
+    membership: ClubMember = Depends(require_club_manager)
+):
+    """
+    회원/게스트 통계 전체 재계산 (백필 및 정합성 점검)
+
+    누적 전적은 경기 결과 변경 시 증분 갱신되며, 이 엔드포인트는 전체 경기 결과로
+    다시 집계하여 drift를 보정하고 요약 통계(연승, 파트너/상대 전적)를 다시 만든다.
+    - dry_run=True: 보정 없이 drift만 보고
+    """
+    from tortoise.transactions import in_transaction
+    from app.services import player_stats_service
+
+    await get_club_or_404(club_id)
+
+    async with in_transaction():
+        report = await player_stats_service.rebuild_player_stats(club_id, dry_run=dry_run)
+
+    drifted = len(report["drifted_member_ids"]) + len(report["drifted_guest_ids"])
+    if drifted:
+        logger.warning(
+            f"선수 통계 drift 감지 - club_id={club_id}, "
+            f"members={report['drifted_member_ids'][:20]}, guests={report['drifted_guest_ids'][:20]}"
+        )
+
+    return {
+        "message": "통계 점검이 완료되었습니다" if dry_run else "통계가 갱신되었습니다",
+        "total_players": report["total_players"],
+        "drifted_players": drifted,
+        "drifted_member_ids": report["drifted_member_ids"],
+        "drifted_guest_ids": report["drifted_guest_ids"],
+    }
+
+
+@router.post("/clubs/{club_id}/ratings/replay")
+async def replay_ratings(
+    club_id: int,
+    membership: ClubMember = Depends(require_club_manager)
+):
+    """
+    레이팅 전체 재계산
+
+    레이팅은 결과 등록/수정 시 증분 갱신되며, 과거 경기 결과를 고친 경우 이후 경기에는
+    반영되지 않는다. 이 엔드포인트는 클럽 전체 경기 이력을 시간 순서대로 다시 재생한다.
+    """
     from tortoise.transactions import in_transaction
-    from tortoise.queryset import Q
+    from app.services.rating_service import replay_club_ratings
 
     await get_club_or_404(club_id)
 
-    # 클럽의 모든 완료된 경기 조회 (이벤트 기반 + 시즌 기반)
-    matches = await Match.filter(
-        Q(session__event__club_id=club_id) | Q(session__season__club_id=club_id),
-        status=MatchStatus.COMPLETED,
-        is_deleted=False
-    ).prefetch_related("participants__club_member")
-
-    # 배치 쿼리로 모든 경기 결과 조회 (N+1 방지)
-    match_ids = [m.id for m in matches]
-    results_map = {}
-    if match_ids:
-        all_results = await MatchResult.filter(match_id__in=match_ids)
-        results_map = {r.match_id: r for r in all_results}
-
-    # 통계 집계
-    stats = defaultdict(lambda: {"wins": 0, "draws": 0, "losses": 0, "total": 0})
-
-    for match in matches:
-        result = results_map.get(match.id)
-        if not result:
-            continue
-
-        # prefetch된 participants 사용 (N+1 방지)
-        participants = match.participants
-
-        team_a_members = [p.club_member_id for p in participants if p.team == Team.A and p.club_member_id]
-        team_b_members = [p.club_member_id for p in participants if p.team == Team.B and p.club_member_id]
-
-        if result.winner_team == Team.A:
-            for member_id in team_a_members:
-                stats[member_id]["wins"] += 1
-                stats[member_id]["total"] += 1
-            for member_id in team_b_members:
-                stats[member_id]["losses"] += 1
-                stats[member_id]["total"] += 1
-        elif result.winner_team == Team.B:
-            for member_id in team_b_members:
-                stats[member_id]["wins"] += 1
-                stats[member_id]["total"] += 1
-            for member_id in team_a_members:
-                stats[member_id]["losses"] += 1
-                stats[member_id]["total"] += 1
-        else:
-            for member_id in team_a_members + team_b_members:
-                stats[member_id]["draws"] += 1
-                stats[member_id]["total"] += 1
-
-    # 랭킹 업데이트
     async with in_transaction():
-        for member_id, stat in stats.items():
-            ranking, created = await Ranking.get_or_create(
-                club_id=club_id,
-                club_member_id=member_id,
-                defaults={
-                    "total_matches": stat["total"],
-                    "wins": stat["wins"],
-                    "draws": stat["draws"],
-                    "losses": stat["losses"],
-                    "points": stat["wins"] * 3 + stat["draws"]
-                }
-            )
-            if not created:
-                ranking.total_matches = stat["total"]
-                ranking.wins = stat["wins"]
-                ranking.draws = stat["draws"]
-                ranking.losses = stat["losses"]
-                ranking.points = stat["wins"] * 3 + stat["draws"]
-                await ranking.save()
-
-    return {"message": "랭킹이 갱신되었습니다", "updated_members": len(stats)}
+        report = await replay_club_ratings(club_id)
+
+    return {"message": "레이팅이 재계산되었습니다", **report}
+
+
+def _player_stats_response(kind: str, player, name: str, summary: dict) -> dict:
+    return {
+        "type": kind,
+        "id": player.id,
+        "name": name,
+        "total_games": player.total_games,
+        "wins": player.wins,
+        "draws": player.draws,
+        "losses": player.losses,
+        "win_rate": player.win_rate,
+        "rating": player.rating,
+        "rating_games": player.rating_games,
+        **summary,
+    }
+
+
+@router.get("/clubs/{club_id}/player-stats/members/{member_id}")
+async def get_member_player_stats(
+    club_id: int,
+    member_id: int,
+    current_user: User = Depends(get_current_active_user)
+):
+    """회원 통계 조회 (누적 전적 + 연승/최근 전적/파트너·상대 전적)"""
+    from app.services.player_stats_service import describe_summary, MEMBER
+
+    await get_club_or_404(club_id)
+
+    member = await ClubMember.get_or_none(
+        id=member_id, club_id=club_id, is_deleted=False
+    ).prefetch_related("user", "stat_summary")
+    if not member:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="회원을 찾을 수 없습니다"
+        )
+
+    summary = await describe_summary(member.stat_summary)
+    return _player_stats_response(MEMBER, member, member.nickname or member.user.name, summary)
+
+
+@router.get("/clubs/{club_id}/player-stats/guests/{guest_id}")
+async def get_guest_player_stats(
+    club_id: int,
+    guest_id: int,
+    current_user: User = Depends(get_current_active_user)
+):
+    """게스트 통계 조회 (누적 전적 + 연승/최근 전적/파트너·상대 전적)"""
+    from app.models.guest import Guest
+    from app.services.player_stats_service import describe_summary, GUEST
+
+    await get_club_or_404(club_id)
+
+    guest = await Guest.get_or_none(
+        id=guest_id, club_id=club_id, is_deleted=False
+    ).prefetch_related("stat_summary")
+    if not guest:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게스트를 찾을 수 없습니다"
+        )
+
+    summary = await describe_summary(guest.stat_summary)
+    return _player_stats_response(GUEST, guest, guest.name, summary)
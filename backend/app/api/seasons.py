@@ -47,7 +47,7 @@ async def list_seasons(
     status_filter: Optional[str] = None,
     current_user: User = Depends(get_current_active_user)
 ):
-    """시즌 목록 조회 (N+1 쿼리 최적화)"""
+    """시즌 목록 조회 (세션/경기 수는 GROUP BY 집계)"""
     club = await get_club_or_404(club_id)
 
     # status_filter 유효성 검사
@@ -63,27 +63,9 @@ async def list_seasons(
 
     seasons = await query.order_by("-start_date")
 
-    # 모든 시즌 ID 수집
-    season_ids = [s.id for s in seasons]
-
-    # 배치 쿼리로 세션 수 조회
-    session_counts = {}
-    if season_ids:
-        sessions = await Session.filter(
-            season_id__in=season_ids, is_deleted=False
-        ).values("season_id")
-        for s in sessions:
-            session_counts[s["season_id"]] = session_counts.get(s["season_id"], 0) + 1
-
-    # 배치 쿼리로 매치 수 조회
-    match_counts = {}
-    if season_ids:
-        matches = await Match.filter(
-            session__season_id__in=season_ids, is_deleted=False
-        ).values("session__season_id")
-        for m in matches:
-            sid = m["session__season_id"]
-            match_counts[sid] = match_counts.get(sid, 0) + 1
+    # 시즌별 세션/경기 수 (GROUP BY 집계)
+    from app.services.counter_service import season_counters
+    counters = await season_counters(s.id for s in seasons)
 
     result = []
     for season in seasons:
@@ -94,8 +76,7 @@ async def list_seasons(
             "start_date": season.start_date.isoformat(),
             "end_date": season.end_date.isoformat(),
             "status": season.status.value,
-            "session_count": session_counts.get(season.id, 0),
-            "match_count": match_counts.get(season.id, 0),
+            **counters[season.id],
             "created_at": serialize_to_kst(season.created_at),
         })
 
@@ -162,31 +143,19 @@ async def get_season(
     season_id: int,
     current_user: User = Depends(get_current_active_user)
 ):
-    """시즌 상세 조회 (N+1 쿼리 최적화)"""
+    """시즌 상세 조회 (세션별 참가자/경기 수는 GROUP BY 집계)"""
     season = await get_season_or_404(season_id, club_id)
 
-    # 세션 목록 조회 - prefetch 활용
     sessions = await Session.filter(
         season=season, is_deleted=False
-    ).prefetch_related("participants").order_by("-start_datetime")
+    ).order_by("-start_datetime")
 
-    session_ids = [s.id for s in sessions]
-
-    # 배치 쿼리로 매치 수 조회
-    match_counts = {}
-    if session_ids:
-        matches = await Match.filter(
-            session_id__in=session_ids, is_deleted=False
-        ).values("session_id")
-        for m in matches:
-            sid = m["session_id"]
-            match_counts[sid] = match_counts.get(sid, 0) + 1
+    # 세션별 참가자/경기 수 (GROUP BY 집계)
+    from app.services.counter_service import session_counters
+    counters = await session_counters(s.id for s in sessions)
 
     session_list = []
-    total_match_count = 0
     for s in sessions:
-        session_match_count = match_counts.get(s.id, 0)
-        total_match_count += session_match_count
         session_list.append({
             "id": s.id,
             "title": s.title,
@@ -196,8 +165,7 @@ async def get_season(
             "location": s.location,
             "session_type": s.session_type.value if s.session_type else "league",
             "status": s.status.value,
-            "participant_count": len([p for p in s.participants if not p.is_deleted]),
-            "match_count": session_match_count,
+            **counters[s.id],
         })
 
     return {
@@ -208,7 +176,8 @@ async def get_season(
         "end_date": season.end_date.isoformat(),
         "status": season.status.value,
         "session_count": len(sessions),
-        "match_count": total_match_count,
+        "match_count": sum(c["match_count"] for c in counters.values()),
+        "completed_match_count": sum(c["completed_match_count"] for c in counters.values()),
         "sessions": session_list,
         "created_at": serialize_to_kst(season.created_at),
     }
@@ -320,87 +289,29 @@ async def calculate_season_rankings(
     season_id: int,
     membership: ClubMember = Depends(require_club_manager)
 ):
-    """시즌 랭킹 계산 (경기 결과 기반)"""
+    """
+    시즌 랭킹 계산 (경기 결과 기반)
+
+    시즌 경기를 단일 집계 쿼리로 계산한 뒤 SeasonRanking을 일괄 upsert한다.
+    """
     from tortoise.transactions import in_transaction
-    from app.models.match import MatchResult, MatchParticipant, Team
-    from collections import defaultdict
+    from app.services.ranking_service import rebuild_season_rankings
 
     season = await get_season_or_404(season_id, club_id)
 
-    # 경기 결과 집계
-    stats = defaultdict(lambda: {"wins": 0, "draws": 0, "losses": 0, "total": 0})
-    errors = []
-
-    matches = await Match.filter(
+    total_matches = await Match.filter(
         session__season=season,
         status="completed",
-        is_deleted=False
-    ).prefetch_related("participants__club_member")
-
-    for match in matches:
-        try:
-            result = await MatchResult.get_or_none(match=match)
-            if not result:
-                continue
-
-            participants = await MatchParticipant.filter(match=match).prefetch_related("club_member")
-
-            team_a_members = [p.club_member_id for p in participants if p.team == Team.A and p.club_member_id]
-            team_b_members = [p.club_member_id for p in participants if p.team == Team.B and p.club_member_id]
-
-            if result.winner_team == Team.A:
-                for member_id in team_a_members:
-                    stats[member_id]["wins"] += 1
-                    stats[member_id]["total"] += 1
-                for member_id in team_b_members:
-                    stats[member_id]["losses"] += 1
-                    stats[member_id]["total"] += 1
-            elif result.winner_team == Team.B:
-                for member_id in team_b_members:
-                    stats[member_id]["wins"] += 1
-                    stats[member_id]["total"] += 1
-                for member_id in team_a_members:
-                    stats[member_id]["losses"] += 1
-                    stats[member_id]["total"] += 1
-            else:
-                # 무승부
-                for member_id in team_a_members + team_b_members:
-                    stats[member_id]["draws"] += 1
-                    stats[member_id]["total"] += 1
-        except Exception as e:
-            logger.warning(f"Match {match.id} ranking calculation failed: {e}")
-            errors.append(f"경기 {match.id} 처리 실패")
-            continue
+        is_deleted=False,
+        result__id__isnull=False
+    ).count()
 
     # 트랜잭션 내에서 랭킹 업데이트 (원자적 처리)
     async with in_transaction():
-        for member_id, stat in stats.items():
-            ranking, created = await SeasonRanking.get_or_create(
-                season=season,
-                club_member_id=member_id,
-                defaults={
-                    "total_matches": stat["total"],
-                    "wins": stat["wins"],
-                    "draws": stat["draws"],
-                    "losses": stat["losses"],
-                    "points": stat["wins"] * 3 + stat["draws"]  # 승리 3점, 무승부 1점
-                }
-            )
-            if not created:
-                ranking.total_matches = stat["total"]
-                ranking.wins = stat["wins"]
-                ranking.draws = stat["draws"]
-                ranking.losses = stat["losses"]
-                ranking.points = stat["wins"] * 3 + stat["draws"]
-                await ranking.save()
-
-    response = {
+        stats = await rebuild_season_rankings(season.id)
+
+    return {
         "message": "랭킹이 계산되었습니다",
         "total_members": len(stats),
-        "total_matches_processed": len(matches)
+        "total_matches_processed": total_matches
     }
-
-    if errors:
-        response["warnings"] = errors[:10]  # 최대 10개만 반환
-
-    return response
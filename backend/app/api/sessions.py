@@ -98,31 +98,15 @@ class ParticipantAdd(PydanticBase):
 
 async def get_session_or_404(session_id: int, club_id: int) -> Session:
     """세션 조회 또는 404"""
-    session = await Session.get_or_none(id=session_id, is_deleted=False).prefetch_related("event", "season")
+    session = await Session.get_or_none(id=session_id, club_id=club_id, is_deleted=False)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="세션을 찾을 수 없습니다"
         )
-
-    session_club_id = await get_session_club_id(session)
-    if session_club_id != club_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="세션을 찾을 수 없습니다"
-        )
     return session
 
 
-async def get_session_club_id(session: Session) -> Optional[int]:
-    """세션의 club_id를 반환 (event 또는 season 통해)"""
-    if session.event:
-        return session.event.club_id
-    elif session.season:
-        return session.season.club_id
-    return None
-
-
 def format_participant_data(p, include_team: bool = False) -> dict:
     """참가자 정보 포맷팅 공통 함수"""
     data = {
@@ -170,26 +154,34 @@ async def list_sessions(
     season_id: Optional[int] = None,
     page: Optional[int] = None,
     page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
     current_user: User = Depends(get_current_active_user)
 ):
-    """세션 목록 조회 (page 파라미터로 페이지네이션 지원)"""
-    from tortoise.expressions import Q
+    """
+    세션 목록 조회
+
+    - page 파라미터로 오프셋 페이지네이션 지원
+    - cursor 파라미터로 커서 페이지네이션 지원 (첫 페이지는 빈 값, 이후 next_cursor 전달)
+    """
     from app.schemas.pagination import paginate_query
+    from app.services.counter_service import session_counters
 
     club = await get_club_or_404(club_id)
 
-    # 시즌 필터링 또는 전체 조회
+    # 클럽 전체 또는 시즌 필터링 (비정규화된 club_id로 조회)
+    query = Session.filter(club_id=club_id, is_deleted=False)
     if season_id:
-        query = Session.filter(
-            season_id=season_id, is_deleted=False
-        ).prefetch_related("season", "participants__club_member__user").order_by("-start_datetime")
-    else:
-        query = Session.filter(
-            Q(event__club_id=club_id) | Q(season__club_id=club_id),
-            is_deleted=False
-        ).prefetch_related("event", "season", "participants__club_member__user").order_by("-start_datetime")
+        query = query.filter(season_id=season_id)
+    query = query.prefetch_related("season").order_by("-start_datetime")
+
+    sessions, pagination = await paginate_query(
+        query, page, page_size,
+        cursor=cursor, cursor_fields=("-start_datetime", "-id"), include_total=include_total
+    )
 
-    sessions, pagination = await paginate_query(query, page, page_size)
+    # 참가자/경기 수는 GROUP BY 집계 (참가자 행을 불러오지 않음)
+    counters = await session_counters(s.id for s in sessions)
 
     items = [{
         "id": s.id,
@@ -210,7 +202,7 @@ async def list_sessions(
         "status": s.status.value,
         "season_id": s.season_id,
         "season_name": s.season.name if s.season else None,
-        "participant_count": len(s.participants),
+        **counters[s.id],
     } for s in sessions]
 
     if pagination:
@@ -251,6 +243,7 @@ async def create_session(
     start_datetime_utc, end_datetime_utc = session_data.to_utc_datetimes()
 
     session = await Session.create(
+        club_id=club_id,
         event=event,
         season=season,
         title=session_data.title,
@@ -286,79 +279,144 @@ async def create_session(
     }
 
 
+# 상세 조회용 참가자 프로젝션 (SessionParticipant / MatchParticipant 공통 필드)
+PARTICIPANT_ROW_FIELDS = (
+    "id", "participant_category", "club_member_id", "guest_id", "user_id",
+    "club_member__user_id", "club_member__user__name",
+    "guest__name", "user__name", "user__gender",
+    "member_gender", "guest_gender",
+)
+
+
+def _participant_row_annotations() -> dict:
+    """
+    LEFT JOIN으로 NULL이 될 수 있는 enum 컬럼은 문자열 그대로 조회
+    (values()의 enum 변환은 NULL을 허용하지 않음)
+    """
+    from tortoise.functions import Coalesce
+    return {
+        "member_gender": Coalesce("club_member__gender", ""),
+        "guest_gender": Coalesce("guest__gender", ""),
+    }
+
+
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
+
+
+def format_participant_row(row: dict, name_suffix: bool = False) -> dict:
+    """
+    .values() 프로젝션 행을 format_participant_data와 같은 형식으로 변환
+
+    name_suffix: 세션 참가자처럼 게스트/준회원 이름에 구분 표시를 붙일지 여부
+    """
+    data = {
+        "id": row["id"],
+        "category": _enum_value(row["participant_category"]),
+    }
+
+    if row["club_member_id"]:
+        data["name"] = row["club_member__user__name"]
+        data["gender"] = row["member_gender"]
+        data["member_id"] = row["club_member_id"]
+        if row["club_member__user_id"]:
+            data["user_id"] = row["club_member__user_id"]
+    elif row["guest_id"]:
+        data["name"] = f"{row['guest__name']} (게스트)" if name_suffix else row["guest__name"]
+        data["gender"] = row["guest_gender"]
+        data["guest_id"] = row["guest_id"]
+    elif row["user_id"]:
+        data["name"] = f"{row['user__name']} (준회원)" if name_suffix else row["user__name"]
+        data["gender"] = row["user__gender"] or "male"
+        data["user_id"] = row["user_id"]
+    else:
+        data["name"] = "Unknown"
+        data["gender"] = "male"
+
+    return data
+
+
 @router.get("/{session_id}")
 async def get_session(
     club_id: int,
     session_id: int,
     current_user: User = Depends(get_current_active_user)
 ):
-    """세션 상세 조회 (참가자 포함)"""
-    # 기본 세션 검증
-    await get_session_or_404(session_id, club_id)
+    """
+    세션 상세 조회 (참가자 포함)
 
-    # 전체 데이터 prefetch
-    session = await Session.get(id=session_id).prefetch_related(
-        "event",
-        "season",
-        "participants__club_member__user",
-        "participants__guest",
-        "participants__user",
-        "matches__participants__club_member__user",
-        "matches__participants__guest",
-        "matches__participants__user",
-        "matches__result"
+    모델 hydration 없이 .values() 프로젝션으로 고정된 4개 쿼리만 사용:
+    세션(+시즌), 세션 참가자, 경기(+결과), 경기 참가자
+    """
+    session = await Session.filter(id=session_id, club_id=club_id, is_deleted=False).first().values(
+        "id", "title", "start_datetime", "end_datetime", "location", "num_courts",
+        "match_duration_minutes", "break_duration_minutes", "warmup_duration_minutes",
+        "session_type", "status", "season_id", "season__name",
     )
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="세션을 찾을 수 없습니다"
+        )
 
-    # 공통 함수 사용하여 참가자 포맷팅
-    participants = [format_participant_data(p) for p in session.participants]
-
-    # 배치 쿼리로 모든 경기 결과 조회 (N+1 방지)
-    match_ids = [m.id for m in session.matches]
-    results_map = {}
-    if match_ids:
-        results = await MatchResult.filter(match_id__in=match_ids)
-        results_map = {r.match_id: r for r in results}
-
-    matches = []
-    for m in session.matches:
-        team_a = [p for p in m.participants if p.team == Team.A]
-        team_b = [p for p in m.participants if p.team == Team.B]
+    participant_rows = await SessionParticipant.filter(
+        session_id=session_id
+    ).annotate(**_participant_row_annotations()).order_by("arrived_at", "id").values(*PARTICIPANT_ROW_FIELDS)
+    participants = [format_participant_row(row, name_suffix=True) for row in participant_rows]
 
-        # prefetch된 결과 사용 (N+1 쿼리 제거)
-        result = results_map.get(m.id)
+    match_rows = await Match.filter(session_id=session_id).order_by("match_number", "id").values(
+        "id", "court_number", "match_type", "status",
+        "result__id", "result__team_a_score", "result__team_b_score",
+    )
 
-        matches.append({
-            "id": m.id,
-            "court_number": m.court_number,
-            "match_type": m.match_type.value,
-            "status": m.status.value,
-            "team_a": [format_participant_data(p) for p in team_a],
-            "team_b": [format_participant_data(p) for p in team_b],
-            "score": {
-                "team_a": result.team_a_score if result else None,
-                "team_b": result.team_b_score if result else None,
-            } if result else None
-        })
+    teams = {row["id"]: {Team.A.value: [], Team.B.value: []} for row in match_rows}
+    if match_rows:
+        match_participant_rows = await MatchParticipant.filter(
+            match__session_id=session_id
+        ).annotate(**_participant_row_annotations()).order_by(
+            "match_id", "team", "position"
+        ).values("match_id", "team", *PARTICIPANT_ROW_FIELDS)
+        for row in match_participant_rows:
+            team = _enum_value(row["team"])
+            if row["match_id"] in teams and team in teams[row["match_id"]]:
+                teams[row["match_id"]][team].append(format_participant_row(row))
+
+    matches = [{
+        "id": m["id"],
+        "court_number": m["court_number"],
+        "match_type": _enum_value(m["match_type"]),
+        "status": _enum_value(m["status"]),
+        "team_a": teams[m["id"]][Team.A.value],
+        "team_b": teams[m["id"]][Team.B.value],
+        "score": {
+            "team_a": m["result__team_a_score"],
+            "team_b": m["result__team_b_score"],
+        } if m["result__id"] else None
+    } for m in match_rows]
+
+    start_kst = to_kst(session["start_datetime"])
+    end_kst = to_kst(session["end_datetime"])
+    session_type = _enum_value(session["session_type"])
 
     return {
-        "id": session.id,
-        "title": session.title,
+        "id": session["id"],
+        "title": session["title"],
         # 하위 호환: date, start_time, end_time (KST 기준)
-        "date": session.date.isoformat(),
-        "start_time": session.start_time.isoformat(),
-        "end_time": session.end_time.isoformat(),
+        "date": start_kst.date().isoformat(),
+        "start_time": start_kst.time().isoformat(),
+        "end_time": end_kst.time().isoformat(),
         # 정확한 datetime (KST 변환)
-        "start_datetime": to_kst(session.start_datetime).isoformat(),
-        "end_datetime": to_kst(session.end_datetime).isoformat(),
-        "location": session.location,
-        "num_courts": session.num_courts,
-        "match_duration_minutes": session.match_duration_minutes,
-        "break_duration_minutes": session.break_duration_minutes,
-        "warmup_duration_minutes": session.warmup_duration_minutes,
-        "session_type": session.session_type.value if session.session_type else "league",
-        "status": session.status.value,
-        "season_id": session.season_id,
-        "season_name": session.season.name if session.season else None,
+        "start_datetime": start_kst.isoformat(),
+        "end_datetime": end_kst.isoformat(),
+        "location": session["location"],
+        "num_courts": session["num_courts"],
+        "match_duration_minutes": session["match_duration_minutes"],
+        "break_duration_minutes": session["break_duration_minutes"],
+        "warmup_duration_minutes": session["warmup_duration_minutes"],
+        "session_type": session_type or "league",
+        "status": _enum_value(session["status"]),
+        "season_id": session["season_id"],
+        "season_name": session["season__name"],
         "participants": participants,
         "matches": matches,
     }
@@ -614,7 +672,8 @@ async def get_my_participation(
     }
 
 
-@router.post("/{session_id}/participants/{member_id}")
+# member_id:int 경로 변환으로 /participants/bulk 경로를 가리지 않도록 함
+@router.post("/{session_id}/participants/{member_id:int}")
 async def add_member_participant(
     club_id: int,
     session_id: int,
@@ -662,6 +721,7 @@ async def create_match(
     match_count = await Match.filter(session=session).count()
 
     match = await Match.create(
+        club_id=club_id,
         session=session,
         match_number=match_count + 1,
         court_number=match_data.court_number,
@@ -754,7 +814,8 @@ async def create_match(
     return {"id": match.id, "message": "경기가 생성되었습니다"}
 
 
-@router.put("/{session_id}/matches/{match_id}")
+# match_id:int 경로 변환으로 /matches/bulk-scores 경로를 가리지 않도록 함
+@router.put("/{session_id}/matches/{match_id:int}")
 async def update_match(
     club_id: int,
     session_id: int,
@@ -763,7 +824,10 @@ async def update_match(
     membership: ClubMember = Depends(require_club_manager)
 ):
     """경기 결과 업데이트 (자동 저장)"""
-    await get_session_or_404(session_id, club_id)
+    from tortoise.transactions import in_transaction
+    from app.services.ranking_service import result_outcome, apply_outcome_changes, lock_match_outcome
+
+    session = await get_session_or_404(session_id, club_id)
 
     # 점수 검증
     if match_data.team_a_score is not None and match_data.team_a_score < 0:
@@ -784,45 +848,53 @@ async def update_match(
             detail="경기를 찾을 수 없습니다"
         )
 
-    # 결과 업데이트 또는 생성
-    result = await MatchResult.get_or_none(match=match)
+    async with in_transaction():
+        # 결과 업데이트 또는 생성 (경기 행을 잠근 뒤 변경 전 결과 조회)
+        match, result = await lock_match_outcome(match.id)
+        outcome_before = result_outcome(match, result)
 
-    if result:
-        if match_data.team_a_score is not None:
-            result.team_a_score = match_data.team_a_score
-        if match_data.team_b_score is not None:
-            result.team_b_score = match_data.team_b_score
+        if result:
+            if match_data.team_a_score is not None:
+                result.team_a_score = match_data.team_a_score
+            if match_data.team_b_score is not None:
+                result.team_b_score = match_data.team_b_score
+
+            # 승자 결정
+            if result.team_a_score > result.team_b_score:
+                result.winner_team = Team.A
+            elif result.team_b_score > result.team_a_score:
+                result.winner_team = Team.B
+            else:
+                result.winner_team = None
 
-        # 승자 결정
-        if result.team_a_score > result.team_b_score:
-            result.winner_team = Team.A
-        elif result.team_b_score > result.team_a_score:
-            result.winner_team = Team.B
+            await result.save()
         else:
-            result.winner_team = None
-
-        await result.save()
-    else:
-        if match_data.team_a_score is not None and match_data.team_b_score is not None:
-            winner = None
-            if match_data.team_a_score > match_data.team_b_score:
-                winner = Team.A
-            elif match_data.team_b_score > match_data.team_a_score:
-                winner = Team.B
+            if match_data.team_a_score is not None and match_data.team_b_score is not None:
+                winner = None
+                if match_data.team_a_score > match_data.team_b_score:
+                    winner = Team.A
+                elif match_data.team_b_score > match_data.team_a_score:
+                    winner = Team.B
+
+                # 현재 사용자 조회
+                user = await membership.user
+                result = await MatchResult.create(
+                    match=match,
+                    team_a_score=match_data.team_a_score,
+                    team_b_score=match_data.team_b_score,
+                    sets_detail={},
+                    winner_team=winner,
+                    recorded_by=user
+                )
 
-            # 현재 사용자 조회
-            user = await membership.user
-            result = await MatchResult.create(
-                match=match,
-                team_a_score=match_data.team_a_score,
-                team_b_score=match_data.team_b_score,
-                sets_detail={},
-                winner_team=winner,
-                recorded_by=user
-            )
+        match.status = MatchStatus.COMPLETED
+        await match.save()
 
-    match.status = MatchStatus.COMPLETED
-    await match.save()
+        # 랭킹 증분 반영
+        await apply_outcome_changes(
+            club_id, session.season_id,
+            [(match.id, outcome_before, result_outcome(match, result))]
+        )
 
     return {"message": "경기 결과가 저장되었습니다"}
 
@@ -908,7 +980,11 @@ async def update_session(
     membership: ClubMember = Depends(require_club_manager)
 ):
     """세션 수정"""
+    from tortoise.transactions import in_transaction
+    from app.services.ranking_service import move_session_season_outcomes
+
     session = await get_session_or_404(session_id, club_id)
+    old_season_id = session.season_id
 
     if session_data.title is not None:
         session.title = session_data.title
@@ -935,7 +1011,10 @@ async def update_session(
         session.season = season
     # season_id가 명시적으로 전달되지 않았으면 기존 값 유지 (None이 아닌 경우에만 처리)
 
-    await session.save()
+    async with in_transaction():
+        await session.save()
+        # 완료된 경기의 시즌 랭킹 반영분을 새 시즌으로 이동
+        await move_session_season_outcomes(session.id, old_season_id, session.season_id)
 
     return {
         "id": session.id,
@@ -959,6 +1038,7 @@ async def generate_matches(
     """경기 자동 생성"""
     from tortoise.transactions import in_transaction
     from app.services.matching_service import generate_matches_for_session_inline
+    from app.services.ranking_service import revert_session_outcomes
 
     # 기본 세션 검증
     await get_session_or_404(session_id, club_id)
@@ -976,6 +1056,8 @@ async def generate_matches(
         )
 
     async with in_transaction():
+        # 삭제될 기존 경기의 랭킹 반영분 되돌리기
+        await revert_session_outcomes(club_id, session.id, session.season_id)
         matches_created = await generate_matches_for_session_inline(session)
 
     return {"message": f"{len(matches_created)}개의 경기가 생성되었습니다", "match_ids": matches_created}
@@ -984,6 +1066,7 @@ async def generate_matches(
 class AIMatchGenerateRequest(PydanticBase):
     """AI 경기 생성 요청"""
     mode: str = Field("balanced", pattern="^(balanced|random)$")  # balanced: 실력 균형, random: 완전 랜덤
+    engine: str = Field("local", pattern="^(local|gemini)$")  # local: 로컬 스케줄러, gemini: Gemini AI
     match_duration_minutes: Optional[int] = Field(None, ge=10, le=120)
     break_duration_minutes: Optional[int] = Field(None, ge=0, le=30)
 
@@ -1004,9 +1087,12 @@ async def generate_ai_matches(
     AI 기반 경기 자동 생성 (미리보기)
 
     - mode: "balanced" (실력 균형) 또는 "random" (완전 랜덤)
+    - engine: "local" (로컬 휴리스틱 스케줄러, 기본값) 또는 "gemini" (Gemini AI)
     - 생성된 매치를 미리보기로 반환하며, 확정하려면 confirm-ai 엔드포인트를 호출해야 합니다
     """
     from app.services.ai_matching_service import ai_matching_service
+    from app.services.local_matching_service import local_matching_service
+    from app.services.gemini_client import GeminiTimeoutError, GeminiUnavailableError
     from app.models.ranking import Ranking
 
     # 세션 검증 및 데이터 로드
@@ -1022,6 +1108,13 @@ async def generate_ai_matches(
             detail="최소 4명의 참가자가 필요합니다 (복식 경기 1개)"
         )
 
+    # 회원 랭킹 일괄 조회
+    rankings = await Ranking.filter(
+        club_id=club_id,
+        club_member_id__in=[p.club_member_id for p in session.participants if p.club_member_id]
+    )
+    ranking_map = {r.club_member_id: r for r in rankings}
+
     # 참가자 정보 수집 (랭킹 포함)
     participants_data = []
     for p in session.participants:
@@ -1033,9 +1126,9 @@ async def generate_ai_matches(
             "ranking": {"points": 0, "wins": 0, "losses": 0, "win_rate": 0}
         }
 
-        # 회원인 경우 랭킹 정보 조회
+        # 회원인 경우 랭킹 정보 반영
         if p.club_member:
-            ranking = await Ranking.get_or_none(club_id=club_id, club_member_id=p.club_member_id)
+            ranking = ranking_map.get(p.club_member_id)
             if ranking:
                 participant_info["ranking"] = {
                     "points": ranking.points,
@@ -1044,6 +1137,11 @@ async def generate_ai_matches(
                     "win_rate": ranking.win_rate
                 }
 
+        # 레이팅 (회원/게스트 행에 저장되어 있어 추가 쿼리 없음, 준회원은 없음)
+        rated = p.club_member or p.guest
+        if rated:
+            participant_info["ranking"]["rating"] = rated.rating
+
         # match_type이 없으면 성별에 따라 기본값 설정
         if not participant_info["match_type"]:
             gender = participant_info["gender"]
@@ -1065,8 +1163,10 @@ async def generate_ai_matches(
         "num_courts": session.num_courts
     }
 
+    matching_service = ai_matching_service if request.engine == "gemini" else local_matching_service
+
     try:
-        result = await ai_matching_service.generate_matches(
+        result = await matching_service.generate_matches(
             participants=participants_data,
             session_config=session_config,
             mode=request.mode
@@ -1075,10 +1175,21 @@ async def generate_ai_matches(
         return {
             "preview": True,
             "mode": request.mode,
+            "engine": request.engine,
             "session_config": session_config,
             "matches": result["matches"],
             "summary": result["summary"]
         }
+    except GeminiTimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e)
+        )
+    except GeminiUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -1105,10 +1216,10 @@ async def confirm_ai_matches(
     - generate-ai에서 받은 matches를 확정하여 실제 경기로 생성합니다
     - 기존 경기는 모두 삭제됩니다
     """
-    session = await get_session_or_404(session_id, club_id)
+    from tortoise.transactions import in_transaction
+    from app.services.ranking_service import revert_session_outcomes
 
-    # 기존 경기 삭제
-    await Match.filter(session_id=session_id).delete()
+    session = await get_session_or_404(session_id, club_id)
 
     # 참가자 매핑 (ID -> 실제 참가자)
     participants = await SessionParticipant.filter(session_id=session_id).prefetch_related(
@@ -1117,66 +1228,72 @@ async def confirm_ai_matches(
     participant_map = {p.id: p for p in participants}
 
     matches_created = []
-    for match_data in request.matches:
-        # 매치 타입 변환
-        match_type_map = {
-            "mens_doubles": MatchType.MENS_DOUBLES,
-            "womens_doubles": MatchType.WOMENS_DOUBLES,
-            "mixed_doubles": MatchType.MIXED_DOUBLES
-        }
-        match_type = match_type_map.get(match_data.get("match_type"), MatchType.MENS_DOUBLES)
-
-        # 예약 시간 파싱 (KST 시간 문자열 → UTC datetime)
-        scheduled_time_str = match_data.get("scheduled_time", session.start_time.strftime("%H:%M"))
-        try:
-            hour, minute = map(int, scheduled_time_str.split(":"))
-            # 세션 날짜 + 예약 시간 → KST datetime → UTC datetime
-            scheduled_kst = datetime.combine(session.date, time(hour, minute), tzinfo=KST)
-            scheduled_datetime_utc = to_utc(scheduled_kst)
-        except:
-            scheduled_datetime_utc = session.start_datetime
-
-        # 경기 생성
-        match = await Match.create(
-            session_id=session_id,
-            match_number=match_data.get("match_number", len(matches_created) + 1),
-            court_number=match_data.get("court_number", 1),
-            scheduled_datetime=scheduled_datetime_utc,  # UTC datetime
-            match_type=match_type,
-            status=MatchStatus.SCHEDULED
-        )
-
-        # 팀 A 참가자 추가
-        team_a_ids = match_data.get("team_a", {}).get("player_ids", [])
-        for idx, player_id in enumerate(team_a_ids, 1):
-            participant = participant_map.get(player_id)
-            if participant:
-                await MatchParticipant.create(
-                    match=match,
-                    club_member=participant.club_member,
-                    guest=participant.guest,
-                    user=participant.user,
-                    participant_category=participant.participant_category,
-                    team=Team.A,
-                    position=idx
-                )
-
-        # 팀 B 참가자 추가
-        team_b_ids = match_data.get("team_b", {}).get("player_ids", [])
-        for idx, player_id in enumerate(team_b_ids, 1):
-            participant = participant_map.get(player_id)
-            if participant:
-                await MatchParticipant.create(
-                    match=match,
-                    club_member=participant.club_member,
-                    guest=participant.guest,
-                    user=participant.user,
-                    participant_category=participant.participant_category,
-                    team=Team.B,
-                    position=idx
-                )
+    async with in_transaction():
+        # 기존 경기 삭제 (랭킹 반영분 먼저 되돌림)
+        await revert_session_outcomes(club_id, session_id, session.season_id)
+        await Match.filter(session_id=session_id).delete()
+
+        for match_data in request.matches:
+            # 매치 타입 변환
+            match_type_map = {
+                "mens_doubles": MatchType.MENS_DOUBLES,
+                "womens_doubles": MatchType.WOMENS_DOUBLES,
+                "mixed_doubles": MatchType.MIXED_DOUBLES
+            }
+            match_type = match_type_map.get(match_data.get("match_type"), MatchType.MENS_DOUBLES)
+
+            # 예약 시간 파싱 (KST 시간 문자열 → UTC datetime)
+            scheduled_time_str = match_data.get("scheduled_time", session.start_time.strftime("%H:%M"))
+            try:
+                hour, minute = map(int, scheduled_time_str.split(":"))
+                # 세션 날짜 + 예약 시간 → KST datetime → UTC datetime
+                scheduled_kst = datetime.combine(session.date, time(hour, minute), tzinfo=KST)
+                scheduled_datetime_utc = to_utc(scheduled_kst)
+            except:
+                scheduled_datetime_utc = session.start_datetime
+
+            # 경기 생성
+            match = await Match.create(
+                club_id=club_id,
+                session_id=session_id,
+                match_number=match_data.get("match_number", len(matches_created) + 1),
+                court_number=match_data.get("court_number", 1),
+                scheduled_datetime=scheduled_datetime_utc,  # UTC datetime
+                match_type=match_type,
+                status=MatchStatus.SCHEDULED
+            )
 
-        matches_created.append(match.id)
+            # 팀 A 참가자 추가
+            team_a_ids = match_data.get("team_a", {}).get("player_ids", [])
+            for idx, player_id in enumerate(team_a_ids, 1):
+                participant = participant_map.get(player_id)
+                if participant:
+                    await MatchParticipant.create(
+                        match=match,
+                        club_member=participant.club_member,
+                        guest=participant.guest,
+                        user=participant.user,
+                        participant_category=participant.participant_category,
+                        team=Team.A,
+                        position=idx
+                    )
+
+            # 팀 B 참가자 추가
+            team_b_ids = match_data.get("team_b", {}).get("player_ids", [])
+            for idx, player_id in enumerate(team_b_ids, 1):
+                participant = participant_map.get(player_id)
+                if participant:
+                    await MatchParticipant.create(
+                        match=match,
+                        club_member=participant.club_member,
+                        guest=participant.guest,
+                        user=participant.user,
+                        participant_category=participant.participant_category,
+                        team=Team.B,
+                        position=idx
+                    )
+
+            matches_created.append(match.id)
 
     return {
         "message": f"{len(matches_created)}개의 경기가 생성되었습니다",
@@ -1185,8 +1302,11 @@ async def confirm_ai_matches(
 
 
 class BulkParticipantsAdd(PydanticBase):
-    """참가자 일괄 추가 요청"""
-    member_ids: List[int]
+    """참가자 일괄 추가 요청 (회원/게스트/준회원 혼합 가능)"""
+    member_ids: List[int] = []
+    guest_ids: List[int] = []
+    user_ids: List[int] = []  # 준회원 (동호회 미가입 사용자)
+    participation_type: Optional[str] = None  # mens_doubles, mixed_doubles, singles
 
 
 class BulkScoreItem(PydanticBase):
@@ -1208,30 +1328,99 @@ async def add_participants_bulk(
     data: BulkParticipantsAdd,
     membership: ClubMember = Depends(require_club_manager)
 ):
-    """참가자 일괄 추가"""
-    session = await get_session_or_404(session_id, club_id)
+    """
+    참가자 일괄 추가 (회원/게스트/준회원)
 
-    added = 0
-    skipped = 0
-    for member_id in data.member_ids:
-        member = await ClubMember.get_or_none(id=member_id, club_id=club_id, is_deleted=False)
-        if not member:
-            skipped += 1
-            continue
+    - 유효성 검사는 카테고리별 __in 조회 + 기존 참가자 조회 1회로 처리
+    - 추가 대상은 bulk_create 1회로 저장
+    - results에 ID별 처리 결과 반환
+      (added, not_found, already_joined, duplicate, is_member)
+    """
+    from tortoise.expressions import Q
 
-        existing = await SessionParticipant.get_or_none(session=session, club_member=member)
-        if existing:
-            skipped += 1
-            continue
+    session = await get_session_or_404(session_id, club_id)
+    participation_type = ParticipationType(data.participation_type) if data.participation_type else None
+
+    # 카테고리별 유효 ID 조회
+    valid_members = set()
+    if data.member_ids:
+        valid_members = set(await ClubMember.filter(
+            id__in=data.member_ids, club_id=club_id, is_deleted=False
+        ).values_list("id", flat=True))
+
+    valid_guests = set()
+    if data.guest_ids:
+        valid_guests = set(await Guest.filter(
+            id__in=data.guest_ids, club_id=club_id, is_deleted=False
+        ).values_list("id", flat=True))
+
+    valid_users = set()
+    member_users = set()
+    if data.user_ids:
+        valid_users = set(await User.filter(
+            id__in=data.user_ids, is_deleted=False
+        ).values_list("id", flat=True))
+        # 동호회 회원은 준회원으로 추가 불가
+        member_users = set(await ClubMember.filter(
+            club_id=club_id, user_id__in=list(valid_users), is_deleted=False
+        ).values_list("user_id", flat=True)) if valid_users else set()
+
+    # 기존 참가자 조회 (1회)
+    joined = {"member": set(), "guest": set(), "associate": set()}
+    conditions = []
+    if valid_members:
+        conditions.append(Q(club_member_id__in=list(valid_members)))
+    if valid_guests:
+        conditions.append(Q(guest_id__in=list(valid_guests)))
+    if valid_users - member_users:
+        conditions.append(Q(user_id__in=list(valid_users - member_users)))
+    if conditions:
+        rows = await SessionParticipant.filter(
+            Q(*conditions, join_type="OR"), session_id=session.id
+        ).values("club_member_id", "guest_id", "user_id")
+        for row in rows:
+            if row["club_member_id"]:
+                joined["member"].add(row["club_member_id"])
+            elif row["guest_id"]:
+                joined["guest"].add(row["guest_id"])
+            elif row["user_id"]:
+                joined["associate"].add(row["user_id"])
+
+    categories = (
+        ("member", data.member_ids, valid_members, ParticipantCategory.MEMBER, "club_member_id"),
+        ("guest", data.guest_ids, valid_guests, ParticipantCategory.GUEST, "guest_id"),
+        ("associate", data.user_ids, valid_users, ParticipantCategory.ASSOCIATE, "user_id"),
+    )
 
-        await SessionParticipant.create(
-            session=session,
-            club_member=member,
-            participant_category=ParticipantCategory.MEMBER
-        )
-        added += 1
+    results = []
+    new_participants = []
+    seen = set()
+    for category, ids, valid, participant_category, fk_field in categories:
+        for item_id in ids:
+            if (category, item_id) in seen:
+                outcome = "duplicate"
+            elif item_id not in valid:
+                outcome = "not_found"
+            elif category == "associate" and item_id in member_users:
+                outcome = "is_member"
+            elif item_id in joined[category]:
+                outcome = "already_joined"
+            else:
+                outcome = "added"
+                new_participants.append(SessionParticipant(
+                    session_id=session.id,
+                    participant_category=participant_category,
+                    participation_type=participation_type,
+                    **{fk_field: item_id}
+                ))
+            seen.add((category, item_id))  # 같은 요청 안의 중복 ID
+            results.append({"category": category, "id": item_id, "status": outcome})
+
+    if new_participants:
+        await SessionParticipant.bulk_create(new_participants)
 
-    return {"added": added, "skipped": skipped}
+    added = len(new_participants)
+    return {"added": added, "skipped": len(results) - added, "results": results}
 
 
 @router.put("/{session_id}/matches/bulk-scores")
@@ -1241,48 +1430,76 @@ async def update_matches_bulk_scores(
     data: BulkScoresUpdate,
     membership: ClubMember = Depends(require_club_manager)
 ):
-    """점수 일괄 입력"""
-    await get_session_or_404(session_id, club_id)
-    user = await membership.user
-
-    updated = 0
-    for item in data.scores:
-        if item.team_a_score < 0 or item.team_b_score < 0:
-            continue
-
-        match = await Match.get_or_none(id=item.match_id, session_id=session_id)
-        if not match:
-            continue
-
-        # 승자 결정
-        winner = None
-        if item.team_a_score > item.team_b_score:
-            winner = Team.A
-        elif item.team_b_score > item.team_a_score:
-            winner = Team.B
-
-        # 결과 생성 또는 업데이트
-        result = await MatchResult.get_or_none(match=match)
-        if result:
-            result.team_a_score = item.team_a_score
-            result.team_b_score = item.team_b_score
-            result.winner_team = winner
-            await result.save()
-        else:
-            await MatchResult.create(
-                match=match,
+    """
+    점수 일괄 입력
+
+    - 경기/기존 결과를 __in 조회로 한 번에 불러온 뒤
+      MatchResult bulk upsert + Match 상태 일괄 갱신 (경기 수와 무관한 고정 쿼리 수)
+    - 전체를 하나의 트랜잭션으로 처리 (일부 실패 시 전체 롤백)
+    - 음수 점수나 세션에 없는 경기는 건너뜀 (같은 경기가 여러 번 오면 마지막 값 사용)
+    """
+    from tortoise.transactions import in_transaction
+    from app.core.timezone import utc_now
+    from app.services.ranking_service import result_outcome, apply_outcome_changes
+
+    session = await get_session_or_404(session_id, club_id)
+
+    scores = {
+        item.match_id: item for item in data.scores
+        if item.team_a_score >= 0 and item.team_b_score >= 0
+    }
+
+    async with in_transaction():
+        # 경기 행을 잠근 뒤 변경 전 결과 조회 (동시 입력 시 증감분 중복 반영 방지)
+        matches = await Match.filter(
+            id__in=list(scores), session_id=session_id
+        ).select_for_update() if scores else []
+        match_ids = [m.id for m in matches]
+        results = {
+            r.match_id: r for r in await MatchResult.filter(match_id__in=match_ids)
+        } if match_ids else {}
+
+        now = utc_now()
+        new_results = []
+        outcome_changes = []
+        for match in matches:
+            item = scores[match.id]
+            existing = results.get(match.id)
+            outcome_before = result_outcome(match, existing)
+
+            # 승자 결정
+            winner = None
+            if item.team_a_score > item.team_b_score:
+                winner = Team.A
+            elif item.team_b_score > item.team_a_score:
+                winner = Team.B
+
+            result = MatchResult(
+                match_id=match.id,
                 team_a_score=item.team_a_score,
                 team_b_score=item.team_b_score,
-                sets_detail={},
+                sets_detail=existing.sets_detail if existing else {},
                 winner_team=winner,
-                recorded_by=user
+                recorded_by_id=existing.recorded_by_id if existing else membership.user_id,
             )
+            new_results.append(result)
 
-        match.status = MatchStatus.COMPLETED
-        await match.save()
-        updated += 1
+            match.status = MatchStatus.COMPLETED
+            outcome_changes.append((match.id, outcome_before, result_outcome(match, result)))
+
+        if new_results:
+            # 기존 결과는 점수/승자만 갱신 (기록자/기록 시각 유지)
+            await MatchResult.bulk_create(
+                new_results,
+                on_conflict=["match_id"],
+                update_fields=["team_a_score", "team_b_score", "winner_team", "modified_at"],
+            )
+            await Match.filter(id__in=match_ids).update(status=MatchStatus.COMPLETED, modified_at=now)
+
+        # 랭킹 증분 반영 (배치)
+        await apply_outcome_changes(club_id, session.season_id, outcome_changes)
 
-    return {"updated": updated}
+    return {"updated": len(new_results), "skipped": len(data.scores) - len(new_results)}
 
 
 class ScheduleCalculateRequest(PydanticBase):
@@ -54,8 +54,41 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
 
+    # 권한 캐시 (멤버십/클럽 존재 여부, 프로세스 단위)
+    PERMISSION_CACHE_TTL_SECONDS: int = 30
+    PERMISSION_CACHE_MAX_SIZE: int = 10000
+
+    # 인증 캐시 (사용자 스냅샷 / 디코딩된 토큰, 프로세스 단위)
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+
+    # 동호회 목록/검색 캐시 (검색어+페이지별 목록과 회원수, 프로세스 단위)
+    CLUB_LIST_CACHE_TTL_SECONDS: int = 10
+    CLUB_LIST_CACHE_MAX_SIZE: int = 1000
+
+    # 요청 단위 DB 프로파일링 / Prometheus 메트릭 (/metrics)
+    METRICS_ENABLED: bool = True
+    METRICS_SLOW_QUERY_COUNT: int = 100  # 요청당 쿼리 수가 이 값 이상이면 경고 로그 (0이면 비활성화)
+    METRICS_TOKEN: str = ""              # /metrics 접근 토큰 (Authorization: Bearer <토큰>, 비어 있으면 /metrics 비활성화)
+
     # Google Gemini API
     GEMINI_API_KEY: str = ""
+    GEMINI_MAX_CONCURRENCY: int = 4      # 프로세스당 동시 호출 수
+    GEMINI_TIMEOUT_SECONDS: int = 60     # 호출당 타임아웃 (대기 시간 포함)
+
+    # OCR 결과 캐시 (이미지 SHA-256 기반 디스크 캐시, 0이면 비활성화)
+    OCR_CACHE_DIR: str = ""              # 비어 있으면 시스템 임시 디렉터리 사용
+    OCR_CACHE_MAX_BYTES: int = 50 * 1024 * 1024
+    # OCR 이미지 전처리 (긴 변 최대 픽셀 - 0이면 비활성화)
+    OCR_IMAGE_MAX_DIMENSION: int = 2048
+    OCR_IMAGE_JPEG_QUALITY: int = 85
+    # OCR 비동기 작업 큐 (프로세스 단위)
+    OCR_JOB_WORKERS: int = 2             # 동시에 처리하는 페이지 수
+    OCR_JOB_MAX_RETRIES: int = 2         # 페이지당 재시도 횟수
+    OCR_JOB_TTL_SECONDS: int = 3600      # 작업 결과 보관 시간
+    OCR_JOB_MAX_PENDING: int = 50        # 전체 미완료 작업 수 (초과 시 503)
+    OCR_JOB_MAX_PENDING_PER_USER: int = 3  # 사용자별 미완료 작업 수 (초과 시 429)
 
     # AWS Cognito 설정
     COGNITO_USER_POOL_ID: str = ""
@@ -0,0 +1,87 @@
+"""
+인메모리 캐시 유틸리티
+
+- TTLCache: 프로세스 단위 LRU + TTL 캐시
+  (여러 워커 프로세스 간에는 공유되지 않으므로 TTL을 짧게 유지하여 불일치 시간을 제한)
+- 요청 단위 캐시: ContextVar 기반, RequestCacheMiddleware가 요청마다 새 dict를 설정
+"""
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Optional
+
+# 캐시 미스 표식 (None도 캐시 값으로 저장할 수 있도록)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU + TTL 캐시
+
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - ttl(초)이 지난 항목은 조회 시점에 제거
+    """
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expires_at, value = item
+        if expires_at <= self._timer():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """조건에 맞는 키 일괄 제거"""
+        for key in [k for k in self._data if predicate(k)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_request_cache: ContextVar[Optional[dict]] = ContextVar("request_cache", default=None)
+
+
+def get_request_cache() -> Optional[dict]:
+    """현재 요청의 캐시 dict (미들웨어 밖에서는 None)"""
+    return _request_cache.get()
+
+
+class RequestCacheMiddleware:
+    """요청마다 빈 요청 단위 캐시를 설정하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_cache.reset(token)
@@ -9,12 +9,67 @@
 - 졸업자(ALUMNI): 게스트와 동일한 권한
 
 Note: GUEST, FRIEND, ALUMNI는 동일한 제한된 권한 (exclude_guest로 제외됨)
+
+권한 캐시:
+- (user_id, club_id) → 멤버십, club_id → 클럽 존재 여부를 짧은 TTL로 프로세스 캐시
+- 클럽 행은 요청 단위로 캐시하여 ClubPermission과 get_club_or_404가 공유
+- 멤버십 승인/역할 변경/탈퇴/삭제 시 invalidate_membership_cache로 명시적 무효화
+
+사용자 캐시:
+- user_id → User 스냅샷 (역할, 구독 등급 포함)을 짧은 TTL로 프로세스 캐시
+- 프로필 수정/삭제 시 invalidate_user_cache로 명시적 무효화
 """
+import copy
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status, Request
+from app.config import settings
+from app.core.cache import MISSING, TTLCache, get_request_cache
 from app.models.user import User
 from app.models.member import ClubMember, MemberRole, MemberStatus
 from app.core.security import verify_access_token
 
+# user_id → User 스냅샷 (삭제되지 않은 사용자만 저장)
+_user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+# (user_id, club_id) → ClubMember 또는 None (비회원)
+_membership_cache = TTLCache(
+    maxsize=settings.PERMISSION_CACHE_MAX_SIZE,
+    ttl=settings.PERMISSION_CACHE_TTL_SECONDS
+)
+# club_id → 클럽 존재 여부
+_club_exists_cache = TTLCache(
+    maxsize=settings.PERMISSION_CACHE_MAX_SIZE,
+    ttl=settings.PERMISSION_CACHE_TTL_SECONDS
+)
+
+
+async def _get_user(user_id: int) -> Optional[User]:
+    """
+    사용자 조회 (프로세스 캐시 → DB)
+
+    캐시된 인스턴스를 요청 간에 공유하지 않도록 복사본을 반환한다.
+    """
+    user = _user_cache.get(user_id)
+    if user is MISSING:
+        user = await User.get_or_none(id=user_id, is_deleted=False)
+        if user is None:
+            return None
+        _user_cache.set(user_id, user)
+    return copy.copy(user)
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """사용자 정보 변경/삭제 시 사용자 캐시 무효화"""
+    _user_cache.pop(user_id)
+
+
+def clear_user_cache() -> None:
+    """사용자 캐시 전체 초기화"""
+    _user_cache.clear()
+
 
 async def get_current_user(request: Request) -> User:
     """
@@ -36,7 +91,7 @@ async def get_current_user(request: Request) -> User:
         raise credentials_exception
 
     # 사용자 조회
-    user = await User.get_or_none(id=user_id, is_deleted=False)
+    user = await _get_user(user_id)
     if user is None:
         raise credentials_exception
 
@@ -67,8 +122,7 @@ async def get_optional_user(request: Request) -> User | None:
     if user_id is None:
         return None
 
-    user = await User.get_or_none(id=user_id, is_deleted=False)
-    return user
+    return await _get_user(user_id)
 
 
 async def require_super_admin(
@@ -113,23 +167,12 @@ class ClubPermission:
         current_user: User = Depends(get_current_active_user)
     ) -> ClubMember:
         """클럽 멤버십 및 권한 확인"""
-        from app.models.club import Club
-
         # 슈퍼 관리자는 모든 권한
         if current_user.is_super_admin:
             # 클럽 존재 확인
-            club = await Club.get_or_none(id=club_id, is_deleted=False)
-            if not club:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="동호회를 찾을 수 없습니다"
-                )
+            club = await get_club_or_404(club_id)
             # 실제 멤버십 조회 (슈퍼 관리자용)
-            membership = await ClubMember.get_or_none(
-                club_id=club_id,
-                user_id=current_user.id,
-                is_deleted=False
-            )
+            membership = await _get_membership(current_user.id, club_id)
             if membership:
                 return membership
             # 슈퍼 관리자지만 멤버가 아닌 경우 - 임시 가상 멤버십 반환
@@ -145,18 +188,13 @@ class ClubPermission:
             return virtual_membership
 
         # 클럽 존재 확인
-        club = await Club.get_or_none(id=club_id, is_deleted=False)
-        if not club:
+        if not await _club_exists(club_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="동호회를 찾을 수 없습니다"
             )
 
-        membership = await ClubMember.get_or_none(
-            club_id=club_id,
-            user_id=current_user.id,
-            is_deleted=False
-        )
+        membership = await _get_membership(current_user.id, club_id)
 
         if membership is None:
             raise HTTPException(
@@ -196,10 +234,71 @@ require_club_manager = ClubPermission(require_manager=True)
 require_club_member_not_guest = ClubPermission(exclude_guest=True)  # 회원 목록 등 게스트 제외
 
 
-async def get_club_or_404(club_id: int):
-    """클럽 조회 또는 404"""
+async def _fetch_club(club_id: int):
+    """클럽 조회 후 요청 단위 캐시에 저장"""
     from app.models.club import Club
     club = await Club.get_or_none(id=club_id, is_deleted=False)
+    request_cache = get_request_cache()
+    if request_cache is not None:
+        request_cache[("club", club_id)] = club
+    return club
+
+
+async def _club_exists(club_id: int) -> bool:
+    """클럽 존재 여부 (요청 캐시 → 프로세스 캐시 → DB)"""
+    request_cache = get_request_cache()
+    if request_cache is not None and ("club", club_id) in request_cache:
+        return request_cache[("club", club_id)] is not None
+
+    exists = _club_exists_cache.get(club_id)
+    if exists is MISSING:
+        exists = await _fetch_club(club_id) is not None
+        _club_exists_cache.set(club_id, exists)
+    return exists
+
+
+async def _get_membership(user_id: int, club_id: int) -> Optional[ClubMember]:
+    """
+    멤버십 조회 (프로세스 캐시 → DB)
+
+    캐시된 인스턴스를 요청 간에 공유하지 않도록 복사본을 반환한다.
+    """
+    key = (user_id, club_id)
+    membership = _membership_cache.get(key)
+    if membership is MISSING:
+        membership = await ClubMember.get_or_none(
+            club_id=club_id,
+            user_id=user_id,
+            is_deleted=False
+        )
+        _membership_cache.set(key, membership)
+    return copy.copy(membership) if membership else None
+
+
+def invalidate_membership_cache(user_id: int, club_id: int) -> None:
+    """멤버십 변경 시 권한 캐시 무효화 (가입/승인/역할 변경/탈퇴/삭제)"""
+    _membership_cache.pop((user_id, club_id))
+
+
+def invalidate_club_cache(club_id: int) -> None:
+    """클럽 삭제 시 클럽 존재 여부와 해당 클럽의 멤버십 캐시 무효화"""
+    _club_exists_cache.pop(club_id)
+    _membership_cache.pop_where(lambda key: key[1] == club_id)
+
+
+def clear_permission_cache() -> None:
+    """권한 캐시 전체 초기화"""
+    _membership_cache.clear()
+    _club_exists_cache.clear()
+
+
+async def get_club_or_404(club_id: int):
+    """클럽 조회 또는 404 (같은 요청 안에서는 캐시된 클럽 재사용)"""
+    request_cache = get_request_cache()
+    if request_cache is not None and ("club", club_id) in request_cache:
+        club = request_cache[("club", club_id)]
+    else:
+        club = await _fetch_club(club_id)
     if not club:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,229 @@
+"""
+요청 단위 DB 프로파일링 및 Prometheus 메트릭
+
+- install_query_hooks: Tortoise DB 클라이언트의 execute_* 메서드를 감싸서
+  현재 요청의 쿼리 수, DB 시간, 가장 느린 쿼리를 기록한다 (ContextVar 기반)
+- QueryMetricsMiddleware: 요청마다 집계를 시작하고 끝나면 라우트별 히스토그램에 반영
+  - DEBUG 모드에서는 응답 헤더(X-DB-Query-Count 등)로도 노출
+  - 쿼리 수가 METRICS_SLOW_QUERY_COUNT 이상이면 가장 느린 쿼리와 함께 경고 로그
+- render_metrics: /metrics 엔드포인트용 Prometheus 텍스트 포맷
+
+라우트 라벨은 경로 템플릿(/api/clubs/{club_id}/...)을 사용하여 카디널리티를 제한한다.
+"""
+import logging
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청당 보관하는 느린 쿼리 수
+SLOWEST_KEPT = 3
+
+# 헤더/로그에 남기는 SQL 최대 길이
+SQL_PREVIEW_LENGTH = 200
+
+QUERY_METHODS = ("execute_insert", "execute_many", "execute_query", "execute_query_dict", "execute_script")
+
+
+@dataclass
+class RequestStats:
+    """요청 하나의 DB 사용량"""
+    queries: int = 0
+    db_seconds: float = 0.0
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record(self, sql: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        if len(self.slowest) < SLOWEST_KEPT or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, sql))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_KEPT:]
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def get_request_stats() -> Optional[RequestStats]:
+    """현재 요청의 DB 사용량 (미들웨어 밖에서는 None)"""
+    return _request_stats.get()
+
+
+def _timed(method):
+    @wraps(method)
+    async def wrapper(self, query, *args, **kwargs):
+        stats = _request_stats.get()
+        if stats is None:
+            return await method(self, query, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return await method(self, query, *args, **kwargs)
+        finally:
+            stats.record(query, time.perf_counter() - started)
+    wrapper._query_metrics = True
+    return wrapper
+
+
+def _client_classes() -> list:
+    """설치된 백엔드의 DB 클라이언트 클래스 (드라이버가 없는 백엔드는 건너뜀)"""
+    classes = []
+    try:
+        from tortoise.backends.sqlite.client import SqliteClient, TransactionWrapper
+        classes += [SqliteClient, TransactionWrapper]
+    except ImportError:
+        pass
+    try:
+        from tortoise.backends.asyncpg.client import AsyncpgDBClient, TransactionWrapper
+        classes += [AsyncpgDBClient, TransactionWrapper]
+    except ImportError:
+        pass
+    return classes
+
+
+def install_query_hooks() -> None:
+    """DB 클라이언트 execute_* 메서드에 계측 래퍼 설치 (여러 번 호출해도 한 번만 적용)"""
+    for cls in _client_classes():
+        for name in QUERY_METHODS:
+            method = vars(cls).get(name)
+            if method is not None and not getattr(method, "_query_metrics", False):
+                setattr(cls, name, _timed(method))
+
+
+class Histogram:
+    """라벨별 누적 버킷 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → [버킷별 개수(+Inf 포함), 합계]
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, labels: Sequence[str], value: float) -> None:
+        series = self._series.setdefault(tuple(labels), [[0] * (len(self.buckets) + 1), 0.0])
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            base = ",".join(f'{key}="{_escape(value)}"' for key, value in zip(self.label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_number(bound)
+                lines.append(f'{self.name}_bucket{{{base},le="{le}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{base}}} {_format_number(total)}")
+            lines.append(f"{self.name}_count{{{base}}} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+LABELS = ("method", "route", "status")
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", LABELS,
+    (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 DB 쿼리 수", LABELS,
+    (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds", "요청당 DB 소요 시간 합계", LABELS,
+    (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+HISTOGRAMS = (REQUEST_DURATION, REQUEST_QUERIES, REQUEST_DB_TIME)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 포맷 (text/plain; version=0.0.4)"""
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines += histogram.render()
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """누적 메트릭 초기화 (테스트용)"""
+    for histogram in HISTOGRAMS:
+        histogram.clear()
+
+
+def _route_label(scope) -> str:
+    # include_router(prefix=...)로 등록된 라우트는 scope["route"].path에 prefix가 빠져 있으므로
+    # FastAPI가 기록하는 유효 라우트(prefix 포함)를 우선 사용
+    effective = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(effective, "path_format", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
+
+
+class QueryMetricsMiddleware:
+    """요청 단위 DB 사용량 집계 ASGI 미들웨어"""
+
+    def __init__(self, app, debug_headers: bool = False, slow_query_count: int = 0, exclude_paths=("/metrics",)):
+        self.app = app
+        self.debug_headers = debug_headers
+        self.slow_query_count = slow_query_count
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.debug_headers:
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"x-db-query-count", str(stats.queries).encode()),
+                        (b"x-db-time-ms", f"{stats.db_seconds * 1000:.2f}".encode()),
+                    ]
+                    if stats.slowest:
+                        headers.append((b"x-db-slowest-ms", f"{stats.slowest[0][0] * 1000:.2f}".encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _request_stats.reset(token)
+            self._observe(scope, status_code, time.perf_counter() - started, stats)
+
+    def _observe(self, scope, status_code: int, seconds: float, stats: RequestStats) -> None:
+        labels = (scope["method"], _route_label(scope), str(status_code))
+        REQUEST_DURATION.observe(labels, seconds)
+        REQUEST_QUERIES.observe(labels, stats.queries)
+        REQUEST_DB_TIME.observe(labels, stats.db_seconds)
+
+        if self.slow_query_count and stats.queries >= self.slow_query_count:
+            slowest = "; ".join(
+                f"{duration * 1000:.1f}ms {sql[:SQL_PREVIEW_LENGTH]}" for duration, sql in stats.slowest
+            )
+            logger.warning(
+                f"[DB] 쿼리 과다 요청 - {labels[0]} {labels[1]} status={status_code}, "
+                f"queries={stats.queries}, db={stats.db_seconds * 1000:.1f}ms, slowest: {slowest}"
+            )
@@ -1,13 +1,23 @@
 """
 보안 유틸리티 (JWT, 쿠키)
 """
+import hashlib
+import time
 from datetime import timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.config import settings
+from app.core.cache import MISSING, TTLCache
 from app.core.timezone import utc_now
 
+# 검증된 액세스 토큰 캐시: sha256(token) → (user_id, exp)
+# 유효한 토큰만 저장하며, 적중 시에도 exp를 다시 확인한다
+_access_token_cache = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
 # 비밀번호 해싱 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -68,7 +78,16 @@ def decode_token(token: str) -> Optional[dict]:
 
 
 def verify_access_token(token: str) -> Optional[int]:
-    """액세스 토큰 검증 및 user_id 반환"""
+    """액세스 토큰 검증 및 user_id 반환 (검증 결과는 토큰 해시로 잠시 캐시)"""
+    key = hashlib.sha256(token.encode()).hexdigest()
+    cached = _access_token_cache.get(key)
+    if cached is not MISSING:
+        user_id, exp = cached
+        if exp is None or exp > time.time():
+            return user_id
+        _access_token_cache.pop(key)
+        return None
+
     payload = decode_token(token)
     if payload is None:
         return None
@@ -76,10 +95,17 @@ def verify_access_token(token: str) -> Optional[int]:
         return None
     try:
         user_id = int(payload.get("sub"))
-        return user_id
     except (ValueError, TypeError):
         return None
 
+    _access_token_cache.set(key, (user_id, payload.get("exp")))
+    return user_id
+
+
+def clear_token_cache() -> None:
+    """토큰 검증 캐시 초기화"""
+    _access_token_cache.clear()
+
 
 def verify_refresh_token(token: str) -> Optional[int]:
     """리프레시 토큰 검증 및 user_id 반환"""
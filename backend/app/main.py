@@ -7,10 +7,13 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logging.getLogger("app").setLevel(logging.INFO)
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from tortoise.contrib.fastapi import register_tortoise
 from app.config import settings, TORTOISE_ORM
+from app.core.cache import RequestCacheMiddleware
+from app.core.metrics import QueryMetricsMiddleware, install_query_hooks, render_metrics
 from app.api import auth, clubs, members, events, sessions, matches, rankings, users, announcements, fees, guests, seasons, ocr
 
 # FastAPI 앱 생성
@@ -30,6 +33,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 단위 캐시 (권한 확인 시 조회한 클럽 행 재사용 등)
+app.add_middleware(RequestCacheMiddleware)
+
+# 요청 단위 DB 프로파일링 (쿼리 수/DB 시간, DEBUG 모드에서는 응답 헤더로도 노출)
+if settings.METRICS_ENABLED:
+    install_query_hooks()
+    app.add_middleware(
+        QueryMetricsMiddleware,
+        debug_headers=settings.DEBUG,
+        slow_query_count=settings.METRICS_SLOW_QUERY_COUNT,
+    )
+
 # 라우터 등록
 app.include_router(auth.router, prefix="/api")
 app.include_router(clubs.router, prefix="/api")
@@ -54,6 +69,13 @@ register_tortoise(
 )
 
 
+@app.on_event("shutdown")
+async def stop_background_workers():
+    """OCR 작업 워커 종료"""
+    from app.services.ocr_jobs import ocr_job_queue
+    await ocr_job_queue.shutdown()
+
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -70,6 +92,16 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str = Header(default="")):
+    """Prometheus 메트릭 (요청 시간/쿼리 수/DB 시간 히스토그램, METRICS_TOKEN 설정 시에만 제공)"""
+    if not settings.METRICS_ENABLED or not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if authorization != f"Bearer {settings.METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -6,7 +6,7 @@ from app.models.club import Club
 from app.models.member import ClubMember
 from app.models.event import Event, SessionConfig, Session, SessionParticipant
 from app.models.match import Match, MatchParticipant, MatchResult
-from app.models.ranking import Ranking
+from app.models.ranking import Ranking, PlayerStatSummary
 from app.models.schedule import ClubSchedule
 from app.models.season import Season, SeasonRanking
 from app.models.guest import Guest
@@ -25,6 +25,7 @@ __all__ = [
     "MatchParticipant",
     "MatchResult",
     "Ranking",
+    "PlayerStatSummary",
     "ClubSchedule",
     "Season",
     "SeasonRanking",
@@ -1,7 +1,10 @@
 """
 일정 및 세션 모델
 """
+from typing import Optional
+
 from tortoise import fields
+from tortoise.indexes import Index
 from app.models.base import BaseModel
 from enum import Enum
 
@@ -97,9 +100,19 @@ class Session(BaseModel):
     시간 저장 방식:
     - start_datetime, end_datetime: UTC로 저장 (타임존 명확)
     - date, start_time, end_time 프로퍼티: KST 기준으로 반환 (하위 호환)
+
+    클럽:
+    - club: 이벤트/시즌의 클럽을 비정규화한 값 (클럽 단위 조회를 club_id 인덱스 하나로 처리)
+    - 생성 시 club_id를 넘기지 않으면 save()에서 이벤트 → 시즌 순으로 채움
     """
 
     id = fields.IntField(pk=True)
+    club = fields.ForeignKeyField(
+        "models.Club",
+        related_name=False,
+        on_delete=fields.CASCADE,
+        null=True  # 이벤트/시즌 없는 단독 세션
+    )
     event = fields.ForeignKeyField(
         "models.Event",
         related_name="sessions",
@@ -159,6 +172,20 @@ class Session(BaseModel):
         table = "sessions"
         ordering = ["-start_datetime"]
 
+    async def save(self, *args, **kwargs) -> None:
+        if self.club_id is None:
+            self.club_id = await self._resolve_club_id()
+        await super().save(*args, **kwargs)
+
+    async def _resolve_club_id(self) -> Optional[int]:
+        """이벤트 → 시즌 순으로 세션의 클럽 결정"""
+        if self.event_id:
+            return await Event.filter(id=self.event_id).first().values_list("club_id", flat=True)
+        if self.season_id:
+            from app.models.season import Season
+            return await Season.filter(id=self.season_id).first().values_list("club_id", flat=True)
+        return None
+
     def __str__(self) -> str:
         return f"Session #{self.id} - {self.date} {self.start_time}"
 
@@ -209,6 +236,10 @@ class SessionParticipant(BaseModel):
     class Meta:
         table = "session_participants"
         ordering = ["arrived_at"]
+        # 마이그레이션 10과 같은 이름/컬럼
+        indexes = (
+            Index(fields=("session_id",), name="idx_session_participants_session"),
+        )
 
     def __str__(self) -> str:
         name = self.get_participant_name()
@@ -2,6 +2,7 @@
 회비 관련 모델
 """
 from tortoise import fields
+from tortoise.indexes import Index
 from app.models.base import BaseModel
 from enum import Enum
 
@@ -82,6 +83,10 @@ class FeePayment(BaseModel):
         table = "fee_payments"
         ordering = ["-target_year", "-target_month"]
         unique_together = (("fee_setting", "club_member", "target_year", "target_month"),)
+        # 마이그레이션 10과 같은 이름/컬럼
+        indexes = (
+            Index(fields=("fee_setting_id", "target_year", "target_month"), name="idx_fee_payments_setting_period"),
+        )
 
     def __str__(self) -> str:
         return f"{self.club_member} - {self.target_year}/{self.target_month}"
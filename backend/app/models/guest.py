@@ -4,6 +4,7 @@
 - 나중에 서비스 가입 시 ClubMember와 연결 가능
 """
 from tortoise import fields
+from tortoise.indexes import PartialIndex
 from app.models.base import BaseModel
 from app.models.member import Gender
 
@@ -51,9 +52,17 @@ class Guest(BaseModel):
     losses = fields.IntField(default=0)
     draws = fields.IntField(default=0)
 
+    # 레이팅 (복식 팀 평균 Elo, rating_service에서 갱신)
+    rating = fields.FloatField(default=1500.0)
+    rating_games = fields.IntField(default=0)
+
     class Meta:
         table = "guests"
         ordering = ["name"]
+        # 마이그레이션 10과 같은 이름/컬럼
+        indexes = (
+            PartialIndex(fields=("club_id",), name="idx_guests_club", condition={"is_deleted": False}),
+        )
 
     def __str__(self) -> str:
         return f"{self.name} (게스트)"
@@ -2,6 +2,7 @@
 경기 모델
 """
 from tortoise import fields
+from tortoise.indexes import Index, PartialIndex
 from app.models.base import BaseModel
 from enum import Enum
 
@@ -35,9 +36,20 @@ class Match(BaseModel):
     - scheduled_datetime: 예정 시작 시간 (UTC)
     - actual_start_time, actual_end_time: 실제 시작/종료 시간 (UTC)
     - scheduled_time 프로퍼티: KST 기준 시간만 반환 (하위 호환)
+
+    클럽:
+    - club: 세션의 club_id를 비정규화한 값 (랭킹/레이팅 집계를 세션 조인 없이 club_id로 조회)
+    - 생성 시 club_id를 넘기지 않으면 save()에서 세션으로부터 채움
+      (bulk_create는 save()를 거치지 않으므로 호출자가 직접 지정)
     """
 
     id = fields.IntField(pk=True)
+    club = fields.ForeignKeyField(
+        "models.Club",
+        related_name=False,
+        on_delete=fields.CASCADE,
+        null=True
+    )
     session = fields.ForeignKeyField(
         "models.Session",
         related_name="matches",
@@ -59,6 +71,17 @@ class Match(BaseModel):
     class Meta:
         table = "matches"
         ordering = ["match_number"]
+        # 마이그레이션 10, 11과 같은 이름/컬럼
+        indexes = (
+            Index(fields=("session_id", "status"), name="idx_matches_session_status"),
+            PartialIndex(fields=("club_id", "status"), name="idx_matches_club_status", condition={"is_deleted": False}),
+        )
+
+    async def save(self, *args, **kwargs) -> None:
+        if self.club_id is None and self.session_id:
+            from app.models.event import Session
+            self.club_id = await Session.filter(id=self.session_id).first().values_list("club_id", flat=True)
+        await super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"Match #{self.match_number} - Court {self.court_number}"
@@ -116,10 +139,17 @@ class MatchParticipant(BaseModel):
     )
     team = fields.CharEnumField(Team)
     position = fields.IntField()  # 1 or 2
+    # 이 경기 결과로 반영된 레이팅 변화량 (결과 수정/삭제 시 되돌리기 위해 보관)
+    rating_change = fields.FloatField(null=True)
 
     class Meta:
         table = "match_participants"
         ordering = ["team", "position"]
+        # 마이그레이션 10과 같은 이름/컬럼
+        # (club_member_id/guest_id의 IS NOT NULL 부분 인덱스는 Tortoise로 표현할 수 없어 마이그레이션에만 있음)
+        indexes = (
+            Index(fields=("match_id", "team", "position"), name="idx_match_participants_match"),
+        )
 
     def __str__(self) -> str:
         name = self.get_participant_name()
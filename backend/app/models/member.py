@@ -2,6 +2,7 @@
 동호회 회원 모델
 """
 from tortoise import fields
+from tortoise.indexes import PartialIndex
 from app.models.base import BaseModel
 from enum import Enum
 
@@ -55,6 +56,10 @@ class ClubMember(BaseModel):
     losses = fields.IntField(default=0)
     draws = fields.IntField(default=0)
 
+    # 레이팅 (복식 팀 평균 Elo, rating_service에서 갱신)
+    rating = fields.FloatField(default=1500.0)
+    rating_games = fields.IntField(default=0)
+
     # 관계
     session_participations: fields.ReverseRelation["SessionParticipant"]
     match_participations: fields.ReverseRelation["MatchParticipant"]
@@ -63,6 +68,11 @@ class ClubMember(BaseModel):
     class Meta:
         table = "club_members"
         unique_together = [("club", "user")]
+        # 마이그레이션 10과 같은 이름/컬럼
+        indexes = (
+            PartialIndex(fields=("club_id", "status"), name="idx_club_members_club_status",
+                         condition={"is_deleted": False}),
+        )
         ordering = ["-created_at"]
 
     def __str__(self) -> str:
@@ -40,3 +40,44 @@ class Ranking(BaseModel):
         if self.total_matches == 0:
             return 0.0
         return (self.wins / self.total_matches) * 100
+
+
+class PlayerStatSummary(BaseModel):
+    """
+    선수별 파생 통계 요약 (회원/게스트당 1행)
+
+    - 연승/연패, 최근 전적, 파트너/상대별 전적을 한 행에 저장
+    - 경기 결과 변경 시 해당 경기 참가자만 다시 계산된다
+    - partners/opponents: {"member:12": [승, 무, 패], "guest:3": [...]}
+    """
+
+    id = fields.IntField(pk=True)
+    club = fields.ForeignKeyField(
+        "models.Club",
+        related_name="player_stat_summaries",
+        on_delete=fields.CASCADE
+    )
+    # 회원/게스트 중 하나만 설정됨
+    club_member = fields.OneToOneField(
+        "models.ClubMember",
+        related_name="stat_summary",
+        on_delete=fields.CASCADE,
+        null=True
+    )
+    guest = fields.OneToOneField(
+        "models.Guest",
+        related_name="stat_summary",
+        on_delete=fields.CASCADE,
+        null=True
+    )
+    current_streak = fields.IntField(default=0)  # 양수: 연승, 음수: 연패, 0: 직전 경기 무승부
+    longest_win_streak = fields.IntField(default=0)
+    longest_loss_streak = fields.IntField(default=0)
+    recent_form = fields.CharField(max_length=10, default="")  # 최근 경기부터 W/D/L
+    partners = fields.JSONField(default=dict)
+    opponents = fields.JSONField(default=dict)
+    last_played_at = fields.DatetimeField(null=True)
+    last_updated = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "player_stat_summaries"
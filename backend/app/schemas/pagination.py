@@ -1,8 +1,18 @@
 """
 공통 페이지네이션 스키마
+
+- 오프셋 모드 (page): OFFSET/LIMIT + 전체 개수
+- 커서 모드 (cursor): 정렬 컬럼 기반 keyset 페이지네이션
+  깊은 페이지에서도 일정한 속도, 전체 개수는 요청 시에만 계산
 """
-from typing import Generic, List, TypeVar
+import base64
+import json
+from datetime import date, datetime
+from typing import Generic, List, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
 from pydantic import BaseModel
+from tortoise.expressions import Q
 
 T = TypeVar("T")
 
@@ -16,18 +26,140 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_next: bool
 
 
-async def paginate_query(queryset, page: int | None, page_size: int | None, default_page_size: int = 20):
+def encode_cursor(values: Sequence) -> str:
+    """정렬 컬럼 값 목록을 불투명한 커서 문자열로 인코딩"""
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({"dt": value.isoformat()})
+        elif isinstance(value, date):
+            encoded.append({"d": value.isoformat()})
+        elif hasattr(value, "value"):  # Enum
+            encoded.append(value.value)
+        else:
+            encoded.append(value)
+    raw = json.dumps(encoded, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, length: int) -> list:
+    """커서 문자열을 정렬 컬럼 값 목록으로 디코딩 (잘못된 커서는 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        encoded = json.loads(raw)
+        if not isinstance(encoded, list) or len(encoded) != length:
+            raise ValueError("cursor length mismatch")
+        values = []
+        for value in encoded:
+            if isinstance(value, dict) and "dt" in value:
+                values.append(datetime.fromisoformat(value["dt"]))
+            elif isinstance(value, dict) and "d" in value:
+                values.append(date.fromisoformat(value["d"]))
+            else:
+                values.append(value)
+        return values
+    except (ValueError, TypeError, KeyError, json.JSONDecodeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다"
+        )
+
+
+def _keyset_filter(cursor_fields: Sequence[str], values: Sequence) -> Q:
+    """
+    (f1, f2, ...) > (v1, v2, ...) 조건을 정렬 방향에 맞게 Q로 구성
+
+    예: ("-start_datetime", "-id") →
+        start_datetime < v1 OR (start_datetime = v1 AND id < v2)
+    """
+    conditions = []
+    for i, field in enumerate(cursor_fields):
+        name = field.lstrip("-")
+        lookup = "lt" if field.startswith("-") else "gt"
+        equals = {f.lstrip("-"): v for f, v in zip(cursor_fields[:i], values[:i])}
+        conditions.append(Q(**equals, **{f"{name}__{lookup}": values[i]}))
+    return Q(*conditions, join_type="OR")
+
+
+async def paginate_cursor(
+    queryset,
+    cursor: str,
+    page_size: int | None,
+    cursor_fields: Sequence[str],
+    default_page_size: int = 20,
+    include_total: bool = False,
+):
+    """
+    keyset(커서) 페이지네이션
+
+    Args:
+        cursor: 이전 응답의 next_cursor (빈 문자열이면 첫 페이지)
+        cursor_fields: 정렬 컬럼 (고유해야 하므로 마지막은 보통 "id" / "-id")
+        include_total: True이면 전체 개수도 계산 (추가 COUNT 쿼리)
+
+    Returns:
+        (items, pagination_meta) 튜플
+        - pagination_meta: dict (page_size, next_cursor, has_next, total)
+          total은 include_total=False이면 None
+    """
+    if page_size is None:
+        page_size = default_page_size
+    if page_size < 1:
+        page_size = 1
+
+    total = await queryset.count() if include_total else None
+
+    ordered = queryset.order_by(*cursor_fields)
+    if cursor:
+        ordered = ordered.filter(_keyset_filter(cursor_fields, decode_cursor(cursor, len(cursor_fields))))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    items = list(await ordered.limit(page_size + 1))
+    has_next = len(items) > page_size
+    items = items[:page_size]
+
+    next_cursor = None
+    if has_next:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, f.lstrip("-")) for f in cursor_fields])
+
+    return items, {
+        "total": total,
+        "page_size": page_size,
+        "has_next": has_next,
+        "next_cursor": next_cursor,
+    }
+
+
+async def paginate_query(
+    queryset,
+    page: int | None,
+    page_size: int | None,
+    default_page_size: int = 20,
+    cursor: Optional[str] = None,
+    cursor_fields: Optional[Sequence[str]] = None,
+    include_total: bool = False,
+):
     """
     Tortoise QuerySet에 페이지네이션을 적용한다.
 
-    page가 None이면 모든 항목을 반환 (하위 호환성).
+    page와 cursor가 모두 None이면 모든 항목을 반환 (하위 호환성).
+    cursor가 지정되면 cursor_fields 기준 keyset 페이지네이션 (paginate_cursor).
     page가 지정되면 페이지네이션된 결과와 메타데이터를 반환.
 
     Returns:
         (items, pagination_meta) 튜플
         - items: 조회된 객체 리스트
         - pagination_meta: None (페이지네이션 미적용) 또는 dict (page, page_size, total, has_next)
+          커서 모드에서는 (page_size, total, has_next, next_cursor)
     """
+    if cursor is not None and cursor_fields:
+        return await paginate_cursor(
+            queryset, cursor, page_size, cursor_fields,
+            default_page_size=default_page_size,
+            include_total=include_total,
+        )
+
     if page is None:
         items = await queryset
         return items, None
@@ -9,6 +9,8 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import time, datetime, timedelta
 
+from app.services.gemini_client import GeminiError, generate_content
+
 logger = logging.getLogger(__name__)
 
 # Lazy import to avoid import errors when API key is not set
@@ -70,7 +72,9 @@ class AIMatchingService:
         try:
             # google-genai SDK 사용 (최신 API 문서 기반)
             # https://ai.google.dev/gemini-api/docs
-            response = client.models.generate_content(
+            # 비동기 호출 (동시 호출 수 제한 + 타임아웃)
+            response = await generate_content(
+                client,
                 model='gemini-2.5-flash',  # 최신 모델, 비용 효율적
                 contents=prompt  # 단순 텍스트는 직접 전달 가능
             )
@@ -86,6 +90,9 @@ class AIMatchingService:
             result = json.loads(result_text)
             return self._validate_and_normalize(result, session_config)
 
+        except GeminiError:
+            # 시간 초과/일시 오류는 API에서 504/503으로 응답하도록 그대로 전달
+            raise
         except json.JSONDecodeError as e:
             logger.error(f"JSON 파싱 실패: {e}, 원본: {result_text}")
             raise ValueError(f"결과 파싱 실패: {str(e)}")
@@ -107,7 +114,7 @@ class AIMatchingService:
         if mode == "balanced":
             mode_instruction = """
 매칭 규칙 (실력 균형 모드):
-- 각 팀의 총 포인트가 비슷하도록 매칭합니다
+- 각 팀의 실력(레이팅이 있으면 레이팅 평균, 없으면 총 포인트)이 비슷하도록 매칭합니다
 - 승률이 높은 선수와 낮은 선수를 같은 팀에 배치하여 균형을 맞춥니다
 - 경기별로 두 팀의 실력 차이를 최소화합니다
 """
@@ -130,8 +137,10 @@ class AIMatchingService:
                 wins = ranking.get("wins", 0)
                 losses = ranking.get("losses", 0)
                 win_rate = ranking.get("win_rate", 0)
+                rating = ranking.get("rating")
+                rating_text = f", 레이팅: {rating:.0f}" if rating is not None else ""
                 lines.append(f"  - ID: {p['id']}, 이름: {p['name']}, 성별: {p['gender']}, "
-                           f"포인트: {points}, 승: {wins}, 패: {losses}, 승률: {win_rate:.1f}%")
+                           f"포인트: {points}, 승: {wins}, 패: {losses}, 승률: {win_rate:.1f}%{rating_text}")
             return "\n".join(lines)
 
         participants_info = "\n\n".join([
@@ -0,0 +1,96 @@
+"""
+동호회 목록/검색 캐시
+
+검색창 입력마다 호출되는 목록 API의 공통 부분(이름 검색 + 활성 회원수 집계 + 페이지네이션)을
+검색어/페이지 조건별로 짧은 TTL 동안 프로세스 캐시한다.
+
+- 캐시 값은 사용자와 무관한 클럽 정보와 회원수뿐이며, 내 가입 상태는 호출자가 요청마다 덧붙인다
+- 클럽 생성/수정/삭제, 가입/탈퇴/승인/회원 삭제 시 invalidate_club_listing으로 전체 무효화
+  (회원수와 정렬 순서가 여러 페이지에 걸쳐 바뀌므로 키 단위가 아니라 전체를 비운다)
+- 조회 도중 무효화가 일어나면 그 결과는 캐시하지 않는다 (세대 번호 비교)
+- 여러 워커 프로세스 간에는 공유되지 않으므로 불일치 시간은 TTL로 제한
+"""
+from typing import List, Optional, Tuple
+
+from tortoise.functions import Count
+from tortoise.queryset import Q
+
+from app.config import settings
+from app.core.cache import MISSING, TTLCache
+from app.models.club import Club
+from app.models.member import MemberStatus
+from app.schemas.pagination import paginate_query
+
+LISTING_FIELDS = (
+    "id", "name", "description", "created_at", "location", "is_join_allowed", "requires_approval",
+)
+
+# (검색어, skip, limit, page, page_size, cursor, include_total) → (클럽 dict 목록, 페이지네이션 메타)
+_listing_cache = TTLCache(
+    maxsize=settings.CLUB_LIST_CACHE_MAX_SIZE,
+    ttl=settings.CLUB_LIST_CACHE_TTL_SECONDS
+)
+_generation = 0
+
+
+def invalidate_club_listing() -> None:
+    """목록 캐시 전체 무효화 (클럽 정보 또는 회원수 변경 시)"""
+    global _generation
+    _generation += 1
+    _listing_cache.clear()
+
+
+async def list_club_page(
+    search: Optional[str],
+    skip: int,
+    limit: int,
+    page: Optional[int],
+    page_size: Optional[int],
+    cursor: Optional[str],
+    include_total: bool,
+) -> Tuple[List[dict], Optional[dict]]:
+    """
+    동호회 목록 한 페이지 (캐시 → DB)
+
+    Returns:
+        (클럽 dict 목록 - member_count 포함, 페이지네이션 메타 또는 None)
+        캐시된 객체를 그대로 반환하므로 호출자는 수정하지 않아야 한다.
+    """
+    key = (search or "", skip, limit, page, page_size, cursor, include_total)
+    cached = _listing_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    generation = _generation
+    query = Club.filter(is_deleted=False)
+    if search:
+        # PostgreSQL에서는 UPPER(name) 트라이그램 인덱스(idx_clubs_name_trgm)를 사용
+        query = query.filter(name__icontains=search)
+
+    # 활성 회원수를 annotate로 한 번에 조회 (N+1 방지)
+    annotated_query = query.annotate(
+        member_count=Count(
+            "members",
+            _filter=Q(members__status=MemberStatus.ACTIVE, members__is_deleted=False)
+        )
+    ).order_by("-created_at")
+
+    if cursor is not None:
+        clubs, pagination = await paginate_query(
+            annotated_query, None, page_size,
+            cursor=cursor, cursor_fields=("-created_at", "-id"), include_total=include_total
+        )
+    elif page is not None:
+        clubs, pagination = await paginate_query(annotated_query, page, page_size)
+    else:
+        clubs = await annotated_query.offset(skip).limit(limit)
+        pagination = None
+
+    rows = [
+        {**{name: getattr(club, name) for name in LISTING_FIELDS}, "member_count": club.member_count}
+        for club in clubs
+    ]
+    result = (rows, pagination)
+    if generation == _generation:
+        _listing_cache.set(key, result)
+    return result
@@ -0,0 +1,76 @@
+"""
+시즌/세션 집계 카운터
+
+목록 API에서 개수만 필요할 때 행을 모두 불러오지 않고
+GROUP BY + COUNT 쿼리로 한 번에 계산한다 (대상 수와 무관하게 고정 쿼리 수).
+
+- 시즌: session_count, match_count, completed_match_count
+- 세션: participant_count, match_count, completed_match_count
+"""
+from typing import Dict, Iterable
+
+from tortoise.functions import Count
+from tortoise.queryset import Q
+
+from app.models.event import Session, SessionParticipant
+from app.models.match import Match, MatchStatus
+
+SEASON_COUNTER_FIELDS = ("session_count", "match_count", "completed_match_count")
+SESSION_COUNTER_FIELDS = ("participant_count", "match_count", "completed_match_count")
+
+
+def _empty(keys: Iterable[int], fields: Iterable[str]) -> Dict[int, Dict[str, int]]:
+    return {key: {name: 0 for name in fields} for key in keys}
+
+
+async def _match_counts(group_field: str, **filters) -> list:
+    """group_field별 (전체 경기 수, 완료 경기 수)"""
+    return await Match.filter(is_deleted=False, **filters).annotate(
+        total=Count("id"),
+        completed=Count("id", _filter=Q(status=MatchStatus.COMPLETED)),
+    ).group_by(group_field).values(group_field, "total", "completed")
+
+
+async def season_counters(season_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """시즌별 세션/경기/완료 경기 수 (쿼리 2회)"""
+    season_ids = list(season_ids)
+    counters = _empty(season_ids, SEASON_COUNTER_FIELDS)
+    if not season_ids:
+        return counters
+
+    session_rows = await Session.filter(
+        season_id__in=season_ids, is_deleted=False
+    ).annotate(total=Count("id")).group_by("season_id").values("season_id", "total")
+    for row in session_rows:
+        counters[row["season_id"]]["session_count"] = row["total"]
+
+    match_rows = await _match_counts(
+        "session__season_id", session__season_id__in=season_ids, session__is_deleted=False
+    )
+    for row in match_rows:
+        counter = counters[row["session__season_id"]]
+        counter["match_count"] = row["total"]
+        counter["completed_match_count"] = row["completed"]
+
+    return counters
+
+
+async def session_counters(session_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """세션별 참가자/경기/완료 경기 수 (쿼리 2회)"""
+    session_ids = list(session_ids)
+    counters = _empty(session_ids, SESSION_COUNTER_FIELDS)
+    if not session_ids:
+        return counters
+
+    participant_rows = await SessionParticipant.filter(
+        session_id__in=session_ids, is_deleted=False
+    ).annotate(total=Count("id")).group_by("session_id").values("session_id", "total")
+    for row in participant_rows:
+        counters[row["session_id"]]["participant_count"] = row["total"]
+
+    for row in await _match_counts("session_id", session_id__in=session_ids):
+        counter = counters[row["session_id"]]
+        counter["match_count"] = row["total"]
+        counter["completed_match_count"] = row["completed"]
+
+    return counters
@@ -0,0 +1,83 @@
+"""
+Gemini API 비동기 호출 공통 모듈
+
+- SDK의 비동기 인터페이스(client.aio)를 사용하여 이벤트 루프를 막지 않음
+- 프로세스당 동시 호출 수를 세마포어로 제한 (GEMINI_MAX_CONCURRENCY)
+- 대기 시간을 포함한 전체 호출에 타임아웃 적용 (GEMINI_TIMEOUT_SECONDS)
+- 타임아웃/요청 취소 시 진행 중인 호출도 함께 취소됨
+- 재시도할 수 있는 오류(시간 초과, 5xx/429 응답)는 GeminiError 계열로 구분
+  (입력 오류용 ValueError와 별개 - API에서는 504/503으로 응답)
+"""
+import asyncio
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 루프별로 생성 (테스트 등에서 루프가 바뀌는 경우 대비)
+_semaphore: Optional[asyncio.Semaphore] = None
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class GeminiError(Exception):
+    """Gemini 일시 오류 (같은 요청을 다시 보내면 성공할 수 있음)"""
+
+
+class GeminiTimeoutError(GeminiError):
+    """Gemini 호출 시간 초과"""
+
+
+class GeminiUnavailableError(GeminiError):
+    """Gemini 일시 오류 (5xx 서버 오류 또는 429 요청 한도 초과)"""
+
+
+# 같은 요청을 다시 보내면 성공할 수 있는 오류
+RETRYABLE_ERRORS = (GeminiTimeoutError, GeminiUnavailableError)
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """프로세스(이벤트 루프) 단위 동시 호출 제한 세마포어"""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        from app.config import settings
+        _semaphore = asyncio.Semaphore(max(settings.GEMINI_MAX_CONCURRENCY, 1))
+        _semaphore_loop = loop
+    return _semaphore
+
+
+async def _limited_call(client, model: str, contents: Any):
+    async with _get_semaphore():
+        return await client.aio.models.generate_content(model=model, contents=contents)
+
+
+async def generate_content(client, model: str, contents: Any, timeout: Optional[float] = None):
+    """
+    Gemini generate_content 비동기 호출
+
+    Args:
+        client: genai.Client
+        model: 모델 이름
+        contents: 요청 내용
+        timeout: 초 단위 타임아웃 (None이면 GEMINI_TIMEOUT_SECONDS)
+
+    Raises:
+        GeminiTimeoutError: 대기 + 응답 시간이 타임아웃을 넘은 경우
+        GeminiUnavailableError: 5xx/429 응답
+    """
+    from google.genai import errors
+
+    if timeout is None:
+        from app.config import settings
+        timeout = settings.GEMINI_TIMEOUT_SECONDS
+
+    try:
+        return await asyncio.wait_for(_limited_call(client, model, contents), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"[Gemini] 응답 시간 초과 - model={model}, timeout={timeout}s")
+        raise GeminiTimeoutError(f"Gemini 응답 시간 초과 ({timeout}초)")
+    except errors.APIError as e:
+        if e.code == 429 or (e.code or 0) >= 500:
+            logger.warning(f"[Gemini] 일시 오류 - model={model}, code={e.code}")
+            raise GeminiUnavailableError(f"Gemini 일시 오류 ({e.code})") from e
+        raise
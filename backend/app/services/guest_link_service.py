@@ -0,0 +1,113 @@
+"""
+게스트 → 회원 연결 및 경기 기록 이전
+
+게스트의 참가 기록을 연결된 회원으로 옮기고 파생 값을 같은 트랜잭션에서 갱신한다
+(트랜잭션은 호출자가 관리, 여러 게스트를 한 번에 처리).
+
+- 참가 기록: 게스트별 MatchParticipant/SessionParticipant filter(...).update(...) 1회씩
+  (행을 불러와 하나씩 저장하지 않으므로 기록 수와 무관)
+- 누적 전적: 이전된 완료 경기 결과로 게스트 → 회원 승/무/패 증감분 계산
+- 랭킹: 같은 증감분을 회원 Ranking / SeasonRanking에 반영 (게스트는 랭킹 없음)
+- 레이팅: 이전된 참가 기록의 rating_change 합계를 게스트에서 회원으로 이동
+- 요약 통계: 연결된 회원/게스트와, 파트너/상대 키가 바뀌는 같은 경기의 다른 선수 재계산
+"""
+from collections import defaultdict
+from typing import Dict
+
+from tortoise.expressions import F
+
+from app.models.event import SessionParticipant
+from app.models.guest import Guest
+from app.models.match import MatchParticipant, MatchStatus, ParticipantCategory, Team
+from app.models.member import ClubMember
+from app.models.ranking import Ranking
+from app.models.season import SeasonRanking
+from app.services.player_stats_service import (
+    GUEST,
+    MEMBER,
+    apply_counter_deltas,
+    load_match_players,
+    refresh_player_summaries,
+)
+from app.services.ranking_service import DRAW, apply_ranking_deltas, team_record
+
+
+async def link_guests(club_id: int, links: Dict[int, int], transfer_records: bool = True) -> Dict[int, int]:
+    """
+    게스트를 회원과 연결하고 (transfer_records이면) 경기 기록 이전
+
+    Args:
+        links: {guest_id: member_id} - 검증은 호출자가 완료한 상태
+
+    Returns:
+        {guest_id: 이전된 경기 참가 수}
+    """
+    for guest_id, member_id in links.items():
+        await Guest.filter(id=guest_id).update(linked_member_id=member_id)
+
+    if not transfer_records:
+        return {guest_id: 0 for guest_id in links}
+
+    rows = await MatchParticipant.filter(guest_id__in=list(links), is_deleted=False).values(
+        "guest_id", "match_id", "team", "rating_change",
+        "match__status", "match__is_deleted", "match__session__season_id",
+        "match__result__id", "match__result__winner_team",
+    )
+
+    transferred = defaultdict(int)
+    counter_deltas = defaultdict(lambda: [0, 0, 0])
+    ranking_deltas = defaultdict(lambda: [0, 0, 0])
+    season_deltas = defaultdict(lambda: defaultdict(lambda: [0, 0, 0]))
+    rating_moves = defaultdict(lambda: [0.0, 0])
+    for row in rows:
+        guest_id = row["guest_id"]
+        member_id = links[guest_id]
+        transferred[guest_id] += 1
+
+        if row["rating_change"] is not None:
+            rating_moves[guest_id][0] += row["rating_change"]
+            rating_moves[guest_id][1] += 1
+
+        completed = row["match__status"] == MatchStatus.COMPLETED and not row["match__is_deleted"]
+        if not completed or row["match__result__id"] is None:
+            continue
+        winner = row["match__result__winner_team"]
+        outcome = Team(winner).value if winner else DRAW
+        record = team_record(outcome, Team(row["team"]).value)
+        season_id = row["match__session__season_id"]
+        for i in range(3):
+            counter_deltas[(GUEST, guest_id)][i] -= record[i]
+            counter_deltas[(MEMBER, member_id)][i] += record[i]
+            ranking_deltas[member_id][i] += record[i]
+            if season_id:
+                season_deltas[season_id][member_id][i] += record[i]
+
+    # 참가 기록 이전 (게스트별 UPDATE 1회씩)
+    for guest_id, member_id in links.items():
+        moved = dict(guest_id=None, club_member_id=member_id, participant_category=ParticipantCategory.MEMBER)
+        await MatchParticipant.filter(guest_id=guest_id, is_deleted=False).update(**moved)
+        await SessionParticipant.filter(guest_id=guest_id, is_deleted=False).update(**moved)
+
+    await apply_counter_deltas(counter_deltas)
+    await apply_ranking_deltas(Ranking, {"club_id": club_id}, ranking_deltas)
+    for season_id, deltas in season_deltas.items():
+        await apply_ranking_deltas(SeasonRanking, {"season_id": season_id}, deltas)
+
+    for guest_id, (rating_sum, games) in rating_moves.items():
+        if not games:
+            continue
+        await Guest.filter(id=guest_id).update(
+            rating=F("rating") - rating_sum, rating_games=F("rating_games") - games,
+        )
+        await ClubMember.filter(id=links[guest_id]).update(
+            rating=F("rating") + rating_sum, rating_games=F("rating_games") + games,
+        )
+
+    # 이전 후 기준으로 요약 통계 재계산 (같은 경기 참가자는 파트너/상대 키가 바뀜)
+    players = {(MEMBER, m) for m in links.values()} | {(GUEST, g) for g in links}
+    match_players = await load_match_players(sorted({row["match_id"] for row in rows}))
+    for entries in match_players.values():
+        players.update(player for player, _ in entries)
+    await refresh_player_summaries(club_id, players)
+
+    return {guest_id: transferred[guest_id] for guest_id in links}
@@ -0,0 +1,56 @@
+"""
+OCR 업로드 전 이미지 전처리
+
+- EXIF 방향 정보를 픽셀에 반영 (세로로 찍은 사진이 누워서 전달되지 않도록)
+- 긴 변이 max_dimension을 넘으면 비율을 유지하여 축소
+- JPEG로 다시 인코딩하여 전송 크기 감소 (결과가 원본보다 크면 원본 사용)
+"""
+import io
+import logging
+from typing import Tuple
+
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+
+def preprocess_image(
+    image_data: bytes,
+    mime_type: str,
+    max_dimension: int,
+    jpeg_quality: int = 85,
+) -> Tuple[bytes, str]:
+    """
+    이미지 디코딩 → EXIF 방향 보정 → 축소 → JPEG 재인코딩
+
+    Returns:
+        (전처리된 바이트, MIME 타입) - 처리할 수 없으면 원본 그대로
+    """
+    if max_dimension <= 0:
+        return image_data, mime_type
+
+    try:
+        with Image.open(io.BytesIO(image_data)) as image:
+            orientation = image.getexif().get(0x0112, 1)  # EXIF Orientation
+            image = ImageOps.exif_transpose(image)
+            resized = max(image.size) > max_dimension
+            if resized:
+                image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+            if image.mode not in ("RGB", "L"):
+                # 투명 배경은 흰색으로 합성 (결과지 글씨가 검게 사라지지 않도록)
+                rgba = image.convert("RGBA")
+                image = Image.new("RGB", rgba.size, (255, 255, 255))
+                image.paste(rgba, mask=rgba.split()[-1])
+
+            output = io.BytesIO()
+            image.save(output, format="JPEG", quality=jpeg_quality, optimize=True)
+    except Exception as e:
+        logger.warning(f"[OCR] 이미지 전처리 실패, 원본 사용: {type(e).__name__}: {e}")
+        return image_data, mime_type
+
+    processed = output.getvalue()
+    # 축소/회전이 필요 없고 재인코딩으로도 작아지지 않으면 원본 유지
+    if not resized and orientation == 1 and len(processed) >= len(image_data):
+        return image_data, mime_type
+    return processed, "image/jpeg"
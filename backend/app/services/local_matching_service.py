@@ -0,0 +1,321 @@
+"""
+로컬 경기 매칭 서비스 (휴리스틱 스케줄러)
+
+AI 매칭과 같은 입력(참가자 + 세션 설정)을 받아 같은 형식의 결과를 반환한다.
+외부 API 호출 없이 수 밀리초 안에 코트/라운드 배정을 만든다.
+
+배정 규칙:
+- 라운드 길이 = 경기 시간 + 휴식 시간, 종료 시간 안에 들어가는 라운드만 사용
+- 라운드마다 코트 수만큼 경기를 배치하고 한 선수는 라운드당 한 경기만 뛴다
+- 선수 선택 우선순위: 직전 라운드 휴식 여부 > 경기 수(적을수록) > 무작위
+  (연속 경기를 피하고 출전 횟수를 고르게 맞춤)
+- 팀 구성 (balanced 모드): 동점 후보 중 4명 조합과 팀 분할을 탐색하여
+  팀 실력 차이 + 같은 파트너 반복 벌점이 가장 작은 조합을 선택
+  (참가자 중 한 명이라도 레이팅이 있으면 모두 레이팅 기준 - 레이팅 없는 선수는 초기 레이팅,
+  아무도 없으면 랭킹 포인트 기준. 두 단위를 섞어 비교하지 않음)
+"""
+import random
+from collections import defaultdict
+from itertools import combinations
+from typing import List, Dict, Any, Optional, Tuple
+
+from app.services.rating_service import INITIAL_RATING, expected_score, team_rating
+
+MATCH_TYPES = ["mens_doubles", "womens_doubles", "mixed_doubles"]
+
+# 같은 파트너와 다시 팀이 될 때 부여하는 벌점 (포인트 차이와 같은 단위)
+REPEAT_PARTNER_PENALTY = 10
+
+# 레이팅 → 포인트 단위 환산 (레이팅 10점 = 1포인트, 파트너 반복 벌점은 레이팅 100점 차이)
+RATING_PER_POINT = 10
+
+# 동점 후보 탐색 범위 (조합 폭발 방지)
+MAX_TIE_CANDIDATES = 8
+
+
+def _to_minutes(hhmm: str) -> int:
+    hour, minute = map(int, hhmm.split(":"))
+    return hour * 60 + minute
+
+
+def _format_minutes(minutes: int) -> str:
+    minutes %= 24 * 60
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _rating(player: Dict[str, Any]) -> Optional[float]:
+    return (player.get("ranking") or {}).get("rating")
+
+
+def _rating_or_initial(player: Dict[str, Any]) -> float:
+    rating = _rating(player)
+    return INITIAL_RATING if rating is None else rating
+
+
+def _strength(player: Dict[str, Any], use_rating: bool) -> float:
+    """실력 추정치 (use_rating이면 레이팅을 포인트 단위로 환산, 아니면 랭킹 포인트)"""
+    if use_rating:
+        return _rating_or_initial(player) / RATING_PER_POINT
+    return (player.get("ranking") or {}).get("points", 0) or 0
+
+
+def _balance_score(team_a: List[Dict], team_b: List[Dict], use_rating: bool) -> float:
+    """
+    두 팀 실력이 비슷할수록 1.0에 가까운 점수
+
+    - use_rating이면 팀 평균 Elo 기대 승률이 50%에 가까운 정도
+    - 아니면 두 팀 포인트 합의 차이 비율
+    """
+    if use_rating:
+        expected = expected_score(
+            team_rating([_rating_or_initial(p) for p in team_a]),
+            team_rating([_rating_or_initial(p) for p in team_b]),
+        )
+        return round(1 - abs(expected - 0.5) * 2, 2)
+    a = sum(_strength(p, False) for p in team_a)
+    b = sum(_strength(p, False) for p in team_b)
+    return round(1 - abs(a - b) / max(a + b, 1), 2)
+
+
+class _ScheduleState:
+    """라운드 진행 중 선수별 출전 기록"""
+
+    def __init__(self, rng: random.Random, use_rating: bool = False):
+        self.rng = rng
+        # 실력 비교 단위 (참가자 전체 기준으로 한 번 정함)
+        self.use_rating = use_rating
+        self.games = defaultdict(int)
+        self.last_round = {}
+        self.partners = defaultdict(int)
+        # 같은 우선순위 안에서의 무작위 순서 (라운드마다 새로 뽑음)
+        self.jitter = {}
+
+    def shuffle(self, players: List[Dict]) -> None:
+        self.jitter = {p["id"]: self.rng.random() for p in players}
+
+    def priority(self, player: Dict, round_index: int) -> Tuple[int, int]:
+        """낮을수록 먼저 출전 (직전 라운드 출전 여부, 경기 수)"""
+        played_last = self.last_round.get(player["id"]) == round_index - 1
+        return (1 if played_last else 0, self.games[player["id"]])
+
+    def ordered(self, players: List[Dict], round_index: int) -> List[Dict]:
+        return sorted(players, key=lambda p: (self.priority(p, round_index), self.jitter.get(p["id"], 0)))
+
+    def record(self, team_a: List[Dict], team_b: List[Dict], round_index: int) -> None:
+        for team in (team_a, team_b):
+            for p in team:
+                self.games[p["id"]] += 1
+                self.last_round[p["id"]] = round_index
+            if len(team) == 2:
+                self.partners[frozenset(p["id"] for p in team)] += 1
+
+
+class LocalMatchingService:
+    """로컬 휴리스틱 경기 매칭 서비스"""
+
+    async def generate_matches(
+        self,
+        participants: List[Dict[str, Any]],
+        session_config: Dict[str, Any],
+        mode: str = "balanced",  # "balanced" or "random"
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        세션 참가자를 기반으로 경기 매칭을 생성합니다.
+
+        Args:
+            participants: 참가자 목록 (id, name, gender, match_type, ranking)
+            session_config: 세션 설정 (start_time, end_time, match_duration, break_duration, num_courts)
+            mode: 매칭 모드 ("balanced" - 실력 기반, "random" - 완전 랜덤)
+            seed: 난수 시드 (테스트 재현용)
+
+        Returns:
+            AIMatchingService._validate_and_normalize와 같은 형식의 결과
+        """
+        return self.schedule(participants, session_config, mode, seed)
+
+    def schedule(
+        self,
+        participants: List[Dict[str, Any]],
+        session_config: Dict[str, Any],
+        mode: str = "balanced",
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """동기 스케줄링 본체"""
+        rng = random.Random(seed)
+        state = _ScheduleState(rng, use_rating=any(_rating(p) is not None for p in participants))
+        pools = self._build_pools(participants)
+
+        if not any(self._can_form(match_type, pool) for match_type, pool in pools.items()):
+            raise ValueError("경기를 구성할 수 있는 참가자가 부족합니다")
+
+        start = _to_minutes(session_config["start_time"])
+        end = _to_minutes(session_config["end_time"])
+        if end <= start:
+            end += 24 * 60
+        match_duration = int(session_config["match_duration"])
+        round_length = match_duration + int(session_config["break_duration"])
+        num_courts = max(int(session_config["num_courts"] or 1), 1)
+        num_rounds = max((end - start - match_duration) // round_length + 1, 1)
+
+        matches = []
+        for round_index in range(num_rounds):
+            state.shuffle(participants)
+            used = set()
+            for court in range(1, num_courts + 1):
+                picked = self._pick_next_match(pools, used, state, round_index, mode)
+                if picked is None:
+                    break
+                match_type, team_a, team_b = picked
+                used.update(p["id"] for p in team_a + team_b)
+                state.record(team_a, team_b, round_index)
+                matches.append({
+                    "match_number": len(matches) + 1,
+                    "match_type": match_type,
+                    "court_number": court,
+                    "scheduled_time": _format_minutes(start + round_index * round_length),
+                    "team_a": {
+                        "player_ids": [p["id"] for p in team_a],
+                        "player_names": [p["name"] for p in team_a]
+                    },
+                    "team_b": {
+                        "player_ids": [p["id"] for p in team_b],
+                        "player_names": [p["name"] for p in team_b]
+                    },
+                    "balance_score": _balance_score(team_a, team_b, state.use_rating)
+                })
+
+        last_start = _to_minutes(matches[-1]["scheduled_time"]) if matches else start
+        return {
+            "matches": matches,
+            "summary": {
+                "total_matches": len(matches),
+                "mens_doubles_matches": sum(1 for m in matches if m["match_type"] == "mens_doubles"),
+                "womens_doubles_matches": sum(1 for m in matches if m["match_type"] == "womens_doubles"),
+                "mixed_doubles_matches": sum(1 for m in matches if m["match_type"] == "mixed_doubles"),
+                "estimated_end_time": _format_minutes(last_start + match_duration)
+            }
+        }
+
+    def _build_pools(self, participants: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """경기 유형별 참가자 풀 (혼합 복식은 성별로 분리)"""
+        pools = {
+            "mens_doubles": [],
+            "womens_doubles": [],
+            "mixed_doubles": {"male": [], "female": []},
+        }
+        for p in participants:
+            match_type = p.get("match_type")
+            if match_type == "mixed_doubles":
+                if p.get("gender") in ("male", "female"):
+                    pools["mixed_doubles"][p["gender"]].append(p)
+            elif match_type in pools:
+                pools[match_type].append(p)
+        return pools
+
+    @staticmethod
+    def _can_form(match_type: str, pool) -> bool:
+        if match_type == "mixed_doubles":
+            return len(pool["male"]) >= 2 and len(pool["female"]) >= 2
+        return len(pool) >= 4
+
+    def _pick_next_match(
+        self,
+        pools: Dict[str, Any],
+        used: set,
+        state: _ScheduleState,
+        round_index: int,
+        mode: str
+    ) -> Optional[Tuple[str, List[Dict], List[Dict]]]:
+        """
+        이번 라운드의 다음 코트에 배치할 경기 선택
+
+        유형별 최선 후보를 만든 뒤, 출전 우선순위 합이 가장 낮은(가장 쉬어야 할 사람이 적은)
+        후보를 고른다.
+        """
+        best = None
+        best_key = None
+        for match_type in MATCH_TYPES:
+            pool = pools[match_type]
+            if match_type == "mixed_doubles":
+                available = {g: [p for p in pool[g] if p["id"] not in used] for g in ("male", "female")}
+            else:
+                available = [p for p in pool if p["id"] not in used]
+            if not self._can_form(match_type, available):
+                continue
+
+            candidate = self._best_group(match_type, available, state, round_index, mode)
+            team_a, team_b, cost = candidate
+            priority = [state.priority(p, round_index) for p in team_a + team_b]
+            key = (sum(rested for rested, _ in priority), sum(games for _, games in priority), cost)
+            if best_key is None or key < best_key:
+                best, best_key = (match_type, team_a, team_b), key
+        return best
+
+    def _candidate_sets(
+        self,
+        players: List[Dict],
+        count: int,
+        state: _ScheduleState,
+        round_index: int,
+        mode: str
+    ) -> List[List[Dict]]:
+        """
+        우선순위를 지키는 후보 조합 목록
+
+        count번째 선수보다 우선순위가 높은 선수는 반드시 포함하고,
+        같은 우선순위(동점) 선수 중에서만 조합을 탐색한다.
+        """
+        ordered = state.ordered(players, round_index)
+        if mode != "balanced":
+            return [ordered[:count]]
+
+        cutoff = state.priority(ordered[count - 1], round_index)
+        must = [p for p in ordered if state.priority(p, round_index) < cutoff]
+        ties = [p for p in ordered if state.priority(p, round_index) == cutoff][:MAX_TIE_CANDIDATES]
+        return [must + list(extra) for extra in combinations(ties, count - len(must))]
+
+    def _best_group(
+        self,
+        match_type: str,
+        available,
+        state: _ScheduleState,
+        round_index: int,
+        mode: str
+    ) -> Tuple[List[Dict], List[Dict], float]:
+        """후보 조합과 팀 분할 중 비용(실력 차이 + 파트너 반복 벌점)이 가장 작은 것"""
+        if match_type == "mixed_doubles":
+            males = self._candidate_sets(available["male"], 2, state, round_index, mode)
+            females = self._candidate_sets(available["female"], 2, state, round_index, mode)
+            splits = [
+                ([m[0], f[0]], [m[1], f[1]])
+                for m in males for f in females
+            ] + [
+                ([m[0], f[1]], [m[1], f[0]])
+                for m in males for f in females
+            ]
+        else:
+            splits = []
+            for group in self._candidate_sets(available, 4, state, round_index, mode):
+                a, b, c, d = group
+                splits.extend([([a, b], [c, d]), ([a, c], [b, d]), ([a, d], [b, c])])
+
+        if mode != "balanced":
+            team_a, team_b = state.rng.choice(splits)
+            return team_a, team_b, 0
+
+        best = None
+        for team_a, team_b in splits:
+            cost = abs(
+                sum(_strength(p, state.use_rating) for p in team_a)
+                - sum(_strength(p, state.use_rating) for p in team_b)
+            )
+            for team in (team_a, team_b):
+                cost += REPEAT_PARTNER_PENALTY * state.partners[frozenset(p["id"] for p in team)]
+            if best is None or cost < best[2]:
+                best = (team_a, team_b, cost)
+        return best
+
+
+# 싱글톤 인스턴스
+local_matching_service = LocalMatchingService()
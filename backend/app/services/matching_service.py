@@ -5,12 +5,18 @@
 - 모든 시간은 UTC datetime으로 처리
 - start_datetime: 세션 시작 시간 (UTC)
 - 경기 시간은 start_datetime + (match_index * duration)으로 계산
+
+생성 단계:
+1. 계획 단계: 전체 대진을 DB 접근 없이 메모리상의 dict 목록(match plan)으로 구성
+2. 저장 단계: Match / MatchParticipant를 bulk_create로 일괄 저장
+   (경기 수와 무관하게 INSERT 쿼리 수가 고정됨)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from app.models.event import SessionParticipant, ParticipantCategory
-from app.models.match import Match, MatchParticipant, MatchType, Team
-from app.models.member import Gender
+from tortoise.transactions import in_transaction
+from app.models.event import Session, SessionParticipant, ParticipantCategory
+from app.models.match import Match, MatchParticipant, MatchStatus, MatchType, Team
+from app.models.member import ClubMember, Gender
 import random
 
 
@@ -30,6 +36,97 @@ def _create_match_participant_kwargs(participant: SessionParticipant, team: Team
     return kwargs
 
 
+def _plan_match(
+    match_number: int,
+    court_number: int,
+    scheduled_datetime: datetime,
+    match_type: MatchType,
+    teams: List[Tuple[Team, List[SessionParticipant]]],
+) -> Dict[str, Any]:
+    """
+    경기 계획(plain data) 생성
+
+    teams: [(팀, 참가자 목록)] - 참가자 순서대로 position 1, 2 부여
+    """
+    participants = []
+    for team, members in teams:
+        for position, participant in enumerate(members, 1):
+            participants.append(_create_match_participant_kwargs(participant, team, position))
+    return {
+        "match_number": match_number,
+        "court_number": court_number,
+        "scheduled_datetime": scheduled_datetime,
+        "match_type": match_type,
+        "participants": participants,
+    }
+
+
+def _court_and_time(
+    index: int,
+    num_courts: int,
+    start_datetime: datetime,
+    match_duration_minutes: int,
+) -> Tuple[int, datetime]:
+    """index번째 경기의 (코트 번호, 시작 시간) 계산 - 코트가 다 차면 다음 시간대로 이동"""
+    time_slot, court_offset = divmod(index, num_courts)
+    return court_offset + 1, start_datetime + timedelta(minutes=match_duration_minutes * time_slot)
+
+
+async def persist_match_plans(
+    session_id: int,
+    plans: List[Dict[str, Any]],
+    club_id: Optional[int] = None,
+) -> List[Match]:
+    """
+    경기 계획을 일괄 저장
+
+    Match와 MatchParticipant를 각각 bulk_create로 저장한다.
+    계획에 "status"가 없으면 SCHEDULED로 저장한다.
+    bulk_create는 Match.save()를 거치지 않으므로 비정규화된 club_id를 직접 지정한다
+    (club_id를 넘기지 않으면 세션에서 조회).
+    트랜잭션은 호출자가 관리한다.
+
+    Returns:
+        match_number 순으로 정렬된 생성된 Match 목록
+    """
+    if not plans:
+        return []
+
+    if club_id is None:
+        club_id = await Session.filter(id=session_id).first().values_list("club_id", flat=True)
+
+    await Match.bulk_create([
+        Match(
+            club_id=club_id,
+            session_id=session_id,
+            match_number=plan["match_number"],
+            court_number=plan["court_number"],
+            scheduled_datetime=plan["scheduled_datetime"],
+            match_type=plan["match_type"],
+            status=plan.get("status", MatchStatus.SCHEDULED),
+        )
+        for plan in plans
+    ])
+
+    # bulk_create는 생성된 PK를 돌려주지 않으므로 같은 트랜잭션 안에서 (세션, 경기 번호)로 다시 조회
+    # (번호가 같은 기존 경기가 남아 있으면 가장 나중에 생성된 행이 방금 저장한 경기)
+    rows = await Match.filter(
+        session_id=session_id,
+        is_deleted=False,
+        match_number__in=[plan["match_number"] for plan in plans],
+    ).order_by("match_number", "id")
+    match_map = {match.match_number: match for match in rows}
+    matches = list(match_map.values())
+
+    await MatchParticipant.bulk_create([
+        MatchParticipant(match=match_map[plan["match_number"]], **kwargs)
+        for plan in plans
+        for kwargs in plan["participants"]
+    ])
+
+    return matches
+
+
 async def create_matches_for_session(
     session_id: int,
     participants: List[SessionParticipant],
@@ -42,9 +139,6 @@ async def create_matches_for_session(
 
     간단한 라운드 로빈 방식으로 매칭
     """
-    matches = []
-    match_number = 1
-
     # 참가자를 타입별로 분류
     mens_doubles_participants = [
         p for p in participants
@@ -59,119 +153,97 @@ async def create_matches_for_session(
         if p.participation_type.value == "singles"
     ]
 
+    # 혼합 복식 성별 정보 일괄 조회
+    genders = {}
+    member_ids = [p.club_member_id for p in mixed_doubles_participants if p.club_member_id]
+    if member_ids:
+        genders = dict(await ClubMember.filter(id__in=member_ids).values_list("id", "gender"))
+
+    # 1단계: 전체 대진 계획 (DB 접근 없음)
+    plans = []
+
     # 남자 복식 매칭
     if len(mens_doubles_participants) >= 4:
-        mens_matches = await _create_doubles_matches(
-            session_id=session_id,
+        plans.extend(_plan_doubles_matches(
             participants=mens_doubles_participants,
             match_type=MatchType.MENS_DOUBLES,
             num_courts=num_courts,
             match_duration_minutes=match_duration_minutes,
             start_datetime=start_datetime,
-            match_number_start=match_number
-        )
-        matches.extend(mens_matches)
-        match_number += len(mens_matches)
+            match_number_start=len(plans) + 1
+        ))
 
     # 혼합 복식 매칭
     if len(mixed_doubles_participants) >= 4:
-        mixed_matches = await _create_mixed_doubles_matches(
-            session_id=session_id,
+        plans.extend(_plan_mixed_doubles_matches(
             participants=mixed_doubles_participants,
+            genders=genders,
             num_courts=num_courts,
             match_duration_minutes=match_duration_minutes,
             start_datetime=start_datetime,
-            match_number_start=match_number
-        )
-        matches.extend(mixed_matches)
-        match_number += len(mixed_matches)
+            match_number_start=len(plans) + 1
+        ))
 
     # 단식 매칭
     if len(singles_participants) >= 2:
-        singles_matches = await _create_singles_matches(
-            session_id=session_id,
+        plans.extend(_plan_singles_matches(
             participants=singles_participants,
             num_courts=num_courts,
             match_duration_minutes=match_duration_minutes,
             start_datetime=start_datetime,
-            match_number_start=match_number
-        )
-        matches.extend(singles_matches)
+            match_number_start=len(plans) + 1
+        ))
 
-    return matches
+    # 2단계: 일괄 저장
+    async with in_transaction():
+        return await persist_match_plans(session_id, plans)
 
 
-async def _create_doubles_matches(
-    session_id: int,
+def _plan_doubles_matches(
     participants: List[SessionParticipant],
     match_type: MatchType,
     num_courts: int,
     match_duration_minutes: int,
     start_datetime: datetime,  # UTC datetime
     match_number_start: int
-) -> List[Match]:
-    """복식 매치 생성"""
-    matches = []
+) -> List[Dict[str, Any]]:
+    """복식 매치 계획"""
     random.shuffle(participants)
 
-    court = 1
-    match_number = match_number_start
-    current_datetime = start_datetime
-    time_slot = 0
-
+    plans = []
     # 4명씩 묶어서 매치 생성
     for i in range(0, len(participants) - 3, 4):
-        team_a = participants[i:i+2]
-        team_b = participants[i+2:i+4]
-
-        match = await Match.create(
-            session_id=session_id,
-            match_number=match_number,
-            court_number=court,
-            scheduled_datetime=current_datetime,  # UTC datetime
-            match_type=match_type
-        )
-
-        # 팀 A 참가자 추가
-        for idx, participant in enumerate(team_a, 1):
-            kwargs = _create_match_participant_kwargs(participant, Team.A, idx)
-            await MatchParticipant.create(match=match, **kwargs)
-
-        # 팀 B 참가자 추가
-        for idx, participant in enumerate(team_b, 1):
-            kwargs = _create_match_participant_kwargs(participant, Team.B, idx)
-            await MatchParticipant.create(match=match, **kwargs)
-
-        matches.append(match)
-        match_number += 1
-
-        # 다음 코트로 이동
-        court += 1
-        if court > num_courts:
-            court = 1
-            # 다음 시간대로 이동
-            time_slot += 1
-            current_datetime = start_datetime + timedelta(minutes=match_duration_minutes * time_slot)
+        court, scheduled = _court_and_time(len(plans), num_courts, start_datetime, match_duration_minutes)
+        plans.append(_plan_match(
+            match_number_start + len(plans), court, scheduled, match_type,
+            [(Team.A, participants[i:i+2]), (Team.B, participants[i+2:i+4])],
+        ))
 
-    return matches
+    return plans
 
 
-async def _create_mixed_doubles_matches(
-    session_id: int,
+def _plan_mixed_doubles_matches(
     participants: List[SessionParticipant],
+    genders: Dict[int, Gender],
     num_courts: int,
     match_duration_minutes: int,
     start_datetime: datetime,  # UTC datetime
     match_number_start: int
-) -> List[Match]:
-    """혼합 복식 매치 생성 (남녀 페어링 고려)"""
+) -> List[Dict[str, Any]]:
+    """
+    혼합 복식 매치 계획 (남녀 페어링 고려)
+
+    genders: club_member_id → 성별 (호출자가 일괄 조회)
+    """
     # 성별로 분류
     male_participants = []
     female_participants = []
 
     for p in participants:
-        member = await p.club_member.select_related('user')
-        if member.gender.value == Gender.MALE.value:
+        gender = genders.get(p.club_member_id)
+        if gender is None:
+            continue
+        if Gender(gender) == Gender.MALE:
             male_participants.append(p)
         else:
             female_participants.append(p)
@@ -179,228 +251,137 @@ async def _create_mixed_doubles_matches(
     random.shuffle(male_participants)
     random.shuffle(female_participants)
 
-    matches = []
-    court = 1
-    match_number = match_number_start
-    current_datetime = start_datetime
-    time_slot = 0
-
-    # 남녀 2명씩 팀 구성
+    plans = []
+    # 남녀 2명씩 팀 구성 (팀 A: 남1 + 여1, 팀 B: 남2 + 여2)
     min_pairs = min(len(male_participants), len(female_participants))
     for i in range(0, min_pairs - 1, 2):
-        if i + 1 >= min_pairs:
-            break
-
-        match = await Match.create(
-            session_id=session_id,
-            match_number=match_number,
-            court_number=court,
-            scheduled_datetime=current_datetime,  # UTC datetime
-            match_type=MatchType.MIXED_DOUBLES
-        )
-
-        # 팀 A: 남1 + 여1
-        kwargs = _create_match_participant_kwargs(male_participants[i], Team.A, 1)
-        await MatchParticipant.create(match=match, **kwargs)
-        kwargs = _create_match_participant_kwargs(female_participants[i], Team.A, 2)
-        await MatchParticipant.create(match=match, **kwargs)
-
-        # 팀 B: 남2 + 여2
-        kwargs = _create_match_participant_kwargs(male_participants[i+1], Team.B, 1)
-        await MatchParticipant.create(match=match, **kwargs)
-        kwargs = _create_match_participant_kwargs(female_participants[i+1], Team.B, 2)
-        await MatchParticipant.create(match=match, **kwargs)
+        court, scheduled = _court_and_time(len(plans), num_courts, start_datetime, match_duration_minutes)
+        plans.append(_plan_match(
+            match_number_start + len(plans), court, scheduled, MatchType.MIXED_DOUBLES,
+            [
+                (Team.A, [male_participants[i], female_participants[i]]),
+                (Team.B, [male_participants[i+1], female_participants[i+1]]),
+            ],
+        ))
 
-        matches.append(match)
-        match_number += 1
+    return plans
 
-        court += 1
-        if court > num_courts:
-            court = 1
-            time_slot += 1
-            current_datetime = start_datetime + timedelta(minutes=match_duration_minutes * time_slot)
 
-    return matches
-
-
-async def _create_singles_matches(
-    session_id: int,
+def _plan_singles_matches(
     participants: List[SessionParticipant],
     num_courts: int,
     match_duration_minutes: int,
     start_datetime: datetime,  # UTC datetime
     match_number_start: int
-) -> List[Match]:
-    """단식 매치 생성"""
-    matches = []
+) -> List[Dict[str, Any]]:
+    """단식 매치 계획"""
     random.shuffle(participants)
 
-    court = 1
-    match_number = match_number_start
-    current_datetime = start_datetime
-    time_slot = 0
-
+    plans = []
     # 2명씩 묶어서 매치 생성
     for i in range(0, len(participants) - 1, 2):
-        match = await Match.create(
-            session_id=session_id,
-            match_number=match_number,
-            court_number=court,
-            scheduled_datetime=current_datetime,  # UTC datetime
-            match_type=MatchType.SINGLES
-        )
+        court, scheduled = _court_and_time(len(plans), num_courts, start_datetime, match_duration_minutes)
+        plans.append(_plan_match(
+            match_number_start + len(plans), court, scheduled, MatchType.SINGLES,
+            [(Team.A, [participants[i]]), (Team.B, [participants[i+1]])],
+        ))
 
-        # 참가자 A
-        kwargs = _create_match_participant_kwargs(participants[i], Team.A, 1)
-        await MatchParticipant.create(match=match, **kwargs)
+    return plans
 
-        # 참가자 B
-        kwargs = _create_match_participant_kwargs(participants[i+1], Team.B, 1)
-        await MatchParticipant.create(match=match, **kwargs)
 
-        matches.append(match)
-        match_number += 1
+def _participant_gender(participant: SessionParticipant) -> Optional[str]:
+    """prefetch된 관계에서 참가자 성별 조회 (정회원 → 게스트 → 준회원 순)"""
+    if participant.club_member and participant.club_member.user:
+        return participant.club_member.user.gender
+    if participant.guest:
+        return participant.guest.gender
+    if participant.user:
+        return participant.user.gender
+    return None
 
-        court += 1
-        if court > num_courts:
-            court = 1
-            time_slot += 1
-            current_datetime = start_datetime + timedelta(minutes=match_duration_minutes * time_slot)
 
-    return matches
-
-
-async def generate_matches_for_session_inline(
-    session,
-) -> list:
+def plan_session_matches(session) -> List[Dict[str, Any]]:
     """
-    세션의 참가자를 성별로 분류하여 자동으로 경기를 생성
-
-    sessions.py의 generate_matches 엔드포인트에서 호출.
-    트랜잭션은 호출자가 관리한다.
-
-    Args:
-        session: prefetch_related("participants__club_member__user",
-                 "participants__guest", "participants__user")가 완료된 Session 객체
+    세션 참가자를 성별로 분류하여 대진 계획 (혼합 복식 → 남자 복식 → 여자 복식)
 
-    Returns:
-        생성된 Match ID 목록
+    DB에 접근하지 않으며 prefetch된 session.participants만 사용한다.
     """
-    import random as _random
-
-    # 기존 경기 삭제
-    await Match.filter(session=session).delete()
-
-    # 참가자를 성별로 분류
     males = []
     females = []
     for p in session.participants:
-        gender = None
-        if p.club_member and p.club_member.user:
-            gender = p.club_member.user.gender
-        elif p.guest:
-            gender = p.guest.gender
-        elif p.user:
-            gender = p.user.gender
-
+        gender = _participant_gender(p)
         if gender == "male":
             males.append(p)
         elif gender == "female":
             females.append(p)
 
-    _random.shuffle(males)
-    _random.shuffle(females)
+    random.shuffle(males)
+    random.shuffle(females)
+
+    plans = []
 
-    matches_created = []
-    match_number = 0
+    def add_match(match_type: MatchType, players: list) -> None:
+        # players 순서: 팀 A 2명, 팀 B 2명 - team_positions로 팀별 position 부여
+        match_number = len(plans) + 1
+        team_positions = {Team.A: 0, Team.B: 0}
+        participants = []
+        for p, team in zip(players, [Team.A, Team.A, Team.B, Team.B]):
+            team_positions[team] += 1
+            participants.append({
+                "club_member": p.club_member,
+                "guest": p.guest,
+                "user": p.user,
+                "participant_category": p.participant_category,
+                "team": team,
+                "position": team_positions[team],
+            })
+        plans.append({
+            "match_number": match_number,
+            "court_number": (match_number - 1) % session.num_courts + 1,
+            "scheduled_datetime": session.start_datetime,
+            "match_type": match_type,
+            "participants": participants,
+        })
 
     # 혼합 복식 생성 (남녀 짝)
     while len(males) >= 2 and len(females) >= 2:
-        match_number += 1
-        match = await Match.create(
-            session=session,
-            match_number=match_number,
-            court_number=(match_number - 1) % session.num_courts + 1,
-            scheduled_datetime=session.start_datetime,
-            match_type=MatchType.MIXED_DOUBLES,
-            status="scheduled"
-        )
-
         m1, m2 = males.pop(0), males.pop(0)
         f1, f2 = females.pop(0), females.pop(0)
-
-        team_positions = {Team.A: 0, Team.B: 0}
-        for p, team in [(m1, Team.A), (f1, Team.A), (m2, Team.B), (f2, Team.B)]:
-            team_positions[team] += 1
-            pos = team_positions[team]
-            await MatchParticipant.create(
-                match=match,
-                club_member=p.club_member,
-                guest=p.guest,
-                user=p.user,
-                participant_category=p.participant_category,
-                team=team,
-                position=pos
-            )
-
-        matches_created.append(match.id)
+        add_match(MatchType.MIXED_DOUBLES, [m1, f1, m2, f2])
 
     # 남자 복식 생성
     while len(males) >= 4:
-        match_number += 1
-        match = await Match.create(
-            session=session,
-            match_number=match_number,
-            court_number=(match_number - 1) % session.num_courts + 1,
-            scheduled_datetime=session.start_datetime,
-            match_type=MatchType.MENS_DOUBLES,
-            status="scheduled"
-        )
-
-        team_positions = {Team.A: 0, Team.B: 0}
-        for i, team in enumerate([Team.A, Team.A, Team.B, Team.B]):
-            p = males.pop(0)
-            team_positions[team] += 1
-            pos = team_positions[team]
-            await MatchParticipant.create(
-                match=match,
-                club_member=p.club_member,
-                guest=p.guest,
-                user=p.user,
-                participant_category=p.participant_category,
-                team=team,
-                position=pos
-            )
-
-        matches_created.append(match.id)
+        add_match(MatchType.MENS_DOUBLES, [males.pop(0) for _ in range(4)])
 
     # 여자 복식 생성
     while len(females) >= 4:
-        match_number += 1
-        match = await Match.create(
-            session=session,
-            match_number=match_number,
-            court_number=(match_number - 1) % session.num_courts + 1,
-            scheduled_datetime=session.start_datetime,
-            match_type=MatchType.WOMENS_DOUBLES,
-            status="scheduled"
-        )
+        add_match(MatchType.WOMENS_DOUBLES, [females.pop(0) for _ in range(4)])
 
-        team_positions = {Team.A: 0, Team.B: 0}
-        for i, team in enumerate([Team.A, Team.A, Team.B, Team.B]):
-            p = females.pop(0)
-            team_positions[team] += 1
-            pos = team_positions[team]
-            await MatchParticipant.create(
-                match=match,
-                club_member=p.club_member,
-                guest=p.guest,
-                user=p.user,
-                participant_category=p.participant_category,
-                team=team,
-                position=pos
-            )
-
-        matches_created.append(match.id)
-
-    return matches_created
+    return plans
+
+
+async def generate_matches_for_session_inline(
+    session,
+) -> list:
+    """
+    세션의 참가자를 성별로 분류하여 자동으로 경기를 생성
+
+    sessions.py의 generate_matches 엔드포인트에서 호출.
+    트랜잭션은 호출자가 관리한다.
+    대진은 plan_session_matches로 메모리에서 구성하고,
+    persist_match_plans로 일괄 저장한다 (team_positions 기반 position 포함).
+
+    Args:
+        session: prefetch_related("participants__club_member__user",
+                 "participants__guest", "participants__user")가 완료된 Session 객체
+
+    Returns:
+        생성된 Match ID 목록
+    """
+    plans = plan_session_matches(session)
+
+    # 기존 경기 삭제
+    await Match.filter(session=session).delete()
+
+    matches = await persist_match_plans(session.id, plans, club_id=session.club_id)
+    return [match.id for match in matches]
@@ -0,0 +1,162 @@
+"""
+선수 이름 매칭 인덱스 (OCR 선수 해석용)
+
+- 이름을 정규화(공백 제거, 소문자)한 뒤 한글 음절을 자모로 분해하여 비교
+  (예: "김철수" → "ㄱㅣㅁㅊㅓㄹㅅㅜ"), OCR 오인식으로 받침/모음 하나가 틀려도 가깝게 계산
+- 자모 bigram 역색인으로 후보를 좁힌 뒤 후보에 대해서만 편집 거리 계산
+- 신뢰도 = 1 - 편집 거리 / 긴 이름의 자모 길이 (정규화된 이름이 같으면 1.0)
+- 자동 해석은 정규화된 이름이 정확히 일치하는 후보가 하나뿐일 때만 수행
+  (자모 하나 차이인 다른 회원이 있을 수 있으므로 유사 후보는 제안만 하고 수동 매핑을 받음)
+"""
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 한글 음절 분해 테이블 (호환 자모)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# 편집 거리를 계산할 최대 후보 수 (bigram 공유 수 상위)
+MAX_CANDIDATES = 20
+
+
+def normalize_name(name: str) -> str:
+    """공백 제거 + 소문자"""
+    return "".join(name.split()).lower()
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (한글 외 문자는 그대로)"""
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            chars.append(_CHOSEONG[index // 588])
+            chars.append(_JUNGSEONG[(index % 588) // 28])
+            chars.append(_JONGSEONG[index % 28])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def _bigrams(key: str) -> List[str]:
+    if len(key) < 2:
+        return [key] if key else []
+    return [key[i:i + 2] for i in range(len(key) - 1)]
+
+
+def edit_distance(a: str, b: str) -> int:
+    """레벤슈타인 거리"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    """이름 매칭 후보"""
+    kind: str  # "member" or "guest"
+    id: int
+    name: str
+    confidence: float
+
+    def to_dict(self) -> dict:
+        return {
+            "member_id": self.id if self.kind == "member" else None,
+            "guest_id": self.id if self.kind == "guest" else None,
+            "name": self.name,
+            "confidence": self.confidence,
+        }
+
+
+class NameIndex:
+    """회원/게스트 이름 인덱스 (요청 단위로 한 번 생성하여 재사용)"""
+
+    def __init__(self, entries: Iterable[Tuple[str, int, str]]):
+        """
+        Args:
+            entries: (kind, id, 표시 이름) 목록
+        """
+        self._entries: List[Tuple[str, int, str, str]] = []
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+
+        for kind, item_id, name in entries:
+            if not name:
+                continue
+            normalized = normalize_name(name)
+            if not normalized:
+                continue
+            key = decompose_hangul(normalized)
+            position = len(self._entries)
+            self._entries.append((kind, item_id, name, key))
+            self._exact[normalized].append(position)
+            for gram in set(_bigrams(key)):
+                self._grams[gram].append(position)
+
+    @classmethod
+    def from_models(cls, members: Iterable = (), guests: Iterable = ()) -> "NameIndex":
+        """ClubMember(user prefetch 필요) / Guest 목록으로 인덱스 생성"""
+        entries = [("member", m.id, m.user.name if m.user else None) for m in members]
+        entries += [("guest", g.id, g.name) for g in guests]
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _match(self, position: int, confidence: float) -> NameMatch:
+        kind, item_id, name, _ = self._entries[position]
+        return NameMatch(kind=kind, id=item_id, name=name, confidence=round(confidence, 3))
+
+    def suggest(self, name: str, limit: int = 3) -> List[NameMatch]:
+        """신뢰도 높은 순 후보 목록"""
+        normalized = normalize_name(name or "")
+        if not normalized:
+            return []
+
+        exact = self._exact.get(normalized, [])
+        if exact:
+            return [self._match(position, 1.0) for position in exact][:limit]
+
+        key = decompose_hangul(normalized)
+        shared = Counter()
+        for gram in set(_bigrams(key)):
+            for position in self._grams.get(gram, ()):
+                shared[position] += 1
+
+        scored = []
+        for position, _ in shared.most_common(MAX_CANDIDATES):
+            candidate_key = self._entries[position][3]
+            distance = edit_distance(key, candidate_key)
+            confidence = 1 - distance / max(len(key), len(candidate_key))
+            if confidence > 0:
+                scored.append((confidence, position))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._match(position, confidence) for confidence, position in scored[:limit]]
+
+    def resolve(self, name: str) -> Optional[NameMatch]:
+        """
+        자동 해석: 정규화된 이름이 정확히 일치하는 후보가 하나일 때만 반환
+
+        유사 이름(OCR 오인식 등)이나 동명이인은 None (suggest 후보로 수동 매핑 필요)
+        """
+        exact = self._exact.get(normalize_name(name or ""), [])
+        if len(exact) != 1:
+            return None
+        return self._match(exact[0], 1.0)
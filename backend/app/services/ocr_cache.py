@@ -0,0 +1,132 @@
+"""
+OCR 결과 캐시 (이미지 내용 주소 기반)
+
+- 키: SHA-256(이미지 바이트 + 프롬프트 버전) → 같은 사진을 다시 올리면 Gemini 호출 없이 즉시 반환
+- 저장소: 로컬 디스크 JSON 파일 (<디렉터리>/<키 앞 2자>/<키>.json)
+- 용량 제한: 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+  (사용 시각은 파일 mtime으로 기록하므로 프로세스 재시작 후에도 순서 유지)
+- 적중/미스/삭제 횟수 카운터 제공
+- 용량 제한(OCR_CACHE_MAX_BYTES)과 LRU 순서는 프로세스 단위로 관리된다
+  (여러 워커 프로세스가 같은 디렉터리를 쓰면 전체 크기가 제한을 넘을 수 있음)
+- 메서드는 블로킹 파일 I/O를 수행하므로 비동기 코드에서는 asyncio.to_thread로 호출한다
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def ocr_cache_key(image_data: bytes, prompt_version: str) -> str:
+    """이미지 바이트 + 프롬프트 버전의 SHA-256"""
+    digest = hashlib.sha256(image_data)
+    digest.update(b"\0")
+    digest.update(prompt_version.encode())
+    return digest.hexdigest()
+
+
+class OCRResultCache:
+    """디스크 기반 LRU OCR 결과 캐시"""
+
+    def __init__(self, directory: Optional[str], max_bytes: int):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "tennis-club-ocr-cache")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # 키 → 파일 크기 (오래 사용하지 않은 순)
+        self._entries: Optional["OrderedDict[str, int]"] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _load_entries(self) -> "OrderedDict[str, int]":
+        """디스크의 기존 항목을 mtime 순으로 불러옴 (최초 1회)"""
+        if self._entries is None:
+            found = []
+            if os.path.isdir(self.directory):
+                for root, _, files in os.walk(self.directory):
+                    for name in files:
+                        if not name.endswith(".json"):
+                            continue
+                        stat = os.stat(os.path.join(root, name))
+                        found.append((stat.st_mtime, name[:-5], stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+        return self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entries = self._load_entries()
+            path = self._path(key)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    value = json.load(f)
+            except (OSError, ValueError):
+                entries.pop(key, None)
+                self.misses += 1
+                return None
+            os.utime(path)
+            entries[key] = entries.get(key, os.path.getsize(path))
+            entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            entries = self._load_entries()
+            path = self._path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # 임시 파일에 쓴 뒤 교체 (동시 읽기 시 깨진 파일 방지)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"[OCR] 캐시 저장 실패: {e}")
+                return
+            entries[key] = len(data)
+            entries.move_to_end(key)
+            self._evict(entries)
+
+    def _evict(self, entries: "OrderedDict[str, int]") -> None:
+        total = sum(entries.values())
+        while total > self.max_bytes and entries:
+            key, size = entries.popitem(last=False)
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._load_entries() if self.enabled else {}
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "size_bytes": sum(entries.values()),
+                "max_bytes": self.max_bytes,
+            }
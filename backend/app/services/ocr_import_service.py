@@ -0,0 +1,226 @@
+"""
+OCR 경기 결과 저장 서비스
+
+저장 단계:
+1. 계획 단계: 선수 이름을 미리 불러온 회원/게스트 이름 인덱스(NameIndex)로 해석하고
+   경기/참가자/결과를 DB 접근 없이 dict 목록(match plan)으로 구성
+2. 저장 단계: Match, MatchParticipant, MatchResult, SessionParticipant를
+   각각 bulk_create로 일괄 저장 (경기 수와 무관하게 쿼리 수가 고정됨)
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from tortoise.expressions import Q
+
+from app.models.event import SessionParticipant, ParticipantCategory
+from app.models.guest import Guest
+from app.models.match import Match, MatchResult, MatchStatus, MatchType, Team
+from app.models.member import ClubMember, MemberStatus
+from app.services.matching_service import persist_match_plans
+from app.services.name_matcher import NameIndex
+
+MATCH_TYPE_MAP = {
+    "mens_doubles": MatchType.MENS_DOUBLES,
+    "mixed_doubles": MatchType.MIXED_DOUBLES,
+    "singles": MatchType.SINGLES,
+}
+
+# 해석 결과: (회원, 게스트) 중 하나만 설정, 둘 다 None이면 미매칭
+Resolved = Tuple[Optional[ClubMember], Optional[Guest]]
+
+
+async def load_name_index(club_id: int) -> Tuple[List[ClubMember], List[Guest], NameIndex]:
+    """클럽 활성 회원/게스트를 조회하여 이름 인덱스 생성 (요청당 1회)"""
+    members = await ClubMember.filter(
+        club_id=club_id,
+        is_deleted=False,
+        status=MemberStatus.ACTIVE
+    ).prefetch_related("user")
+    guests = await Guest.filter(club_id=club_id, is_deleted=False)
+    return members, guests, NameIndex.from_models(members, guests)
+
+
+def suggest_players(index: NameIndex, names: Iterable[str], limit: int = 3) -> Dict[str, List[dict]]:
+    """이름별 매칭 후보 (신뢰도 높은 순)"""
+    return {
+        name: [match.to_dict() for match in index.suggest(name, limit=limit)]
+        for name in dict.fromkeys(names) if name
+    }
+
+
+def build_name_resolver(
+    members: List[ClubMember],
+    guests: List[Guest],
+    player_mappings: Optional[list] = None,
+    index: Optional[NameIndex] = None,
+) -> Callable[[str], Resolved]:
+    """
+    선수 이름 → (회원, 게스트) 해석 함수 생성
+
+    우선순위: 명시적 매핑 > 이름 인덱스 자동 해석 (정규화된 이름이 정확히 일치하는 유일한 후보)
+    members는 user가 prefetch되어 있어야 한다.
+    """
+    mapping_by_name = {m.extracted_name: m for m in player_mappings or []}
+    member_by_id = {member.id: member for member in members}
+    guest_by_id = {guest.id: guest for guest in guests}
+    if index is None:
+        index = NameIndex.from_models(members, guests)
+
+    def resolve(player_name: str) -> Resolved:
+        if not player_name:
+            return None, None
+
+        mapping = mapping_by_name.get(player_name)
+        if mapping:
+            if mapping.member_id and mapping.member_id in member_by_id:
+                return member_by_id[mapping.member_id], None
+            if mapping.guest_id and mapping.guest_id in guest_by_id:
+                return None, guest_by_id[mapping.guest_id]
+
+        match = index.resolve(player_name)
+        if match is None:
+            return None, None
+        if match.kind == "member":
+            return member_by_id[match.id], None
+        return None, guest_by_id[match.id]
+
+    return resolve
+
+
+def plan_extracted_matches(
+    extracted_matches: list,
+    resolve: Callable[[str], Resolved],
+    first_match_number: int,
+    scheduled_datetime,
+) -> Dict[str, Any]:
+    """
+    추출된 경기 목록을 저장 계획으로 변환 (DB 접근 없음)
+
+    Returns:
+        {
+            "matches": persist_match_plans 형식의 경기 계획 (점수/승자 포함),
+            "session_participants": [("member" | "guest", id)] 등장 순서,
+            "unmatched_players": 해석하지 못한 이름 (중복 제거, 등장 순서),
+        }
+    """
+    plans = []
+    session_participants = {}
+    unmatched = {}
+
+    for offset, match_data in enumerate(extracted_matches):
+        participants = []
+        for team, team_data in ((Team.A, match_data.team_a), (Team.B, match_data.team_b)):
+            for position, player_name in enumerate(team_data.players, 1):
+                member, guest = resolve(player_name)
+                if member:
+                    key = ("member", member.id)
+                    participants.append({
+                        "club_member_id": member.id,
+                        "participant_category": ParticipantCategory.MEMBER,
+                        "team": team,
+                        "position": position,
+                    })
+                elif guest:
+                    key = ("guest", guest.id)
+                    participants.append({
+                        "guest_id": guest.id,
+                        "participant_category": ParticipantCategory.GUEST,
+                        "team": team,
+                        "position": position,
+                    })
+                else:
+                    unmatched[player_name] = True
+                    continue
+                session_participants[key] = True
+
+        winner = None
+        if match_data.team_a.score > match_data.team_b.score:
+            winner = Team.A
+        elif match_data.team_b.score > match_data.team_a.score:
+            winner = Team.B
+
+        plans.append({
+            "match_number": first_match_number + offset,
+            "court_number": match_data.court_number,
+            "scheduled_datetime": scheduled_datetime,
+            "match_type": MATCH_TYPE_MAP.get(match_data.match_type, MatchType.MENS_DOUBLES),
+            "status": MatchStatus.COMPLETED,
+            "participants": participants,
+            "team_a_score": match_data.team_a.score,
+            "team_b_score": match_data.team_b.score,
+            "winner_team": winner,
+        })
+
+    return {
+        "matches": plans,
+        "session_participants": list(session_participants),
+        "unmatched_players": list(unmatched),
+    }
+
+
+async def persist_extracted_plan(
+    session_id: int,
+    plan: Dict[str, Any],
+    recorded_by_id: Optional[int],
+    club_id: Optional[int] = None,
+) -> List[Tuple[Match, MatchResult]]:
+    """
+    저장 계획을 일괄 저장 (트랜잭션은 호출자가 관리)
+
+    - Match / MatchParticipant: persist_match_plans
+    - MatchResult: bulk_create 1회
+    - SessionParticipant: 기존 참가자 조회 1회 + 없는 참가자만 bulk_create 1회
+
+    Returns:
+        match_number 순 (경기, 결과) 목록
+    """
+    matches = await persist_match_plans(session_id, plan["matches"], club_id=club_id)
+    plan_by_number = {p["match_number"]: p for p in plan["matches"]}
+
+    results = [
+        MatchResult(
+            match_id=match.id,
+            team_a_score=plan_by_number[match.match_number]["team_a_score"],
+            team_b_score=plan_by_number[match.match_number]["team_b_score"],
+            sets_detail={},
+            winner_team=plan_by_number[match.match_number]["winner_team"],
+            recorded_by_id=recorded_by_id,
+        )
+        for match in matches
+    ]
+    if results:
+        await MatchResult.bulk_create(results)
+
+    await _add_session_participants(session_id, plan["session_participants"])
+    return list(zip(matches, results))
+
+
+async def _add_session_participants(session_id: int, keys: List[Tuple[str, int]]) -> None:
+    """세션 참가자로 등록되지 않은 회원/게스트만 일괄 추가"""
+    member_ids = [item_id for kind, item_id in keys if kind == "member"]
+    guest_ids = [item_id for kind, item_id in keys if kind == "guest"]
+    if not member_ids and not guest_ids:
+        return
+
+    rows = await SessionParticipant.filter(
+        Q(club_member_id__in=member_ids) | Q(guest_id__in=guest_ids),
+        session_id=session_id,
+    ).values("club_member_id", "guest_id")
+    existing = {("member", row["club_member_id"]) for row in rows if row["club_member_id"]}
+    existing |= {("guest", row["guest_id"]) for row in rows if row["guest_id"]}
+
+    new_participants = []
+    for kind, item_id in keys:
+        if (kind, item_id) in existing:
+            continue
+        if kind == "member":
+            new_participants.append(SessionParticipant(
+                session_id=session_id, club_member_id=item_id,
+                participant_category=ParticipantCategory.MEMBER,
+            ))
+        else:
+            new_participants.append(SessionParticipant(
+                session_id=session_id, guest_id=item_id,
+                participant_category=ParticipantCategory.GUEST,
+            ))
+    if new_participants:
+        await SessionParticipant.bulk_create(new_participants)
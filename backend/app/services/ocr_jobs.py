@@ -0,0 +1,254 @@
+"""
+OCR 비동기 작업 큐
+
+- 이미지 제출 시 작업 ID를 즉시 반환하고, 백그라운드 워커가 Gemini 추출을 처리
+- 여러 장(결과지 여러 페이지)을 한 작업으로 제출하면 페이지 단위로 큐에 넣어 병렬 처리
+- 워커 수(OCR_JOB_WORKERS)로 동시 처리 수 제한
+- 시간 초과/일시 오류(RETRYABLE_ERRORS)만 OCR_JOB_MAX_RETRIES회까지 재시도
+  (잘못된 이미지, 응답 파싱 실패 등은 바로 실패 처리)
+- 대기/처리 중 작업은 이미지 바이트를 메모리에 들고 있으므로 사용자별(OCR_JOB_MAX_PENDING_PER_USER),
+  전체(OCR_JOB_MAX_PENDING) 미완료 작업 수를 제한하고, 초과하면 OCRJobLimitError
+- 미완료 작업은 제거하지 않고, 끝난 작업만 TTL(OCR_JOB_TTL_SECONDS) 동안 보관
+  (여러 워커 프로세스 간 공유되지 않으므로 같은 프로세스로 폴링해야 함)
+
+상태: pending → running → completed / failed
+- 작업은 모든 페이지가 끝나면 완료되며, 일부 페이지만 실패해도 성공한 페이지 결과는 반환
+"""
+import asyncio
+import contextvars
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from app.core.cache import MISSING, TTLCache
+from app.core.timezone import utc_now
+from app.services.gemini_client import RETRYABLE_ERRORS
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# 보관하는 완료 작업 최대 수
+MAX_FINISHED_JOBS = 1000
+
+
+class OCRJobLimitError(Exception):
+    """미완료 작업 수 제한 초과"""
+
+    def __init__(self, message: str, per_user: bool):
+        super().__init__(message)
+        self.per_user = per_user  # True: 사용자별 제한, False: 전체 제한
+
+
+@dataclass
+class OCRPage:
+    """작업에 포함된 이미지 한 장"""
+    index: int
+    filename: Optional[str]
+    mime_type: str
+    data: Optional[bytes]  # 처리 후 메모리 해제를 위해 None으로 비움
+    status: str = PENDING
+    attempts: int = 0
+    cached: bool = False
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "index": self.index,
+            "filename": self.filename,
+            "status": self.status,
+            "attempts": self.attempts,
+            "cached": self.cached,
+            "error": self.error,
+        }
+
+
+@dataclass
+class OCRJob:
+    """OCR 작업"""
+    id: str
+    club_id: int
+    user_id: int
+    pages: List[OCRPage]
+    created_at: Any = field(default_factory=utc_now)
+    finished_at: Any = None
+
+    @property
+    def status(self) -> str:
+        statuses = {page.status for page in self.pages}
+        if statuses <= {COMPLETED, FAILED}:
+            return COMPLETED if COMPLETED in statuses else FAILED
+        if statuses == {PENDING}:
+            return PENDING
+        return RUNNING
+
+    def merged_result(self) -> Optional[Dict[str, Any]]:
+        """완료된 페이지 결과를 페이지 순서대로 합침 (날짜/장소는 처음 나온 값)"""
+        results = [page.result for page in self.pages if page.result is not None]
+        if not results:
+            return None
+        return {
+            "date": next((r.get("date") for r in results if r.get("date")), None),
+            "location": next((r.get("location") for r in results if r.get("location")), None),
+            "matches": [match for r in results for match in r.get("matches", [])],
+        }
+
+
+class OCRJobQueue:
+    """OCR 작업 큐 + 워커 풀"""
+
+    def __init__(
+        self,
+        workers: int,
+        max_retries: int,
+        ttl: float,
+        retry_delay: float = 1.0,
+        max_pending: int = 50,
+        max_pending_per_user: int = 3,
+    ):
+        self.workers = max(workers, 1)
+        self.max_retries = max(max_retries, 0)
+        self.retry_delay = retry_delay
+        self.max_pending = max(max_pending, 1)
+        self.max_pending_per_user = max(max_pending_per_user, 1)
+        # 미완료 작업 (제거 대상 아님) / 완료 작업 (TTL 만료)
+        self._active: Dict[str, OCRJob] = {}
+        self._finished = TTLCache(maxsize=MAX_FINISHED_JOBS, ttl=ttl)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_workers(self) -> asyncio.Queue:
+        """현재 이벤트 루프에 워커가 없으면 생성 (최초 제출 시)"""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # 이전 루프의 큐에 남은 작업은 처리될 수 없으므로 제한 계산에서 제외
+            self._active.clear()
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            # 최초 제출 요청의 ContextVar(요청 캐시, 메트릭 집계 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+            self._tasks = [
+                loop.create_task(self._worker(i), name=f"ocr-worker-{i}", context=contextvars.Context())
+                for i in range(self.workers)
+            ]
+        return self._queue
+
+    def check_capacity(self, user_id: int) -> None:
+        """새 작업을 받을 수 있는지 확인 (업로드를 읽기 전에 호출 가능)"""
+        if sum(1 for job in self._active.values() if job.user_id == user_id) >= self.max_pending_per_user:
+            raise OCRJobLimitError(
+                f"처리 중인 작업이 너무 많습니다. 이전 작업이 끝난 뒤 다시 시도해주세요 "
+                f"(최대 {self.max_pending_per_user}개)",
+                per_user=True,
+            )
+        if len(self._active) >= self.max_pending:
+            raise OCRJobLimitError("서버의 추출 작업이 많습니다. 잠시 후 다시 시도해주세요", per_user=False)
+
+    async def submit(self, club_id: int, user_id: int, images: List[tuple]) -> OCRJob:
+        """
+        작업 제출
+
+        Args:
+            images: (파일명, MIME 타입, 바이트) 목록
+
+        Raises:
+            OCRJobLimitError: 사용자별/전체 미완료 작업 수 초과
+        """
+        queue = self._ensure_workers()
+        self.check_capacity(user_id)
+        job = OCRJob(
+            id=uuid.uuid4().hex,
+            club_id=club_id,
+            user_id=user_id,
+            pages=[
+                OCRPage(index=i, filename=filename, mime_type=mime_type, data=data)
+                for i, (filename, mime_type, data) in enumerate(images)
+            ],
+        )
+        self._active[job.id] = job
+        for page in job.pages:
+            queue.put_nowait((job, page))
+        logger.info(f"[OCR] 작업 제출 - job={job.id}, pages={len(job.pages)}")
+        return job
+
+    def get(self, job_id: str) -> Optional[OCRJob]:
+        job = self._active.get(job_id)
+        if job is not None:
+            return job
+        job = self._finished.get(job_id)
+        return None if job is MISSING else job
+
+    async def _worker(self, worker_index: int) -> None:
+        queue = self._queue
+        while True:
+            job, page = await queue.get()
+            try:
+                await self._process(job, page)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # 워커가 죽지 않도록 방어
+                logger.exception(f"[OCR] 워커 {worker_index} 처리 중 예기치 않은 오류")
+            finally:
+                queue.task_done()
+
+    async def _process(self, job: OCRJob, page: OCRPage) -> None:
+        from app.services.ocr_service import ocr_service
+
+        page.status = RUNNING
+        while True:
+            page.attempts += 1
+            try:
+                page.result, page.cached = await ocr_service.extract_with_cache(page.data, page.mime_type)
+                page.status = COMPLETED
+                page.error = None
+                break
+            except Exception as e:
+                page.error = str(e)
+                if not isinstance(e, RETRYABLE_ERRORS) or page.attempts > self.max_retries:
+                    page.status = FAILED
+                    logger.warning(f"[OCR] 작업 실패 - job={job.id}, page={page.index}, 시도={page.attempts}: {e}")
+                    break
+                logger.info(f"[OCR] 재시도 - job={job.id}, page={page.index}, 시도={page.attempts}: {e}")
+                await asyncio.sleep(self.retry_delay * page.attempts)
+
+        page.data = None
+        if job.status in (COMPLETED, FAILED):
+            job.finished_at = utc_now()
+            # 완료 시점부터 TTL 계산
+            self._active.pop(job.id, None)
+            self._finished.set(job.id, job)
+
+    async def join(self) -> None:
+        """대기 중인 작업이 모두 처리될 때까지 대기 (테스트/종료 시)"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def shutdown(self) -> None:
+        """워커 종료"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+        self._active.clear()
+
+
+def _create_queue() -> OCRJobQueue:
+    from app.config import settings
+    return OCRJobQueue(
+        workers=settings.OCR_JOB_WORKERS,
+        max_retries=settings.OCR_JOB_MAX_RETRIES,
+        ttl=settings.OCR_JOB_TTL_SECONDS,
+        max_pending=settings.OCR_JOB_MAX_PENDING,
+        max_pending_per_user=settings.OCR_JOB_MAX_PENDING_PER_USER,
+    )
+
+
+# 싱글톤 인스턴스
+ocr_job_queue = _create_queue()
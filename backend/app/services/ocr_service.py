@@ -4,9 +4,15 @@ Gemini API를 사용한 경기 결과지 OCR 서비스
 google-genai SDK 사용 (pip install google-genai)
 https://ai.google.dev/gemini-api/docs
 """
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
+
+from app.services.gemini_client import RETRYABLE_ERRORS, generate_content
+from app.services.image_preprocess import preprocess_image
+from app.services.ocr_cache import OCRResultCache, ocr_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -29,28 +35,10 @@ def _get_client():
     return _client
 
 
-class OCRService:
-    """경기 결과지 이미지에서 데이터를 추출하는 서비스"""
-
-    def __init__(self):
-        pass  # Lazy initialization - client created on first use
-
-    async def extract_match_results(self, image_data: bytes, mime_type: str = "image/jpeg") -> Dict[str, Any]:
-        """
-        이미지에서 경기 결과를 추출합니다.
-
-        Args:
-            image_data: 이미지 바이너리 데이터
-            mime_type: 이미지 MIME 타입
+# 프롬프트나 정규화 규칙이 바뀌면 버전을 올려 기존 캐시를 무효화
+OCR_PROMPT_VERSION = "gemini-2.5-flash:1"
 
-        Returns:
-            추출된 경기 결과 데이터
-        """
-        from google.genai import types
-
-        client = _get_client()
-
-        prompt = """
+OCR_PROMPT = """
 이 이미지는 테니스/배드민턴 경기 결과지입니다. 이미지에서 경기 결과 정보를 추출해주세요.
 
 다음 JSON 형식으로 결과를 반환해주세요:
@@ -84,16 +72,100 @@ class OCRService:
 JSON만 반환하고 다른 텍스트는 포함하지 마세요.
 """
 
-        import time as time_module
+
+class OCRService:
+    """경기 결과지 이미지에서 데이터를 추출하는 서비스"""
+
+    def __init__(self):
+        # Lazy initialization - client created on first use
+        self._cache: Optional[OCRResultCache] = None
+
+    @property
+    def cache(self) -> OCRResultCache:
+        """이미지 내용 기반 결과 캐시 (최초 사용 시 생성)"""
+        if self._cache is None:
+            from app.config import settings
+            self._cache = OCRResultCache(settings.OCR_CACHE_DIR, settings.OCR_CACHE_MAX_BYTES)
+        return self._cache
+
+    @cache.setter
+    def cache(self, value: OCRResultCache) -> None:
+        self._cache = value
+
+    async def extract_with_cache(
+        self,
+        image_data: bytes,
+        mime_type: str = "image/jpeg"
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        캐시를 확인한 뒤 없을 때만 Gemini로 추출합니다.
+
+        Returns:
+            (정규화된 추출 결과, 캐시 적중 여부)
+        """
+        from app.config import settings
+
+        # 전처리 설정이 바뀌면 추출 결과도 달라질 수 있으므로 키에 포함
+        key = ocr_cache_key(image_data, f"{OCR_PROMPT_VERSION}:{settings.OCR_IMAGE_MAX_DIMENSION}")
+        # 디스크 I/O(최초 조회 시 디렉터리 탐색 포함)는 워커 스레드에서 실행
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            logger.info(f"[OCR] 캐시 적중 - key={key[:12]}")
+            return cached, True
+
+        result = await self.extract_match_results(image_data, mime_type)
+        await asyncio.to_thread(self.cache.set, key, result)
+        return result, False
+
+    async def prepare_image(self, image_data: bytes, mime_type: str) -> Tuple[bytes, str]:
+        """
+        업로드 전 이미지 전처리 (EXIF 방향 보정, 축소, JPEG 재인코딩)
+
+        디코딩/인코딩은 CPU 작업이므로 워커 스레드에서 실행한다.
+        """
+        from app.config import settings
+
+        start_time = time.monotonic()
+        processed, processed_type = await asyncio.to_thread(
+            preprocess_image,
+            image_data,
+            mime_type,
+            settings.OCR_IMAGE_MAX_DIMENSION,
+            settings.OCR_IMAGE_JPEG_QUALITY,
+        )
+        logger.info(
+            f"[OCR] 이미지 전처리 - {len(image_data)}bytes({mime_type}) → "
+            f"{len(processed)}bytes({processed_type}), {time.monotonic() - start_time:.2f}초"
+        )
+        return processed, processed_type
+
+    async def extract_match_results(self, image_data: bytes, mime_type: str = "image/jpeg") -> Dict[str, Any]:
+        """
+        이미지에서 경기 결과를 추출합니다.
+
+        Args:
+            image_data: 이미지 바이너리 데이터
+            mime_type: 이미지 MIME 타입
+
+        Returns:
+            추출된 경기 결과 데이터
+        """
+        from google.genai import types
+
+        client = _get_client()
+        prompt = OCR_PROMPT
+        image_data, mime_type = await self.prepare_image(image_data, mime_type)
 
         result_text = ""
         try:
             logger.info(f"[OCR] Gemini API 요청 - model=gemini-2.5-flash, mime_type={mime_type}, image_size={len(image_data)}bytes")
-            start_time = time_module.time()
+            start_time = time.time()
 
             # google-genai SDK 사용 (최신 API 문서 기반)
             # https://ai.google.dev/gemini-api/docs/image-understanding
-            response = client.models.generate_content(
+            # 비동기 호출 (동시 호출 수 제한 + 타임아웃)
+            response = await generate_content(
+                client,
                 model='gemini-2.5-flash',  # 이미지 처리 지원, 저렴한 모델
                 contents=[
                     types.Part.from_bytes(data=image_data, mime_type=mime_type),
@@ -101,7 +173,7 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
                 ]
             )
 
-            elapsed = time_module.time() - start_time
+            elapsed = time.time() - start_time
             logger.info(f"[OCR] Gemini API 응답 수신 - {elapsed:.1f}초 소요")
 
             # 응답에서 JSON 추출
@@ -125,6 +197,9 @@ JSON만 반환하고 다른 텍스트는 포함하지 마세요.
             logger.info(f"[OCR] 정규화 완료 - 최종 {len(normalized.get('matches', []))}개 매치")
             return normalized
 
+        except RETRYABLE_ERRORS:
+            # 작업 큐가 재시도 여부를 판단할 수 있도록 그대로 전달
+            raise
         except json.JSONDecodeError as e:
             logger.error(f"[OCR] JSON 파싱 실패: {e}")
             logger.error(f"[OCR] 파싱 실패 원본: {result_text[:1000]}")
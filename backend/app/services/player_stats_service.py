@@ -0,0 +1,531 @@
+"""
+회원/게스트 통계 서비스
+
+누적 전적 (ClubMember/Guest의 total_games, wins, draws, losses):
+- 경기 결과가 등록/수정/삭제될 때 참가자별 승/무/패 증감분만 F 표현식으로 반영
+- 같은 증감분을 갖는 선수는 한 번의 UPDATE로 묶어서 처리
+- ranking_service.apply_outcome_changes에서 함께 호출된다 (트랜잭션은 호출자가 관리)
+
+파생 통계 (PlayerStatSummary):
+- 연승/연패, 최근 전적, 파트너/상대별 전적
+- 파트너/상대별 전적은 누적 전적처럼 증감분만 반영한다
+- 연승/연패, 최근 전적은 시간 순서에 의존하므로 바뀐 경기가 선수의 마지막 경기들일 때만
+  저장된 값에서 이어서 계산하고, 그 밖의 경우(과거 경기 수정, 결과 삭제 등)에만
+  해당 선수의 전체 기록으로 다시 계산한다
+
+전체 재계산:
+- rebuild_player_stats는 클럽의 모든 완료 경기를 다시 집계하여 누적 전적 drift를
+  점검/보정하고 모든 요약 행을 다시 만든다 (백필용)
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tortoise.expressions import F
+from tortoise.queryset import Q
+
+from app.core.timezone import utc_now
+from app.models.guest import Guest
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus, Team
+from app.models.member import ClubMember
+from app.models.ranking import PlayerStatSummary
+from app.services.ranking_service import DRAW, team_record
+
+MEMBER = "member"
+GUEST = "guest"
+
+# 최근 전적 표시 경기 수
+RECENT_FORM_LENGTH = 10
+
+# match_id__in 조회 1회당 최대 경기 수
+MATCH_BATCH_SIZE = 500
+
+# W/D/L → [승, 무, 패] 인덱스
+LETTER_INDEX = {"W": 0, "D": 1, "L": 2}
+
+# (MEMBER | GUEST, id) - 준회원(user)은 통계 대상이 아님
+PlayerKey = Tuple[str, int]
+
+SUMMARY_FIELDS = [
+    "current_streak", "longest_win_streak", "longest_loss_streak", "recent_form",
+    "partners", "opponents", "last_played_at", "last_updated",
+]
+
+
+def player_key_str(player: PlayerKey) -> str:
+    """JSON 키 형식 ("member:12", "guest:3")"""
+    return f"{player[0]}:{player[1]}"
+
+
+def _player_key(row: dict) -> Optional[PlayerKey]:
+    if row["club_member_id"]:
+        return MEMBER, row["club_member_id"]
+    if row["guest_id"]:
+        return GUEST, row["guest_id"]
+    return None
+
+
+async def load_match_players(match_ids: List[int]) -> Dict[int, List[Tuple[PlayerKey, str]]]:
+    """경기별 (선수, 팀) 목록 배치 조회"""
+    players = defaultdict(list)
+    for start in range(0, len(match_ids), MATCH_BATCH_SIZE):
+        rows = await MatchParticipant.filter(
+            match_id__in=match_ids[start:start + MATCH_BATCH_SIZE]
+        ).values("match_id", "club_member_id", "guest_id", "team")
+        for row in rows:
+            player = _player_key(row)
+            if player:
+                players[row["match_id"]].append((player, Team(row["team"]).value))
+    return players
+
+
+def _teammates(
+    entries: List[Tuple[PlayerKey, str]], player: PlayerKey, team: str
+) -> Tuple[List[str], List[str]]:
+    """경기 참가자 중 (파트너 키 목록, 상대 키 목록)"""
+    return (
+        [player_key_str(p) for p, t in entries if t == team and p != player],
+        [player_key_str(p) for p, t in entries if t != team],
+    )
+
+
+def _outcome_letter(outcome: str, team: str) -> str:
+    wins, draws, _ = team_record(outcome, team)
+    return "W" if wins else "D" if draws else "L"
+
+
+def _next_streak(streak: int, letter: str) -> int:
+    """직전 연승/연패에 경기 하나를 이어 붙인 값"""
+    if letter == "W":
+        return streak + 1 if streak > 0 else 1
+    if letter == "L":
+        return streak - 1 if streak < 0 else -1
+    return 0
+
+
+def _replay(letters: Iterable[str], streak: int = 0) -> Tuple[int, int, int]:
+    """
+    오래된 경기부터 W/D/L을 이어 붙여 (현재 연승/연패, 최장 연승, 최장 연패) 계산
+
+    최장 값은 이어 붙인 경기 시점들만 대상으로 한다.
+    """
+    longest_win = longest_loss = 0
+    for letter in letters:
+        streak = _next_streak(streak, letter)
+        longest_win = max(longest_win, streak)
+        longest_loss = max(longest_loss, -streak)
+    return streak, longest_win, longest_loss
+
+
+def summarize_timeline(timeline: List[Tuple]) -> dict:
+    """
+    한 선수의 경기 기록으로 누적 전적과 파생 통계 계산
+
+    Args:
+        timeline: (경기 시각, match_id, "W"/"D"/"L", 파트너 목록, 상대 목록)
+    """
+    counts = {"W": 0, "D": 0, "L": 0}
+    partners = defaultdict(lambda: [0, 0, 0])
+    opponents = defaultdict(lambda: [0, 0, 0])
+
+    ordered = sorted(timeline, key=lambda t: (t[0], t[1]))
+    for _, _, letter, partner_keys, opponent_keys in ordered:
+        counts[letter] += 1
+        for key in partner_keys:
+            partners[key][LETTER_INDEX[letter]] += 1
+        for key in opponent_keys:
+            opponents[key][LETTER_INDEX[letter]] += 1
+    streak, longest_win, longest_loss = _replay(t[2] for t in ordered)
+
+    recent = ordered[::-1][:RECENT_FORM_LENGTH]
+    return {
+        "total_games": len(timeline),
+        "wins": counts["W"],
+        "draws": counts["D"],
+        "losses": counts["L"],
+        "current_streak": streak,
+        "longest_win_streak": longest_win,
+        "longest_loss_streak": longest_loss,
+        "recent_form": "".join(t[2] for t in recent),
+        "partners": dict(partners),
+        "opponents": dict(opponents),
+        "last_played_at": max((t[0] for t in timeline), default=None),
+    }
+
+
+def _build_records(
+    results: List[dict],
+    match_players: Dict[int, List[Tuple[PlayerKey, str]]],
+    players: Iterable[PlayerKey],
+) -> Dict[PlayerKey, dict]:
+    """완료 경기 결과로 선수별 통계 계산 (기록이 없는 선수는 0으로 채움)"""
+    timelines = {player: [] for player in players}
+    for row in results:
+        outcome = Team(row["winner_team"]).value if row["winner_team"] else DRAW
+        entries = match_players.get(row["match_id"], [])
+        for player, team in entries:
+            if player not in timelines:
+                continue
+            timelines[player].append((
+                row["match__scheduled_datetime"],
+                row["match_id"],
+                _outcome_letter(outcome, team),
+                *_teammates(entries, player, team),
+            ))
+    return {player: summarize_timeline(timeline) for player, timeline in timelines.items()}
+
+
+async def apply_counter_deltas(deltas: Dict[PlayerKey, List[int]]) -> None:
+    """선수별 [승, 무, 패] 증감분을 ClubMember/Guest에 반영 (같은 증감분끼리 묶어서 UPDATE)"""
+    groups = defaultdict(list)
+    for (kind, player_id), delta in deltas.items():
+        if any(delta):
+            groups[(kind, tuple(delta))].append(player_id)
+
+    for (kind, (dw, dd, dl)), ids in groups.items():
+        model = ClubMember if kind == MEMBER else Guest
+        await model.filter(id__in=ids).update(
+            total_games=F("total_games") + (dw + dd + dl),
+            wins=F("wins") + dw,
+            draws=F("draws") + dd,
+            losses=F("losses") + dl,
+        )
+
+
+async def _save_summaries(club_id: int, records: Dict[PlayerKey, dict]) -> None:
+    """요약 행 bulk upsert (회원/게스트 각각 1회)"""
+    now = utc_now()
+    rows = {MEMBER: [], GUEST: []}
+    for (kind, player_id), record in records.items():
+        owner = {"club_member_id": player_id} if kind == MEMBER else {"guest_id": player_id}
+        rows[kind].append(PlayerStatSummary(
+            club_id=club_id,
+            **owner,
+            **{name: record[name] for name in SUMMARY_FIELDS if name != "last_updated"},
+            last_updated=now,
+        ))
+
+    for kind, conflict in ((MEMBER, "club_member_id"), (GUEST, "guest_id")):
+        if rows[kind]:
+            await PlayerStatSummary.bulk_create(
+                rows[kind], on_conflict=[conflict], update_fields=SUMMARY_FIELDS,
+            )
+
+
+def _players_filter(players: Iterable[PlayerKey], prefix: str = "") -> Q:
+    """선수 목록 조건 (회원/게스트 id IN)"""
+    member_ids = [i for kind, i in players if kind == MEMBER]
+    guest_ids = [i for kind, i in players if kind == GUEST]
+    return Q(**{f"{prefix}club_member_id__in": member_ids}) | Q(**{f"{prefix}guest_id__in": guest_ids})
+
+
+async def compute_player_records(players: Iterable[PlayerKey]) -> Dict[PlayerKey, dict]:
+    """지정한 선수들의 전체 완료 경기 기록으로 통계 계산 (참가자 조회는 MATCH_BATCH_SIZE 단위)"""
+    players = set(players)
+    if not players:
+        return {}
+
+    results = await MatchResult.filter(
+        _players_filter(players, prefix="match__participants__"),
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).distinct().values("match_id", "winner_team", "match__scheduled_datetime")
+
+    match_players = await load_match_players([row["match_id"] for row in results])
+    return _build_records(results, match_players, players)
+
+
+async def refresh_player_summaries(club_id: int, players: Iterable[PlayerKey]) -> None:
+    """선수들의 요약 행 재계산 (누적 전적 컬럼은 건드리지 않음)"""
+    records = await compute_player_records(players)
+    if records:
+        await _save_summaries(club_id, records)
+
+
+async def apply_player_outcome_changes(
+    club_id: int,
+    changes: Iterable[Tuple[int, Optional[str], Optional[str]]],
+) -> Set[PlayerKey]:
+    """
+    경기 결과 변경분을 회원/게스트 통계에 반영
+
+    Args:
+        changes: (match_id, 변경 전 결과, 변경 후 결과) 목록 - ranking_service.result_outcome() 값
+
+    Returns:
+        통계가 변경된 선수 목록
+    """
+    changes = [(m, before, after) for m, before, after in changes if before != after]
+    if not changes:
+        return set()
+
+    match_players = await load_match_players([m for m, _, _ in changes])
+
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for match_id, before, after in changes:
+        for player, team in match_players.get(match_id, []):
+            for outcome, sign in ((before, -1), (after, 1)):
+                if outcome is None:
+                    continue
+                record = team_record(outcome, team)
+                for i in range(3):
+                    deltas[player][i] += sign * record[i]
+
+    await apply_counter_deltas(deltas)
+
+    changed = {player for player, delta in deltas.items() if any(delta)}
+    await _update_summaries(club_id, changes, match_players, changed)
+    return changed
+
+
+def _adjust_records(records: dict, keys: List[str], letter: str, sign: int) -> None:
+    """파트너/상대별 [승, 무, 패]에 경기 하나를 더하거나 뺌 (0이 된 항목은 제거)"""
+    for key in keys:
+        counts = records.setdefault(key, [0, 0, 0])
+        counts[LETTER_INDEX[letter]] += sign
+        if not any(counts):
+            del records[key]
+
+
+def _rewind(summary: PlayerStatSummary, removed: List[str]) -> Optional[Tuple[int, int, int, str]]:
+    """
+    저장된 요약에서 마지막 경기들(removed, 오래된 순)을 걷어낸 상태 복원
+
+    Returns:
+        (연승/연패, 최장 연승, 최장 연패, 최근 전적) - 저장된 값만으로 알 수 없으면 None
+    """
+    form = summary.recent_form
+    if not removed:
+        return summary.current_streak, summary.longest_win_streak, summary.longest_loss_streak, form
+    if form[:len(removed)] != "".join(reversed(removed)):
+        return None
+
+    rest = form[len(removed):]
+    if len(form) < RECENT_FORM_LENGTH:
+        # 최근 전적에 전체 기록이 담겨 있음
+        return (*_replay(reversed(rest)), rest)
+
+    # 남은 최근 전적 안에서 연속 기록이 끊겨야 걷어낸 뒤의 연승/연패를 알 수 있다
+    run = len(rest) - len(rest.lstrip(rest[:1]))
+    if run == len(rest):
+        return None
+    streak = {"W": run, "L": -run, "D": 0}[rest[0]]
+
+    # 걷어낸 경기들이 최장 기록을 만들었다면 그 이전 최장 기록은 알 수 없다
+    _, tail_win, tail_loss = _replay(removed, streak)
+    if (tail_win and tail_win >= summary.longest_win_streak) or (
+        tail_loss and tail_loss >= summary.longest_loss_streak
+    ):
+        return None
+    return streak, summary.longest_win_streak, summary.longest_loss_streak, rest
+
+
+def _advance_summary(
+    summary: Optional[PlayerStatSummary],
+    items: List[Tuple],
+    recent_keys: List[Tuple],
+) -> Optional[dict]:
+    """
+    저장된 요약에 한 선수의 경기 결과 변경분 반영
+
+    Args:
+        items: ((경기 시각, match_id), 변경 전 W/D/L|None, 변경 후 W/D/L|None, 파트너 목록, 상대 목록)
+        recent_keys: 가장 이른 변경 경기 이후 선수의 완료 경기 (경기 시각, match_id) 목록
+
+    Returns:
+        저장할 요약 값 - 변경 경기가 선수의 마지막 경기들이 아니거나 복원할 수 없으면 None
+    """
+    if summary is None:
+        return None
+    items = sorted(items, key=lambda item: item[0])
+    changed_keys = {item[0] for item in items}
+    if any(key > items[0][0] for key in recent_keys if key not in changed_keys):
+        return None
+
+    removed = [before for _, before, _, _, _ in items if before]
+    added = [after for _, _, after, _, _ in items if after]
+    # 결과가 빠지면 직전 경기 시각과 최근 전적을 채울 수 없음
+    if len(added) < len(removed):
+        return None
+    state = _rewind(summary, removed)
+    if state is None:
+        return None
+
+    streak, longest_win, longest_loss, form = state
+    streak, tail_win, tail_loss = _replay(added, streak)
+    partners = {key: list(value) for key, value in (summary.partners or {}).items()}
+    opponents = {key: list(value) for key, value in (summary.opponents or {}).items()}
+    for _, before, after, partner_keys, opponent_keys in items:
+        for letter, sign in ((before, -1), (after, 1)):
+            if letter:
+                _adjust_records(partners, partner_keys, letter, sign)
+                _adjust_records(opponents, opponent_keys, letter, sign)
+
+    played = [key[0] for key, _, after, _, _ in items if after]
+    return {
+        "current_streak": streak,
+        "longest_win_streak": max(longest_win, tail_win),
+        "longest_loss_streak": max(longest_loss, tail_loss),
+        "recent_form": ("".join(reversed(added)) + form)[:RECENT_FORM_LENGTH],
+        "partners": partners,
+        "opponents": opponents,
+        "last_played_at": max(played, default=summary.last_played_at),
+    }
+
+
+async def _update_summaries(
+    club_id: int,
+    changes: List[Tuple[int, Optional[str], Optional[str]]],
+    match_players: Dict[int, List[Tuple[PlayerKey, str]]],
+    players: Set[PlayerKey],
+) -> None:
+    """
+    경기 결과 변경분으로 요약 행 갱신
+
+    저장된 요약과 가장 이른 변경 경기 이후의 완료 경기만 조회하므로 선수의 전체 기록 길이와
+    무관하다. 이어서 계산할 수 없는 선수만 compute_player_records로 다시 계산한다.
+    """
+    if not players:
+        return
+    scheduled = dict(await Match.filter(
+        id__in=[match_id for match_id, _, _ in changes]
+    ).values_list("id", "scheduled_datetime"))
+
+    items = defaultdict(list)
+    for match_id, before, after in changes:
+        entries = match_players.get(match_id, [])
+        for player, team in entries:
+            if player not in players:
+                continue
+            items[player].append((
+                (scheduled[match_id], match_id),
+                _outcome_letter(before, team) if before else None,
+                _outcome_letter(after, team) if after else None,
+                *_teammates(entries, player, team),
+            ))
+
+    summaries = {}
+    for summary in await PlayerStatSummary.filter(_players_filter(players)):
+        kind, player_id = (MEMBER, summary.club_member_id) if summary.club_member_id else (GUEST, summary.guest_id)
+        summaries[(kind, player_id)] = summary
+
+    rows = await MatchParticipant.filter(
+        _players_filter(players),
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+        match__scheduled_datetime__gte=min(scheduled.values()),
+    ).values("match_id", "club_member_id", "guest_id", "match__scheduled_datetime")
+    recent_keys = defaultdict(list)
+    for row in rows:
+        recent_keys[_player_key(row)].append((row["match__scheduled_datetime"], row["match_id"]))
+
+    records, fallback = {}, set()
+    for player in players:
+        record = _advance_summary(summaries.get(player), items[player], recent_keys[player])
+        if record is None:
+            fallback.add(player)
+        else:
+            records[player] = record
+    records.update(await compute_player_records(fallback))
+    if records:
+        await _save_summaries(club_id, records)
+
+
+async def rebuild_player_stats(club_id: int, dry_run: bool = False) -> dict:
+    """
+    클럽 회원/게스트 통계 전체 재계산 (백필 및 drift 보정, 트랜잭션은 호출자가 관리)
+
+    - 누적 전적은 저장된 값과 비교하여 다른 행만 보정한다
+    - dry_run=False이면 모든 요약 행을 다시 저장한다
+
+    Returns:
+        {"total_players", "drifted_member_ids", "drifted_guest_ids"}
+    """
+    results = await MatchResult.filter(
+        match__club_id=club_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).values("match_id", "winner_team", "match__scheduled_datetime")
+    match_players = await load_match_players([row["match_id"] for row in results])
+
+    counter_fields = ("total_games", "wins", "draws", "losses")
+    stored = {}
+    for kind, model in ((MEMBER, ClubMember), (GUEST, Guest)):
+        for row in await model.filter(club_id=club_id).values("id", *counter_fields):
+            stored[(kind, row["id"])] = tuple(row[name] for name in counter_fields)
+
+    records = _build_records(results, match_players, stored)
+
+    drifted = [
+        player for player, record in records.items()
+        if tuple(record[name] for name in counter_fields) != stored[player]
+    ]
+
+    if not dry_run:
+        groups = defaultdict(list)
+        for kind, player_id in drifted:
+            record = records[(kind, player_id)]
+            groups[(kind, tuple(record[name] for name in counter_fields))].append(player_id)
+        for (kind, values), ids in groups.items():
+            model = ClubMember if kind == MEMBER else Guest
+            await model.filter(id__in=ids).update(**dict(zip(counter_fields, values)))
+        await _save_summaries(club_id, records)
+
+    return {
+        "total_players": len(records),
+        "drifted_member_ids": sorted(i for kind, i in drifted if kind == MEMBER),
+        "drifted_guest_ids": sorted(i for kind, i in drifted if kind == GUEST),
+    }
+
+
+async def describe_summary(summary: Optional[PlayerStatSummary], limit: int = 5) -> dict:
+    """
+    요약 행을 응답용으로 변환
+
+    파트너/상대 전적은 경기 수가 많은 순으로 limit개까지, 이름을 붙여서 반환한다.
+    """
+    if summary is None:
+        return {
+            "current_streak": 0, "longest_win_streak": 0, "longest_loss_streak": 0,
+            "recent_form": "", "last_played_at": None, "partners": [], "opponents": [],
+        }
+
+    def top(records: dict) -> List[Tuple[str, List[int]]]:
+        return sorted(records.items(), key=lambda item: (-sum(item[1]), -item[1][0], item[0]))[:limit]
+
+    top_partners, top_opponents = top(summary.partners or {}), top(summary.opponents or {})
+    keys = [key for key, _ in top_partners + top_opponents]
+    member_ids = {int(key.split(":")[1]) for key in keys if key.startswith(MEMBER)}
+    guest_ids = {int(key.split(":")[1]) for key in keys if key.startswith(GUEST)}
+
+    names = {}
+    if member_ids:
+        for member in await ClubMember.filter(id__in=member_ids).prefetch_related("user"):
+            names[f"{MEMBER}:{member.id}"] = member.nickname or member.user.name
+    if guest_ids:
+        for guest in await Guest.filter(id__in=guest_ids).only("id", "name"):
+            names[f"{GUEST}:{guest.id}"] = guest.name
+
+    def describe(records: List[Tuple[str, List[int]]]) -> List[dict]:
+        result = []
+        for key, (wins, draws, losses) in records:
+            kind, player_id = key.split(":")
+            result.append({
+                "type": kind,
+                "id": int(player_id),
+                "name": names.get(key, "Unknown"),
+                "games": wins + draws + losses,
+                "wins": wins,
+                "draws": draws,
+                "losses": losses,
+            })
+        return result
+
+    return {
+        "current_streak": summary.current_streak,
+        "longest_win_streak": summary.longest_win_streak,
+        "longest_loss_streak": summary.longest_loss_streak,
+        "recent_form": summary.recent_form,
+        "last_played_at": summary.last_played_at,
+        "partners": describe(top_partners),
+        "opponents": describe(top_opponents),
+    }
@@ -0,0 +1,409 @@
+"""
+랭킹 계산 서비스
+
+증분 갱신:
+- 경기 결과가 등록/수정/삭제될 때 해당 경기 참가자의 Ranking에 승/무/패 증감분만 반영
+- 세션이 시즌에 속하면 SeasonRanking에도 같은 증감분을 반영
+- 세션의 시즌이 바뀌면 완료 경기의 SeasonRanking 반영분을 새 시즌으로 이동
+- 회원/게스트 누적 전적(player_stats_service)과 레이팅(rating_service)도 함께 갱신
+- 트랜잭션은 호출자가 관리한다 (결과 저장과 같은 트랜잭션에서 호출)
+- 변경 전 결과는 lock_match_outcome으로 경기 행을 잠근 뒤 같은 트랜잭션에서 읽는다
+  (동시 수정이 같은 변경 전 결과로 증감분을 두 번 반영하지 않도록)
+
+전체 재계산:
+- rebuild_club_rankings는 클럽의 모든 완료 경기를 다시 집계하여
+  증분 상태와 비교(drift 점검)하고, 필요하면 보정한다
+- rebuild_season_rankings는 시즌 경기를 단일 GROUP BY 쿼리로 집계한 뒤
+  SeasonRanking을 bulk upsert한다 (시즌 크기와 무관하게 고정 쿼리 수)
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tortoise.expressions import F
+from tortoise.functions import Count
+
+from app.core.timezone import utc_now
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus, Team
+from app.models.ranking import Ranking
+from app.models.season import SeasonRanking
+
+# 무승부 결과 표식 (winner_team이 None인 결과)
+DRAW = "draw"
+
+# 승점: 승리 3점, 무승부 1점
+WIN_POINTS = 3
+DRAW_POINTS = 1
+
+
+def result_outcome(match: Match, result: Optional[MatchResult]) -> Optional[str]:
+    """
+    랭킹에 반영되는 경기 결과를 반환
+
+    - "A" / "B": 승리 팀
+    - "draw": 무승부
+    - None: 랭킹 미반영 (결과 없음, 미완료, 삭제된 경기)
+    """
+    if result is None or match.is_deleted or match.status != MatchStatus.COMPLETED:
+        return None
+    if result.winner_team is None:
+        return DRAW
+    return Team(result.winner_team).value
+
+
+async def lock_match_outcome(match_id: int) -> Tuple[Match, Optional[MatchResult]]:
+    """
+    경기 행을 잠그고 경기/결과를 다시 조회 (트랜잭션 안에서 호출)
+
+    Returns:
+        (잠근 경기, 결과) - 변경 전 결과는 result_outcome(match, result)로 계산
+    """
+    match = await Match.select_for_update().get(id=match_id)
+    return match, await MatchResult.get_or_none(match_id=match_id)
+
+
+def team_record(outcome: str, team: str) -> Tuple[int, int, int]:
+    """결과와 팀으로부터 (승, 무, 패) 계산"""
+    if outcome == DRAW:
+        return 0, 1, 0
+    if outcome == team:
+        return 1, 0, 0
+    return 0, 0, 1
+
+
+def _stats_to_fields(wins: int, draws: int, losses: int) -> dict:
+    """승/무/패로부터 랭킹 필드 값 계산"""
+    return {
+        "total_matches": wins + draws + losses,
+        "wins": wins,
+        "draws": draws,
+        "losses": losses,
+        "points": wins * WIN_POINTS + draws * DRAW_POINTS,
+    }
+
+
+async def _load_member_teams(match_ids: List[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """경기별 (club_member_id, team) 목록 배치 조회"""
+    rows = await MatchParticipant.filter(
+        match_id__in=match_ids,
+        club_member_id__isnull=False
+    ).values("match_id", "club_member_id", "team")
+
+    teams = defaultdict(list)
+    for row in rows:
+        teams[row["match_id"]].append((row["club_member_id"], Team(row["team"]).value))
+    return teams
+
+
+async def apply_ranking_deltas(model, scope: dict, deltas: Dict[int, List[int]]) -> None:
+    """
+    회원별 [승, 무, 패] 증감분을 랭킹 테이블에 반영
+
+    기존 행은 F 표현식으로 원자적으로 갱신하고, 없는 행은 bulk_create로 생성한다.
+    """
+    deltas = {m: d for m, d in deltas.items() if any(d)}
+    if not deltas:
+        return
+
+    existing = set(await model.filter(
+        **scope, club_member_id__in=list(deltas)
+    ).values_list("club_member_id", flat=True))
+
+    now = utc_now()
+    new_rows = []
+    for member_id, (dw, dd, dl) in deltas.items():
+        if member_id in existing:
+            await model.filter(**scope, club_member_id=member_id).update(
+                total_matches=F("total_matches") + (dw + dd + dl),
+                wins=F("wins") + dw,
+                draws=F("draws") + dd,
+                losses=F("losses") + dl,
+                points=F("points") + (dw * WIN_POINTS + dd * DRAW_POINTS),
+                last_updated=now,
+            )
+        else:
+            # 기존 행 없이 음수 증감이 오면 drift 상태이므로 0으로 시작
+            new_rows.append(model(
+                **scope,
+                club_member_id=member_id,
+                **_stats_to_fields(max(dw, 0), max(dd, 0), max(dl, 0)),
+            ))
+
+    if new_rows:
+        await model.bulk_create(new_rows)
+
+
+async def apply_outcome_changes(
+    club_id: int,
+    season_id: Optional[int],
+    changes: Iterable[Tuple[int, Optional[str], Optional[str]]],
+) -> int:
+    """
+    경기 결과 변경분을 랭킹에 증분 반영
+
+    Args:
+        club_id: 클럽 ID
+        season_id: 경기가 속한 세션의 시즌 ID (없으면 SeasonRanking 미반영)
+        changes: (match_id, 변경 전 결과, 변경 후 결과) 목록
+                 결과 값은 result_outcome()의 반환값
+
+    Returns:
+        랭킹이 변경된 회원 수
+    """
+    changes = [(m, before, after) for m, before, after in changes if before != after]
+    if not changes:
+        return 0
+
+    member_teams = await _load_member_teams([m for m, _, _ in changes])
+
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for match_id, before, after in changes:
+        for member_id, team in member_teams.get(match_id, []):
+            for outcome, sign in ((before, -1), (after, 1)):
+                if outcome is None:
+                    continue
+                record = team_record(outcome, team)
+                for i in range(3):
+                    deltas[member_id][i] += sign * record[i]
+
+    await apply_ranking_deltas(Ranking, {"club_id": club_id}, deltas)
+    if season_id:
+        await apply_ranking_deltas(SeasonRanking, {"season_id": season_id}, deltas)
+
+    # 회원/게스트 누적 전적, 요약 통계, 레이팅도 같은 변경분으로 갱신
+    from app.services.player_stats_service import apply_player_outcome_changes
+    from app.services.rating_service import apply_rating_changes
+    await apply_player_outcome_changes(club_id, changes)
+    await apply_rating_changes(changes)
+
+    return sum(1 for d in deltas.values() if any(d))
+
+
+async def revert_session_outcomes(club_id: int, session_id: int, season_id: Optional[int]) -> int:
+    """
+    세션의 경기를 일괄 삭제하기 전에 해당 경기들의 랭킹 반영분을 되돌림
+
+    Returns:
+        랭킹이 변경된 회원 수
+    """
+    rows = await MatchResult.filter(
+        match__session_id=session_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).values("match_id", "winner_team")
+
+    changes = [
+        (row["match_id"], Team(row["winner_team"]).value if row["winner_team"] else DRAW, None)
+        for row in rows
+    ]
+    return await apply_outcome_changes(club_id, season_id, changes)
+
+
+async def move_session_season_outcomes(
+    session_id: int,
+    old_season_id: Optional[int],
+    new_season_id: Optional[int],
+) -> int:
+    """
+    세션의 시즌이 바뀔 때 완료 경기의 SeasonRanking 반영분을 새 시즌으로 이동
+
+    클럽 Ranking/누적 전적/레이팅은 시즌과 무관하므로 그대로 둔다.
+
+    Returns:
+        반영분이 이동된 회원 수
+    """
+    if old_season_id == new_season_id:
+        return 0
+
+    rows = await MatchResult.filter(
+        match__session_id=session_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).values("match_id", "winner_team")
+    if not rows:
+        return 0
+
+    member_teams = await _load_member_teams([row["match_id"] for row in rows])
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for row in rows:
+        outcome = Team(row["winner_team"]).value if row["winner_team"] else DRAW
+        for member_id, team in member_teams.get(row["match_id"], []):
+            record = team_record(outcome, team)
+            for i in range(3):
+                deltas[member_id][i] += record[i]
+
+    if old_season_id:
+        reverted = {member_id: [-v for v in delta] for member_id, delta in deltas.items()}
+        await apply_ranking_deltas(SeasonRanking, {"season_id": old_season_id}, reverted)
+    if new_season_id:
+        await apply_ranking_deltas(SeasonRanking, {"season_id": new_season_id}, deltas)
+    return sum(1 for d in deltas.values() if any(d))
+
+
+async def compute_club_stats(club_id: int) -> Dict[int, Dict[str, int]]:
+    """클럽의 모든 완료 경기를 집계하여 회원별 승/무/패 계산 (전체 재계산)"""
+    rows = await MatchResult.filter(
+        match__club_id=club_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).values("match_id", "winner_team")
+
+    outcomes = {
+        row["match_id"]: Team(row["winner_team"]).value if row["winner_team"] else DRAW
+        for row in rows
+    }
+
+    stats = defaultdict(lambda: {"wins": 0, "draws": 0, "losses": 0})
+    if not outcomes:
+        return stats
+
+    member_teams = await _load_member_teams(list(outcomes))
+    for match_id, outcome in outcomes.items():
+        for member_id, team in member_teams.get(match_id, []):
+            wins, draws, losses = team_record(outcome, team)
+            stats[member_id]["wins"] += wins
+            stats[member_id]["draws"] += draws
+            stats[member_id]["losses"] += losses
+
+    return stats
+
+
+async def rebuild_club_rankings(club_id: int, dry_run: bool = False) -> dict:
+    """
+    클럽 랭킹 전체 재계산 (증분 상태 점검 및 보정)
+
+    - 전체 경기 결과로 계산한 값과 저장된 Ranking을 비교하여 drift를 찾는다
+    - dry_run=False이면 drift가 있는 행만 보정한다 (트랜잭션은 호출자가 관리)
+
+    Returns:
+        {"total_members", "drifted_member_ids"}
+    """
+    stats = await compute_club_stats(club_id)
+    expected = {
+        member_id: _stats_to_fields(s["wins"], s["draws"], s["losses"])
+        for member_id, s in stats.items()
+    }
+
+    rankings = await Ranking.filter(club_id=club_id)
+    ranking_map = {r.club_member_id: r for r in rankings}
+    zero = _stats_to_fields(0, 0, 0)
+
+    drifted = []
+    for member_id in set(expected) | set(ranking_map):
+        fields = expected.get(member_id, zero)
+        ranking = ranking_map.get(member_id)
+        if ranking is None:
+            if fields != zero:
+                drifted.append(member_id)
+        elif any(getattr(ranking, key) != value for key, value in fields.items()):
+            drifted.append(member_id)
+
+    if not dry_run and drifted:
+        new_rows = []
+        for member_id in drifted:
+            fields = expected.get(member_id, zero)
+            ranking = ranking_map.get(member_id)
+            if ranking is None:
+                new_rows.append(Ranking(club_id=club_id, club_member_id=member_id, **fields))
+            else:
+                await Ranking.filter(id=ranking.id).update(last_updated=utc_now(), **fields)
+        if new_rows:
+            await Ranking.bulk_create(new_rows)
+
+    return {
+        "total_members": len(expected),
+        "drifted_member_ids": sorted(drifted),
+    }
+
+
+def assign_ranks(stats: Dict[int, dict]) -> Dict[int, int]:
+    """
+    승점 > 승 > 패(적을수록) 순으로 순위 계산
+
+    동률은 같은 순위를 갖고 다음 순위는 건너뛴다 (1, 2, 2, 4)
+    """
+    ordered = sorted(
+        stats.items(),
+        key=lambda item: (-item[1]["points"], -item[1]["wins"], item[1]["losses"])
+    )
+    ranks = {}
+    previous_key = None
+    current_rank = 0
+    for position, (member_id, fields) in enumerate(ordered, 1):
+        key = (fields["points"], fields["wins"], fields["losses"])
+        if key != previous_key:
+            current_rank = position
+            previous_key = key
+        ranks[member_id] = current_rank
+    return ranks
+
+
+async def compute_season_stats(season_id: int) -> Dict[int, dict]:
+    """
+    시즌 완료 경기의 회원별 랭킹 필드 계산
+
+    match_participants ⋈ match_results를 (회원, 팀, 승리팀)으로 GROUP BY 하여
+    한 번의 쿼리로 집계한다.
+    """
+    rows = await MatchParticipant.filter(
+        match__session__season_id=season_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+        match__result__id__isnull=False,
+        club_member_id__isnull=False,
+    ).annotate(
+        games=Count("id")
+    ).group_by(
+        "club_member_id", "team", "match__result__winner_team"
+    ).values("club_member_id", "team", "match__result__winner_team", "games")
+
+    records = defaultdict(lambda: [0, 0, 0])
+    for row in rows:
+        winner = row["match__result__winner_team"]
+        outcome = Team(winner).value if winner else DRAW
+        wins, draws, losses = team_record(outcome, Team(row["team"]).value)
+        record = records[row["club_member_id"]]
+        record[0] += wins * row["games"]
+        record[1] += draws * row["games"]
+        record[2] += losses * row["games"]
+
+    return {member_id: _stats_to_fields(*record) for member_id, record in records.items()}
+
+
+async def rebuild_season_rankings(season_id: int) -> Dict[int, dict]:
+    """
+    시즌 랭킹 전체 재계산 (트랜잭션은 호출자가 관리)
+
+    - 집계 1회 + SeasonRanking bulk upsert 1회 + 기록이 사라진 행 초기화 1회
+    - rank 필드까지 함께 저장
+
+    Returns:
+        회원별 랭킹 필드 (rank 포함)
+    """
+    stats = await compute_season_stats(season_id)
+    ranks = assign_ranks(stats)
+    now = utc_now()
+
+    if stats:
+        await SeasonRanking.bulk_create(
+            [
+                SeasonRanking(
+                    season_id=season_id,
+                    club_member_id=member_id,
+                    rank=ranks[member_id],
+                    last_updated=now,
+                    **fields,
+                )
+                for member_id, fields in stats.items()
+            ],
+            on_conflict=["season_id", "club_member_id"],
+            update_fields=["total_matches", "wins", "draws", "losses", "points", "rank", "last_updated"],
+        )
+
+    # 더 이상 경기 기록이 없는 회원의 기존 랭킹 초기화
+    await SeasonRanking.filter(season_id=season_id).exclude(
+        club_member_id__in=list(stats)
+    ).update(rank=None, last_updated=now, **_stats_to_fields(0, 0, 0))
+
+    for member_id, fields in stats.items():
+        fields["rank"] = ranks[member_id]
+    return stats
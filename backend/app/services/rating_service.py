@@ -0,0 +1,213 @@
+"""
+레이팅 서비스 (복식 팀 평균 Elo)
+
+계산:
+- 팀 레이팅 = 팀원 레이팅 평균 (준회원처럼 레이팅이 없는 선수는 INITIAL_RATING으로 계산)
+- 기대 승률 E = 1 / (1 + 10^((상대 팀 레이팅 - 팀 레이팅) / 400))
+- 변화량 = K × (실제 결과 - E), 실제 결과는 승 1 / 무 0.5 / 패 0
+- 첫 PROVISIONAL_GAMES 경기는 큰 K를 적용하여 빠르게 실력에 수렴
+
+증분 갱신:
+- 결과 등록 시 현재 레이팅으로 변화량을 계산하여 반영하고 MatchParticipant.rating_change에 기록
+- 결과 수정/삭제 시 기록된 변화량을 되돌린 뒤 (수정이면) 다시 계산
+- 이후 경기는 다시 계산하지 않으므로 과거 결과를 고치면 근사치가 된다
+  → replay_club_ratings로 클럽 전체 이력을 시간 순서대로 다시 재생하여 보정
+- ranking_service.apply_outcome_changes에서 함께 호출된다 (트랜잭션은 호출자가 관리)
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.models.guest import Guest
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus, Team
+from app.models.member import ClubMember
+from app.services.ranking_service import DRAW, team_record
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32
+PROVISIONAL_K_FACTOR = 48
+PROVISIONAL_GAMES = 10
+
+# bulk_update 한 번에 갱신할 행 수
+UPDATE_BATCH_SIZE = 500
+
+PARTICIPANT_FIELDS = ("id", "match_id", "club_member_id", "guest_id", "team", "rating_change")
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """rating 쪽의 기대 승률"""
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def team_rating(ratings: List[float]) -> float:
+    """팀 레이팅 (팀원 평균)"""
+    return sum(ratings) / len(ratings) if ratings else INITIAL_RATING
+
+
+def _actual_score(outcome: str, team: str) -> float:
+    wins, draws, _ = team_record(outcome, team)
+    return 1.0 if wins else 0.5 if draws else 0.0
+
+
+class _Players:
+    """참가자 → 레이팅을 갖는 선수 모델 (정회원/게스트) 조회, 준회원은 None"""
+
+    def __init__(self, members: Dict[int, ClubMember], guests: Dict[int, Guest]):
+        self.members = members
+        self.guests = guests
+
+    @classmethod
+    async def load(cls, participants: List[MatchParticipant]) -> "_Players":
+        member_ids = {p.club_member_id for p in participants if p.club_member_id}
+        guest_ids = {p.guest_id for p in participants if p.guest_id}
+        members = await ClubMember.filter(id__in=member_ids).only("id", "rating", "rating_games") if member_ids else []
+        guests = await Guest.filter(id__in=guest_ids).only("id", "rating", "rating_games") if guest_ids else []
+        return cls({m.id: m for m in members}, {g.id: g for g in guests})
+
+    def of(self, participant: MatchParticipant):
+        if participant.club_member_id:
+            return self.members.get(participant.club_member_id)
+        if participant.guest_id:
+            return self.guests.get(participant.guest_id)
+        return None
+
+
+def rate_match(participants: List[MatchParticipant], outcome: str, players: _Players) -> Dict[int, float]:
+    """
+    한 경기의 참가자별 레이팅 변화량 계산 (선수 레이팅은 변경하지 않음)
+
+    Args:
+        outcome: "A" / "B" / "draw"
+
+    Returns:
+        {participant_id: 변화량} - 레이팅이 없는 참가자는 제외
+    """
+    ratings = defaultdict(list)
+    for p in participants:
+        player = players.of(p)
+        ratings[Team(p.team).value].append(player.rating if player else INITIAL_RATING)
+    if len(ratings) < 2:
+        return {}
+
+    team_ratings = {team: team_rating(values) for team, values in ratings.items()}
+    changes = {}
+    for p in participants:
+        player = players.of(p)
+        if player is None:
+            continue
+        team = Team(p.team).value
+        opponent = Team.B.value if team == Team.A.value else Team.A.value
+        k = PROVISIONAL_K_FACTOR if player.rating_games < PROVISIONAL_GAMES else K_FACTOR
+        expected = expected_score(team_ratings[team], team_ratings[opponent])
+        changes[p.id] = round(k * (_actual_score(outcome, team) - expected), 2)
+    return changes
+
+
+def _apply(participants: List[MatchParticipant], changes: Dict[int, float], players: _Players) -> None:
+    """계산된 변화량을 선수 레이팅에 반영하고 참가자에 기록 (팀원 동시 적용)"""
+    for p in participants:
+        player = players.of(p)
+        if p.id in changes and player is not None:
+            player.rating = round(player.rating + changes[p.id], 2)
+            player.rating_games += 1
+            p.rating_change = changes[p.id]
+
+
+def _revert(participants: List[MatchParticipant], players: _Players) -> None:
+    """기록된 변화량을 되돌림 (기록이 없는 참가자는 건너뜀)"""
+    for p in participants:
+        player = players.of(p)
+        if p.rating_change is not None and player is not None:
+            player.rating = round(player.rating - p.rating_change, 2)
+            player.rating_games = max(player.rating_games - 1, 0)
+        p.rating_change = None
+
+
+async def _save(players: _Players, participants: List[MatchParticipant]) -> None:
+    fields = ["rating", "rating_games"]
+    if players.members:
+        await ClubMember.bulk_update(list(players.members.values()), fields, batch_size=UPDATE_BATCH_SIZE)
+    if players.guests:
+        await Guest.bulk_update(list(players.guests.values()), fields, batch_size=UPDATE_BATCH_SIZE)
+    if participants:
+        await MatchParticipant.bulk_update(participants, ["rating_change"], batch_size=UPDATE_BATCH_SIZE)
+
+
+async def apply_rating_changes(changes: Iterable[Tuple[int, Optional[str], Optional[str]]]) -> int:
+    """
+    경기 결과 변경분을 레이팅에 증분 반영
+
+    Args:
+        changes: (match_id, 변경 전 결과, 변경 후 결과) 목록 - ranking_service.result_outcome() 값
+
+    Returns:
+        레이팅이 변경된 경기 수
+    """
+    changes = [(m, before, after) for m, before, after in changes if before != after]
+    if not changes:
+        return 0
+    match_ids = [m for m, _, _ in changes]
+
+    participants = await MatchParticipant.filter(match_id__in=match_ids).only(*PARTICIPANT_FIELDS)
+    players = await _Players.load(participants)
+    by_match = defaultdict(list)
+    for p in participants:
+        by_match[p.match_id].append(p)
+
+    # 같은 요청에서 여러 경기가 바뀌면 경기 시간 순서대로 반영
+    scheduled = dict(await Match.filter(id__in=match_ids).values_list("id", "scheduled_datetime"))
+    changes.sort(key=lambda c: (scheduled.get(c[0]), c[0]))
+
+    for match_id, before, after in changes:
+        entries = by_match.get(match_id, [])
+        if before is not None:
+            _revert(entries, players)
+        if after is not None:
+            _apply(entries, rate_match(entries, after, players), players)
+
+    await _save(players, participants)
+    return len(changes)
+
+
+async def replay_club_ratings(club_id: int) -> dict:
+    """
+    클럽 전체 경기 이력을 시간 순서대로 다시 재생하여 레이팅 재계산 (트랜잭션은 호출자가 관리)
+
+    - 모든 회원/게스트를 INITIAL_RATING에서 시작
+    - 완료 경기 결과/참가자를 한 번에 불러와 메모리에서 순차 계산한 뒤 bulk_update로 저장
+      (쿼리 수는 경기 수와 무관하고 저장 행 수에 비례하는 배치 수만 늘어남)
+
+    Returns:
+        {"rated_matches", "total_players"}
+    """
+    results = await MatchResult.filter(
+        match__club_id=club_id,
+        match__status=MatchStatus.COMPLETED,
+        match__is_deleted=False,
+    ).values("match_id", "winner_team", "match__scheduled_datetime")
+    results.sort(key=lambda row: (row["match__scheduled_datetime"], row["match_id"]))
+
+    participants = await MatchParticipant.filter(match__club_id=club_id).only(*PARTICIPANT_FIELDS)
+
+    players = _Players(
+        {m.id: m for m in await ClubMember.filter(club_id=club_id).only("id", "rating", "rating_games")},
+        {g.id: g for g in await Guest.filter(club_id=club_id).only("id", "rating", "rating_games")},
+    )
+    for player in list(players.members.values()) + list(players.guests.values()):
+        player.rating = INITIAL_RATING
+        player.rating_games = 0
+
+    by_match = defaultdict(list)
+    for p in participants:
+        p.rating_change = None
+        by_match[p.match_id].append(p)
+
+    for row in results:
+        outcome = Team(row["winner_team"]).value if row["winner_team"] else DRAW
+        entries = by_match.get(row["match_id"], [])
+        _apply(entries, rate_match(entries, outcome, players), players)
+
+    await _save(players, participants)
+    return {
+        "rated_matches": len(results),
+        "total_players": len(players.members) + len(players.guests),
+    }
@@ -0,0 +1,43 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 목록/집계 API의 필터 + 정렬 조합에 맞춘 복합 인덱스
+    # 모든 조회가 is_deleted = false를 거는 테이블은 부분 인덱스로 삭제 행을 제외한다
+    # (경기/참가자 조회는 is_deleted 조건 없이 session_id/match_id로 조회하므로 전체 인덱스)
+    # 컬럼 정렬(DESC)이나 IS NOT NULL 조건이 없는 인덱스는 모델 Meta.indexes에도 같은 이름으로 선언되어 있다.
+    # 아래 인덱스는 Tortoise Index/PartialIndex로 표현할 수 없어 이 마이그레이션에만 있다:
+    # - idx_match_participants_member, idx_match_participants_guest (WHERE ... IS NOT NULL)
+    # - idx_sessions_season_start, idx_sessions_event_start, idx_seasons_club_start,
+    #   idx_events_club_created, idx_announcements_club_pinned (DESC 정렬 컬럼)
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_matches_session_status" ON "matches" ("session_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_session_participants_session" ON "session_participants" ("session_id");
+        CREATE INDEX IF NOT EXISTS "idx_match_participants_match" ON "match_participants" ("match_id", "team", "position");
+        CREATE INDEX IF NOT EXISTS "idx_match_participants_member" ON "match_participants" ("club_member_id") WHERE "club_member_id" IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS "idx_match_participants_guest" ON "match_participants" ("guest_id") WHERE "guest_id" IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS "idx_club_members_club_status" ON "club_members" ("club_id", "status") WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_sessions_season_start" ON "sessions" ("season_id", "start_datetime" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_sessions_event_start" ON "sessions" ("event_id", "start_datetime" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_seasons_club_start" ON "seasons" ("club_id", "start_date" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_events_club_created" ON "events" ("club_id", "created_at" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_guests_club" ON "guests" ("club_id") WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_announcements_club_pinned" ON "announcements" ("club_id", "is_pinned" DESC, "created_at" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_fee_payments_setting_period" ON "fee_payments" ("fee_setting_id", "target_year", "target_month");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_matches_session_status";
+        DROP INDEX IF EXISTS "idx_session_participants_session";
+        DROP INDEX IF EXISTS "idx_match_participants_match";
+        DROP INDEX IF EXISTS "idx_match_participants_member";
+        DROP INDEX IF EXISTS "idx_match_participants_guest";
+        DROP INDEX IF EXISTS "idx_club_members_club_status";
+        DROP INDEX IF EXISTS "idx_sessions_season_start";
+        DROP INDEX IF EXISTS "idx_sessions_event_start";
+        DROP INDEX IF EXISTS "idx_seasons_club_start";
+        DROP INDEX IF EXISTS "idx_events_club_created";
+        DROP INDEX IF EXISTS "idx_guests_club";
+        DROP INDEX IF EXISTS "idx_announcements_club_pinned";
+        DROP INDEX IF EXISTS "idx_fee_payments_setting_period";"""
@@ -0,0 +1,27 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # 세션/경기의 클럽을 비정규화 (event/season OR 조인 대신 club_id 인덱스로 조회)
+    # idx_matches_club_status는 Match Meta.indexes에도 선언되어 있고,
+    # idx_sessions_club_start는 DESC 정렬 컬럼을 Tortoise로 표현할 수 없어 이 마이그레이션에만 있다
+    return """
+        ALTER TABLE "sessions" ADD "club_id" INT REFERENCES "clubs" ("id") ON DELETE CASCADE;
+        ALTER TABLE "matches" ADD "club_id" INT REFERENCES "clubs" ("id") ON DELETE CASCADE;
+        UPDATE "sessions" SET "club_id" = COALESCE(
+            (SELECT "club_id" FROM "events" WHERE "events"."id" = "sessions"."event_id"),
+            (SELECT "club_id" FROM "seasons" WHERE "seasons"."id" = "sessions"."season_id")
+        );
+        UPDATE "matches" SET "club_id" = (
+            SELECT "club_id" FROM "sessions" WHERE "sessions"."id" = "matches"."session_id"
+        );
+        CREATE INDEX IF NOT EXISTS "idx_sessions_club_start" ON "sessions" ("club_id", "start_datetime" DESC) WHERE "is_deleted" = false;
+        CREATE INDEX IF NOT EXISTS "idx_matches_club_status" ON "matches" ("club_id", "status") WHERE "is_deleted" = false;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_sessions_club_start";
+        DROP INDEX IF EXISTS "idx_matches_club_status";
+        ALTER TABLE "sessions" DROP COLUMN "club_id";
+        ALTER TABLE "matches" DROP COLUMN "club_id";"""
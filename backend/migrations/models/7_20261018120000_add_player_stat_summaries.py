@@ -0,0 +1,28 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "player_stat_summaries" (
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "modified_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "is_deleted" BOOL NOT NULL DEFAULT False,
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "current_streak" INT NOT NULL DEFAULT 0,
+            "longest_win_streak" INT NOT NULL DEFAULT 0,
+            "longest_loss_streak" INT NOT NULL DEFAULT 0,
+            "recent_form" VARCHAR(10) NOT NULL DEFAULT '',
+            "partners" JSONB NOT NULL,
+            "opponents" JSONB NOT NULL,
+            "last_played_at" TIMESTAMPTZ,
+            "last_updated" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "club_id" INT NOT NULL REFERENCES "clubs" ("id") ON DELETE CASCADE,
+            "club_member_id" INT UNIQUE REFERENCES "club_members" ("id") ON DELETE CASCADE,
+            "guest_id" INT UNIQUE REFERENCES "guests" ("id") ON DELETE CASCADE
+        );
+        COMMENT ON TABLE "player_stat_summaries" IS '선수별 파생 통계 요약 (회원/게스트당 1행)';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "player_stat_summaries";"""
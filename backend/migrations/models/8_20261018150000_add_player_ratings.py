@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "club_members" ADD "rating" DOUBLE PRECISION NOT NULL DEFAULT 1500;
+        ALTER TABLE "club_members" ADD "rating_games" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "guests" ADD "rating" DOUBLE PRECISION NOT NULL DEFAULT 1500;
+        ALTER TABLE "guests" ADD "rating_games" INT NOT NULL DEFAULT 0;
+        ALTER TABLE "match_participants" ADD "rating_change" DOUBLE PRECISION;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "club_members" DROP COLUMN "rating";
+        ALTER TABLE "club_members" DROP COLUMN "rating_games";
+        ALTER TABLE "guests" DROP COLUMN "rating";
+        ALTER TABLE "guests" DROP COLUMN "rating_games";
+        ALTER TABLE "match_participants" DROP COLUMN "rating_change";"""
@@ -0,0 +1,14 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    # name__icontains는 UPPER(CAST("name" AS VARCHAR)) LIKE '%...%'로 변환되므로
+    # 같은 식에 트라이그램 GIN 인덱스를 만들어 순차 스캔을 피한다
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS "idx_clubs_name_trgm" ON "clubs" USING GIN ((UPPER(CAST("name" AS VARCHAR))) gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_clubs_name_trgm";"""
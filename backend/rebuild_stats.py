@@ -0,0 +1,45 @@
+"""
+회원/게스트 통계 및 레이팅 백필
+
+사용법:
+    python rebuild_stats.py            # 모든 클럽
+    python rebuild_stats.py 3 5        # 지정한 클럽만
+    python rebuild_stats.py --dry-run  # drift만 보고 (레이팅 재생 생략)
+"""
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from app.config import TORTOISE_ORM
+
+
+async def main(club_ids, dry_run):
+    from app.models.club import Club
+    from app.services.player_stats_service import rebuild_player_stats
+    from app.services.rating_service import replay_club_ratings
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        if not club_ids:
+            club_ids = await Club.all().order_by("id").values_list("id", flat=True)
+        for club_id in club_ids:
+            async with in_transaction():
+                report = await rebuild_player_stats(club_id, dry_run=dry_run)
+                ratings = None if dry_run else await replay_club_ratings(club_id)
+            print(
+                f"club {club_id}: players={report['total_players']}, "
+                f"drifted members={report['drifted_member_ids']}, guests={report['drifted_guest_ids']}"
+                + (f", rated matches={ratings['rated_matches']}" if ratings else "")
+            )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="회원/게스트 통계 및 레이팅 전체 재계산")
+    parser.add_argument("club_ids", nargs="*", type=int, help="대상 클럽 ID (생략 시 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="보정 없이 drift만 보고")
+    args = parser.parse_args()
+    asyncio.run(main(args.club_ids, args.dry_run))
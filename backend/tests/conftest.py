@@ -37,6 +37,14 @@ async def db() -> AsyncGenerator[None, None]:
         modules={"models": ["app.models"]},
     )
     await Tortoise.generate_schemas()
+    # 프로세스 단위 권한 캐시는 테스트 DB마다 초기화 (ID 재사용으로 인한 오염 방지)
+    from app.core.dependencies import clear_permission_cache, clear_user_cache
+    from app.core.security import clear_token_cache
+    from app.services.club_listing_service import invalidate_club_listing
+    clear_permission_cache()
+    clear_user_cache()
+    clear_token_cache()
+    invalidate_club_listing()
     yield
     await Tortoise.close_connections()
 
@@ -134,3 +142,50 @@ def mock_current_user(test_user):
     dependencies.get_current_active_user = mock_get_user
     yield test_user
     dependencies.get_current_active_user = original
+
+
+@pytest.fixture
+def capture_sql():
+    """
+    실행된 SQL 문 수집 (트랜잭션 내부 포함)
+
+    사용법:
+        with capture_sql() as statements:
+            await ...
+        assert len(statements) == N
+    """
+    from contextlib import ExitStack, contextmanager
+    from unittest.mock import patch
+    from tortoise.backends.sqlite.client import SqliteClient, TransactionWrapper
+
+    @contextmanager
+    def capture():
+        statements = []
+
+        def wrap(original):
+            async def wrapper(self, query, *args, **kwargs):
+                statements.append(query)
+                return await original(self, query, *args, **kwargs)
+            return wrapper
+
+        with ExitStack() as stack:
+            for cls in (SqliteClient, TransactionWrapper):
+                for name in ("execute_insert", "execute_many", "execute_query", "execute_query_dict"):
+                    if name in vars(cls):
+                        stack.enter_context(patch.object(cls, name, wrap(vars(cls)[name])))
+            yield statements
+
+    return capture
+
+
+@pytest.fixture(autouse=True)
+def isolated_ocr_cache(tmp_path):
+    """OCR 결과 캐시를 테스트별 임시 디렉터리로 분리"""
+    from app.services.ocr_cache import OCRResultCache
+    from app.services.ocr_service import ocr_service
+
+    cache = OCRResultCache(str(tmp_path / "ocr-cache"), max_bytes=1024 * 1024)
+    original = ocr_service._cache
+    ocr_service.cache = cache
+    yield cache
+    ocr_service._cache = original
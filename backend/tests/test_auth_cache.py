@@ -0,0 +1,66 @@
+"""
+인증 캐시 테스트 (토큰 검증 캐시 / 사용자 스냅샷 캐시)
+"""
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from app.core import security
+from app.core.security import create_access_token, create_refresh_token, verify_access_token
+from app.models.user import User
+
+
+class TestAccessTokenCache:
+    """토큰 검증 캐시 테스트"""
+
+    def test_cached_token_skips_decode(self):
+        token = create_access_token(7)
+        assert verify_access_token(token) == 7
+
+        with patch.object(security, "decode_token") as decode:
+            assert verify_access_token(token) == 7
+        decode.assert_not_called()
+
+    def test_expired_cached_token_rejected(self):
+        token = create_access_token(8, expires_delta=timedelta(seconds=30))
+        assert verify_access_token(token) == 8
+
+        with patch.object(security.time, "time", return_value=security.time.time() + 60):
+            assert verify_access_token(token) is None
+
+    def test_refresh_token_not_accepted(self):
+        assert verify_access_token(create_refresh_token(9)) is None
+
+
+@pytest.mark.asyncio
+class TestUserCache:
+    """사용자 스냅샷 캐시 테스트"""
+
+    async def test_authenticated_get_skips_user_query(self, client, test_user):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        assert (await client.get("/api/auth/me", cookies=cookies)).status_code == 200
+
+        with patch.object(User, "get_or_none") as user_query:
+            response = await client.get("/api/auth/me", cookies=cookies)
+        assert response.status_code == 200
+        user_query.assert_not_called()
+
+    async def test_update_me_invalidates(self, client, test_user):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        await client.get("/api/auth/me", cookies=cookies)
+
+        response = await client.put("/api/auth/me", json={"name": "새이름"}, cookies=cookies)
+        assert response.status_code == 200
+
+        response = await client.get("/api/auth/me", cookies=cookies)
+        assert response.json()["name"] == "새이름"
+
+    async def test_deleted_user_after_invalidation(self, client, test_user):
+        from app.core.dependencies import invalidate_user_cache
+
+        cookies = {"access_token": create_access_token(test_user.id)}
+        await client.get("/api/auth/me", cookies=cookies)
+        await User.filter(id=test_user.id).update(is_deleted=True)
+        invalidate_user_cache(test_user.id)
+
+        assert (await client.get("/api/auth/me", cookies=cookies)).status_code == 401
@@ -0,0 +1,255 @@
+"""
+경기 기록 재생 벤치마크 (기본 실행에서 제외)
+
+실행:
+    pytest -m benchmark -s tests/test_benchmarks.py
+
+합성 클럽(기본 회원 500명, 세션 5,000개, 경기 50,000개)을 만든 뒤
+랭킹/매칭/점수 입력/OCR 저장 경로의 소요 시간과 쿼리 수를 측정하여 JSON으로 저장한다.
+
+환경 변수:
+- BENCHMARK_SCALE: 데이터 규모 배율 (기본 1.0, 빠른 확인은 0.02 정도)
+- BENCHMARK_REPEAT: 측정 반복 횟수 (기본 3)
+- BENCHMARK_OUTPUT: 결과 JSON 경로 (기본 .benchmarks/results.json)
+- BENCHMARK_BASELINE: 이전 결과 JSON 경로 - 지정하면 쿼리 수가 늘어난 경로가 있을 때 실패
+
+test_hot_filter_indexes는 같은 데이터에서 인덱스 마이그레이션 적용 전후의
+실행 계획(EXPLAIN QUERY PLAN)과 소요 시간을 indexes.json으로 저장한다.
+"""
+import json
+import os
+import random
+import statistics
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from tortoise import connections
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.user import User
+from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+from app.models.season import Season, SeasonStatus
+from app.models.event import Session, SessionParticipant, SessionStatus
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus, MatchType, Team
+from tests.test_indexes import HOT_QUERIES, apply_index_migration, explain
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.asyncio]
+
+SCALE = float(os.getenv("BENCHMARK_SCALE", "1.0"))
+REPEAT = int(os.getenv("BENCHMARK_REPEAT", "3"))
+OUTPUT = Path(os.getenv("BENCHMARK_OUTPUT", ".benchmarks/results.json"))
+BASELINE = os.getenv("BENCHMARK_BASELINE")
+
+MEMBER_COUNT = max(int(500 * SCALE), 16)
+SESSION_COUNT = max(int(5000 * SCALE), 4)
+MATCHES_PER_SESSION = 10
+SEASON_COUNT = 10
+BATCH_SIZE = 1000
+
+
+async def _seed(club) -> dict:
+    """합성 클럽 데이터 일괄 생성 (bulk_create)"""
+    rng = random.Random(42)
+    now = utc_now()
+
+    await User.bulk_create([
+        User(email=f"bench{i}@test.com", cognito_sub=f"bench-sub-{i}", name=f"선수{i:04d}")
+        for i in range(MEMBER_COUNT)
+    ], batch_size=BATCH_SIZE)
+    user_ids = await User.filter(email__startswith="bench").order_by("id").values_list("id", flat=True)
+    await ClubMember.bulk_create([
+        ClubMember(club=club, user_id=user_id, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE,
+                   gender=Gender.MALE)
+        for user_id in user_ids
+    ], batch_size=BATCH_SIZE)
+    member_ids = await ClubMember.filter(user_id__in=user_ids).order_by("id").values_list("id", flat=True)
+
+    start = now.date() - timedelta(days=SESSION_COUNT)
+    await Season.bulk_create([
+        Season(club=club, name=f"시즌{i}", start_date=start, end_date=now.date(), status=SeasonStatus.COMPLETED)
+        for i in range(SEASON_COUNT)
+    ])
+    season_ids = await Season.filter(club=club).order_by("id").values_list("id", flat=True)
+
+    await Session.bulk_create([
+        Session(
+            club=club, season_id=season_ids[i % SEASON_COUNT], title=f"세션{i}",
+            start_datetime=now - timedelta(days=SESSION_COUNT - i),
+            end_datetime=now - timedelta(days=SESSION_COUNT - i) + timedelta(hours=3),
+            num_courts=4, match_duration_minutes=30, status=SessionStatus.COMPLETED,
+        )
+        for i in range(SESSION_COUNT)
+    ], batch_size=BATCH_SIZE)
+    sessions = await Session.filter(season_id__in=season_ids).order_by("id").values_list("id", "start_datetime")
+
+    await Match.bulk_create([
+        Match(
+            club=club, session_id=session_id, match_number=n + 1, court_number=n % 4 + 1,
+            scheduled_datetime=start_datetime + timedelta(minutes=30 * (n // 4)),
+            match_type=MatchType.MENS_DOUBLES, status=MatchStatus.COMPLETED,
+        )
+        for session_id, start_datetime in sessions
+        for n in range(MATCHES_PER_SESSION)
+    ], batch_size=BATCH_SIZE)
+    match_ids = await Match.all().order_by("id").values_list("id", flat=True)
+
+    participants, results = [], []
+    for match_id in match_ids:
+        players = rng.sample(member_ids, 4)
+        for index, member_id in enumerate(players):
+            participants.append(MatchParticipant(
+                match_id=match_id, club_member_id=member_id,
+                team=Team.A if index < 2 else Team.B, position=index % 2 + 1,
+            ))
+        score_a, score_b = rng.choice([(6, 3), (4, 6), (6, 6), (6, 1), (2, 6)])
+        winner = Team.A if score_a > score_b else Team.B if score_b > score_a else None
+        results.append(MatchResult(
+            match_id=match_id, team_a_score=score_a, team_b_score=score_b, sets_detail={}, winner_team=winner,
+        ))
+    await MatchParticipant.bulk_create(participants, batch_size=BATCH_SIZE)
+    await MatchResult.bulk_create(results, batch_size=BATCH_SIZE)
+
+    return {
+        "member_ids": list(member_ids),
+        "season_ids": list(season_ids),
+        "session_ids": [session_id for session_id, _ in sessions],
+    }
+
+
+async def _run(capture_sql, step) -> dict:
+    """step을 REPEAT회 실행하여 소요 시간(ms)과 마지막 실행의 쿼리 수 기록"""
+    timings, queries = [], 0
+    for _ in range(REPEAT):
+        with capture_sql() as statements:
+            started = time.perf_counter()
+            response = await step()
+            timings.append(round((time.perf_counter() - started) * 1000, 2))
+        assert response.status_code < 300, response.text
+        queries = len(statements)
+    return {
+        "runs_ms": timings,
+        "min_ms": min(timings),
+        "median_ms": statistics.median(timings),
+        "queries": queries,
+    }
+
+
+async def test_match_history_replay(client, capture_sql, test_club, test_user, test_member):
+    cookies = {"access_token": create_access_token(test_user.id)}
+    api = f"/api/clubs/{test_club.id}"
+
+    started = time.perf_counter()
+    data = await _seed(test_club)
+    seed_seconds = round(time.perf_counter() - started, 2)
+
+    season_id = data["season_ids"][0]
+    scored_session = data["session_ids"][-1]
+    score_matches = await Match.filter(session_id=scored_session).order_by("match_number")
+
+    # 경기 생성 대상: 참가자 16명, 경기 없는 세션
+    now = utc_now()
+    target = await Session.create(
+        season_id=season_id, title="생성 대상", start_datetime=now, end_datetime=now + timedelta(hours=3),
+        num_courts=4, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+    await SessionParticipant.bulk_create([
+        SessionParticipant(session=target, club_member_id=member_id) for member_id in data["member_ids"][:16]
+    ])
+    names = [f"선수{i:04d}" for i in range(4)]
+    rng = random.Random(7)
+
+    steps = {
+        "update_rankings": lambda: client.post(f"{api}/rankings/update", cookies=cookies),
+        "calculate_season_rankings": lambda: client.post(
+            f"{api}/seasons/{season_id}/rankings/calculate", cookies=cookies),
+        "session_detail": lambda: client.get(f"{api}/sessions/{scored_session}", cookies=cookies),
+        "list_sessions": lambda: client.get(f"{api}/sessions?season_id={season_id}&page_size=50", cookies=cookies),
+        "generate_matches": lambda: client.post(f"{api}/sessions/{target.id}/matches/generate", cookies=cookies),
+        "generate_matches_local": lambda: client.post(
+            f"{api}/sessions/{target.id}/matches/generate-ai", json={"engine": "local"}, cookies=cookies),
+        "bulk_scores": lambda: client.put(
+            f"{api}/sessions/{scored_session}/matches/bulk-scores",
+            json={"scores": [
+                {"match_id": m.id, "team_a_score": rng.randint(0, 6), "team_b_score": rng.randint(0, 6)}
+                for m in score_matches
+            ]},
+            cookies=cookies),
+        "ocr_save": lambda: client.post(
+            f"{api}/ocr/save-matches",
+            json={"session_id": scored_session, "matches": [{
+                "match_type": "mens_doubles", "court_number": court,
+                "team_a": {"players": names[:2], "score": 6},
+                "team_b": {"players": names[2:], "score": 4},
+            } for court in range(1, 5)]},
+            cookies=cookies),
+        "rebuild_player_stats": lambda: client.post(f"{api}/player-stats/rebuild", cookies=cookies),
+        "replay_ratings": lambda: client.post(f"{api}/ratings/replay", cookies=cookies),
+    }
+
+    results = {}
+    for name, step in steps.items():
+        results[name] = await _run(capture_sql, step)
+
+    report = {
+        "scale": SCALE,
+        "repeat": REPEAT,
+        "dataset": {
+            "members": MEMBER_COUNT,
+            "sessions": SESSION_COUNT,
+            "matches": SESSION_COUNT * MATCHES_PER_SESSION,
+            "seed_seconds": seed_seconds,
+        },
+        "results": results,
+    }
+    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if BASELINE:
+        baseline = json.loads(Path(BASELINE).read_text())["results"]
+        regressions = {
+            name: (baseline[name]["queries"], result["queries"])
+            for name, result in results.items()
+            if name in baseline and result["queries"] > baseline[name]["queries"]
+        }
+        assert not regressions, f"쿼리 수 증가 (기준, 현재): {regressions}"
+
+
+async def _time_query(db, sql: str) -> float:
+    timings = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        await db.execute_query(sql)
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+async def test_hot_filter_indexes(db, test_club, test_user, test_member):
+    await _seed(test_club)
+    conn = connections.get("default")
+
+    report = {}
+    for phase in ("before", "after"):
+        if phase == "after":
+            await apply_index_migration(conn)
+            await conn.execute_script("ANALYZE;")
+        for name, (build, _) in HOT_QUERIES.items():
+            queryset = build()
+            report.setdefault(name, {})[phase] = {
+                "plan": await explain(conn, queryset),
+                "median_ms": await _time_query(conn, queryset.sql()),
+            }
+
+    output = OUTPUT.with_name("indexes.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"scale": SCALE, "repeat": REPEAT, "queries": report}, ensure_ascii=False, indent=2))
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    unindexed = {
+        name: result["after"]["plan"] for name, result in report.items()
+        if HOT_QUERIES[name][1] not in result["after"]["plan"]
+    }
+    assert not unindexed, f"인덱스를 사용하지 않는 쿼리: {unindexed}"
@@ -0,0 +1,92 @@
+"""
+참가자 일괄 추가 테스트
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.user import User
+from app.models.guest import Guest
+from app.models.member import ClubMember, Gender, MemberRole, MemberStatus
+from app.models.event import Event, EventType, Session, SessionStatus, SessionParticipant, ParticipantCategory
+
+
+async def _create_session(club) -> Session:
+    now = utc_now()
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    return await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+
+
+async def _create_members(club, count: int):
+    members = []
+    for i in range(count):
+        user = await User.create(email=f"bulk{i}@test.com", cognito_sub=f"bulk-sub-{i}", name=f"회원{i}")
+        members.append(await ClubMember.create(
+            club=club, user=user, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        ))
+    return members
+
+
+@pytest.mark.asyncio
+class TestBulkParticipants:
+    """참가자 일괄 추가 테스트"""
+
+    async def test_mixed_payload_outcomes(self, client, test_club, test_user, test_member):
+        session = await _create_session(test_club)
+        members = await _create_members(test_club, 3)
+        await SessionParticipant.create(session=session, club_member=members[0])
+        guest = await Guest.create(club=test_club, name="손님", gender=Gender.FEMALE)
+        associate = await User.create(email="assoc@test.com", cognito_sub="assoc-sub", name="준회원")
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/sessions/{session.id}/participants/bulk",
+            json={
+                "member_ids": [members[0].id, members[1].id, members[2].id, members[2].id, 99999],
+                "guest_ids": [guest.id],
+                "user_ids": [associate.id, test_user.id],
+                "participation_type": "mixed_doubles",
+            },
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data["added"] == 4
+        assert data["skipped"] == 4
+        assert [r["status"] for r in data["results"]] == [
+            "already_joined", "added", "added", "duplicate", "not_found",
+            "added",
+            "added", "is_member",
+        ]
+
+        rows = await SessionParticipant.filter(session=session).values(
+            "club_member_id", "guest_id", "user_id", "participant_category", "participation_type"
+        )
+        assert len(rows) == 5
+        assert {r["guest_id"] for r in rows if r["participant_category"] == ParticipantCategory.GUEST} == {guest.id}
+        assert {r["user_id"] for r in rows if r["participant_category"] == ParticipantCategory.ASSOCIATE} == {associate.id}
+
+    async def test_query_count_independent_of_roster_size(self, db, test_club, test_user, test_member):
+        from unittest.mock import patch
+        from tortoise import Tortoise
+        from app.api.sessions import add_participants_bulk, BulkParticipantsAdd
+
+        members = await _create_members(test_club, 12)
+        counts = []
+        for roster in (members[:2], members):
+            session = await _create_session(test_club)
+            connection = Tortoise.get_connection("default")
+            with patch.object(connection, "execute_query_dict", wraps=connection.execute_query_dict) as select_spy, \
+                    patch.object(connection, "execute_many", wraps=connection.execute_many) as insert_spy:
+                result = await add_participants_bulk(
+                    test_club.id, session.id, BulkParticipantsAdd(member_ids=[m.id for m in roster]), test_member
+                )
+            assert result["added"] == len(roster)
+            counts.append((select_spy.call_count, insert_spy.call_count))
+
+        assert counts[0] == counts[1]
+        assert counts[1][1] == 1
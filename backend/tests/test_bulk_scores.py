@@ -0,0 +1,84 @@
+"""
+점수 일괄 입력 테스트
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+from app.models.ranking import PlayerStatSummary, Ranking
+
+
+async def _create_session_with_matches(club, member, match_count: int):
+    now = utc_now()
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    session = await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+    matches = []
+    for number in range(1, match_count + 1):
+        match = await Match.create(
+            session=session, match_number=number, court_number=1, scheduled_datetime=now,
+            match_type=MatchType.MENS_DOUBLES, status=MatchStatus.SCHEDULED,
+        )
+        await MatchParticipant.create(match=match, club_member=member, team=Team.A, position=1)
+        matches.append(match)
+    return session, matches
+
+
+@pytest.mark.asyncio
+class TestBulkScores:
+    """점수 일괄 입력 테스트"""
+
+    async def test_upsert_and_rankings(self, client, test_club, test_user, test_member):
+        session, matches = await _create_session_with_matches(test_club, test_member, 3)
+        # 기존 결과 (A 승) → B 승으로 수정되어야 함
+        await MatchResult.create(
+            match=matches[0], team_a_score=6, team_b_score=2, sets_detail={"sets": [[6, 2]]},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+
+        response = await client.put(
+            f"/api/clubs/{test_club.id}/sessions/{session.id}/matches/bulk-scores",
+            json={"scores": [
+                {"match_id": matches[0].id, "team_a_score": 3, "team_b_score": 6},
+                {"match_id": matches[1].id, "team_a_score": 6, "team_b_score": 1},
+                {"match_id": matches[2].id, "team_a_score": -1, "team_b_score": 6},
+                {"match_id": 99999, "team_a_score": 6, "team_b_score": 0},
+            ]},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"updated": 2, "skipped": 2}
+
+        first = await MatchResult.get(match_id=matches[0].id)
+        assert (first.team_a_score, first.team_b_score, first.winner_team) == (3, 6, Team.B)
+        assert first.sets_detail == {"sets": [[6, 2]]}
+
+        statuses = await Match.filter(session=session).order_by("match_number").values_list("status", flat=True)
+        assert statuses == [MatchStatus.COMPLETED, MatchStatus.COMPLETED, MatchStatus.SCHEDULED]
+
+        # 첫 경기는 결과가 기존 SCHEDULED 상태에서 기록되었으므로 랭킹 미반영 → 이번에 반영
+        ranking = await Ranking.get(club_id=test_club.id, club_member_id=test_member.id)
+        assert (ranking.wins, ranking.losses) == (1, 1)
+
+    async def test_fixed_statement_count(self, db, capture_sql, test_club, test_user, test_member):
+        from app.api.sessions import update_matches_bulk_scores, BulkScoresUpdate, BulkScoreItem
+
+        counts = []
+        for match_count in (2, 10):
+            session, matches = await _create_session_with_matches(test_club, test_member, match_count)
+            data = BulkScoresUpdate(scores=[
+                BulkScoreItem(match_id=m.id, team_a_score=6, team_b_score=4) for m in matches
+            ])
+            with capture_sql() as statements:
+                result = await update_matches_bulk_scores(test_club.id, session.id, data, test_member)
+            assert result["updated"] == match_count
+            counts.append(len(statements))
+            await Ranking.filter(club_id=test_club.id).delete()
+            await PlayerStatSummary.filter(club_id=test_club.id).delete()
+
+        assert counts[0] == counts[1]
@@ -0,0 +1,80 @@
+"""
+동호회 목록/검색 캐시 테스트
+"""
+import pytest
+
+from app.core.security import create_access_token
+from app.models.club import Club
+from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+from app.models.user import User
+
+
+async def _other_user():
+    user = await User.create(email="other@test.com", cognito_sub="other-sub", name="다른 사용자")
+    return user, {"access_token": create_access_token(user.id)}
+
+
+@pytest.mark.asyncio
+class TestClubListingCache:
+    """검색어/페이지별 캐시와 무효화"""
+
+    async def test_cached_page_skips_aggregate_query(self, client, capture_sql, test_club, test_user, test_member):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        first = await client.get("/api/clubs?search=테스트", cookies=cookies)
+
+        with capture_sql() as statements:
+            second = await client.get("/api/clubs?search=테스트", cookies=cookies)
+
+        assert second.json() == first.json()
+        assert first.json()[0]["member_count"] == 1
+        # 클럽 목록/회원수 집계는 캐시, 내 멤버십 조회만 실행
+        assert not any('COUNT' in sql.upper() for sql in statements)
+        assert len(statements) == 1
+
+    async def test_membership_overlay_is_per_user(self, client, test_club, test_user, test_member):
+        await client.get("/api/clubs", cookies={"access_token": create_access_token(test_user.id)})
+
+        _, other_cookies = await _other_user()
+        response = await client.get("/api/clubs", cookies=other_cookies)
+
+        assert response.json()[0]["my_status"] is None
+
+    async def test_join_and_leave_invalidate(self, client, test_club, test_user, test_member):
+        _, other_cookies = await _other_user()
+        assert (await client.get("/api/clubs", cookies=other_cookies)).json()[0]["member_count"] == 1
+
+        await client.post(f"/api/clubs/{test_club.id}/join", cookies=other_cookies)
+        club = (await client.get("/api/clubs", cookies=other_cookies)).json()[0]
+        assert (club["member_count"], club["my_status"]) == (2, "active")
+
+        await client.post(f"/api/clubs/{test_club.id}/leave", cookies=other_cookies)
+        club = (await client.get("/api/clubs", cookies=other_cookies)).json()[0]
+        assert (club["member_count"], club["my_status"]) == (1, "left")
+
+    async def test_create_update_delete_invalidate(self, client, test_club, test_user, test_member):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        assert len((await client.get("/api/clubs?search=동호회", cookies=cookies)).json()) == 1
+
+        created = await client.post("/api/clubs", json={"name": "새 동호회"}, cookies=cookies)
+        club_id = created.json()["id"]
+        assert len((await client.get("/api/clubs?search=동호회", cookies=cookies)).json()) == 2
+
+        await client.put(f"/api/clubs/{club_id}", json={"name": "새 모임"}, cookies=cookies)
+        names = [c["name"] for c in (await client.get("/api/clubs?search=동호회", cookies=cookies)).json()]
+        assert "새 모임" not in names and len(names) == 1
+
+        await client.delete(f"/api/clubs/{test_club.id}", cookies=cookies)
+        assert (await client.get("/api/clubs?search=동호회", cookies=cookies)).json() == []
+
+    async def test_member_removal_invalidates(self, client, test_club, test_user, test_member):
+        user, _ = await _other_user()
+        member = await ClubMember.create(
+            club=test_club, user=user, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        )
+        cookies = {"access_token": create_access_token(test_user.id)}
+        assert (await client.get("/api/clubs", cookies=cookies)).json()[0]["member_count"] == 2
+
+        await client.delete(f"/api/clubs/{test_club.id}/members/{member.id}", cookies=cookies)
+
+        assert (await client.get("/api/clubs", cookies=cookies)).json()[0]["member_count"] == 1
+        assert await Club.filter(is_deleted=False).count() == 1
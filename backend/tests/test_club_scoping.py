@@ -0,0 +1,99 @@
+"""
+세션/경기 club_id 비정규화 테스트 (생성 시 유지, 마이그레이션 백필, 클럽 범위 조회)
+"""
+import pytest
+from datetime import timedelta
+from tortoise import connections
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.club import Club
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.models.match import Match, MatchType, MatchStatus
+from app.models.season import Season, SeasonStatus
+from app.services.matching_service import persist_match_plans
+from tests.test_indexes import migration_statements
+
+
+async def _session(**relations):
+    now = utc_now()
+    return await Session.create(
+        **relations, title="세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+
+
+async def _season(club):
+    today = utc_now().date()
+    return await Season.create(club=club, name="시즌", start_date=today, end_date=today, status=SeasonStatus.ACTIVE)
+
+
+def _plan(number):
+    return {
+        "match_number": number, "court_number": 1, "scheduled_datetime": utc_now(),
+        "match_type": MatchType.MENS_DOUBLES, "participants": [],
+    }
+
+
+@pytest.mark.asyncio
+class TestMaintainedOnCreate:
+    """생성 시 club_id 채우기"""
+
+    async def test_session_from_event_or_season(self, db, test_club):
+        event = await Event.create(club=test_club, title="정기 모임", event_type=EventType.REGULAR)
+        assert (await _session(event=event)).club_id == test_club.id
+        assert (await _session(season=await _season(test_club))).club_id == test_club.id
+        assert (await _session()).club_id is None
+
+    async def test_match_from_session(self, db, test_club):
+        session = await _session(season=await _season(test_club))
+        match = await Match.create(
+            session=session, match_number=1, court_number=1, scheduled_datetime=session.start_datetime,
+            match_type=MatchType.MENS_DOUBLES, status=MatchStatus.SCHEDULED,
+        )
+        assert match.club_id == test_club.id
+
+        matches = await persist_match_plans(session.id, [_plan(2)])
+        assert [m.club_id for m in matches] == [test_club.id]
+
+
+@pytest.mark.asyncio
+class TestBackfill:
+    """마이그레이션 백필"""
+
+    async def test_backfill_from_event_and_season(self, db, test_club):
+        event = await Event.create(club=test_club, title="정기 모임", event_type=EventType.REGULAR)
+        by_event = await _session(event=event)
+        by_season = await _session(season=await _season(test_club))
+        await persist_match_plans(by_season.id, [_plan(1)])
+        await Session.all().update(club_id=None)
+        await Match.all().update(club_id=None)
+
+        conn = connections.get("default")
+        for statement in await migration_statements(conn, "11_20261018220000_add_session_match_club_id.py"):
+            await conn.execute_script(statement)
+
+        assert set(await Session.filter(id__in=[by_event.id, by_season.id]).values_list("club_id", flat=True)) == {
+            test_club.id
+        }
+        assert await Match.filter(club_id=test_club.id).count() == 1
+
+
+@pytest.mark.asyncio
+class TestClubScopedQueries:
+    """다른 클럽의 세션/경기 차단"""
+
+    async def test_other_club_session_and_match_hidden(self, client, test_club, test_user, test_member):
+        other = await Club.create(name="다른 동호회", created_by=test_user)
+        season = await _season(other)
+        session = await _session(season=season)
+        [match] = await persist_match_plans(session.id, [_plan(1)])
+        cookies = {"access_token": create_access_token(test_user.id)}
+        api = f"/api/clubs/{test_club.id}"
+
+        assert (await client.get(f"{api}/sessions/{session.id}", cookies=cookies)).status_code == 404
+        assert (await client.get(f"{api}/sessions/{session.id}/matches", cookies=cookies)).status_code == 404
+        assert (await client.delete(f"{api}/matches/{match.id}", cookies=cookies)).status_code == 404
+        # 다른 클럽의 시즌 ID로 필터링해도 목록에 나오지 않음
+        response = await client.get(f"{api}/sessions?season_id={season.id}&page=1", cookies=cookies)
+        assert response.json()["items"] == []
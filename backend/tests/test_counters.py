@@ -0,0 +1,110 @@
+"""
+시즌/세션 집계 카운터 테스트
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.event import Session, SessionParticipant, SessionStatus
+from app.models.guest import Guest
+from app.models.match import Match, MatchType, MatchStatus
+from app.models.member import Gender
+from app.services.counter_service import season_counters, session_counters
+
+
+async def _create_session(season, match_statuses, guest_count=0, deleted_match=False, is_deleted=False):
+    now = utc_now()
+    session = await Session.create(
+        season=season, title="시즌 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED, is_deleted=is_deleted,
+    )
+    for number, status in enumerate(match_statuses, start=1):
+        await Match.create(
+            session=session, match_number=number, court_number=1, scheduled_datetime=now,
+            match_type=MatchType.MENS_DOUBLES, status=status,
+        )
+    if deleted_match:
+        await Match.create(
+            session=session, match_number=99, court_number=1, scheduled_datetime=now,
+            match_type=MatchType.MENS_DOUBLES, status=MatchStatus.COMPLETED, is_deleted=True,
+        )
+    for index in range(guest_count):
+        guest = await Guest.create(club_id=season.club_id, name=f"게스트{index}", gender=Gender.MALE)
+        await SessionParticipant.create(session=session, guest=guest)
+    return session
+
+
+@pytest.mark.asyncio
+class TestCounterService:
+    """집계 함수 테스트"""
+
+    async def test_session_counters(self, test_season):
+        first = await _create_session(
+            test_season, [MatchStatus.COMPLETED, MatchStatus.SCHEDULED], guest_count=3, deleted_match=True
+        )
+        second = await _create_session(test_season, [])
+        removed = await SessionParticipant.filter(session=first).first()
+        removed.is_deleted = True
+        await removed.save()
+
+        counters = await session_counters([first.id, second.id])
+
+        assert counters[first.id] == {"participant_count": 2, "match_count": 2, "completed_match_count": 1}
+        assert counters[second.id] == {"participant_count": 0, "match_count": 0, "completed_match_count": 0}
+
+    async def test_season_counters_exclude_deleted_sessions(self, test_season):
+        await _create_session(test_season, [MatchStatus.COMPLETED, MatchStatus.COMPLETED], deleted_match=True)
+        await _create_session(test_season, [MatchStatus.IN_PROGRESS])
+        await _create_session(test_season, [MatchStatus.COMPLETED], is_deleted=True)
+
+        counters = await season_counters([test_season.id, 99999])
+
+        assert counters[test_season.id] == {"session_count": 2, "match_count": 3, "completed_match_count": 2}
+        assert counters[99999]["session_count"] == 0
+
+    async def test_empty_ids_no_query(self, capture_sql):
+        with capture_sql() as statements:
+            assert await session_counters([]) == {}
+            assert await season_counters([]) == {}
+        assert statements == []
+
+
+@pytest.mark.asyncio
+class TestCounterAPI:
+    """목록/상세 API가 고정 쿼리 수로 개수를 반환하는지 확인"""
+
+    async def test_list_sessions_query_count_constant(self, client, test_club, test_user, test_member,
+                                                      test_season, capture_sql):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        url = f"/api/clubs/{test_club.id}/sessions?season_id={test_season.id}"
+        await _create_session(test_season, [MatchStatus.COMPLETED], guest_count=2)
+        await client.get(url, cookies=cookies)  # 인증 캐시 워밍업
+
+        with capture_sql() as statements:
+            response = await client.get(url, cookies=cookies)
+        baseline = len(statements)
+        item = response.json()[0]
+        assert (item["participant_count"], item["match_count"], item["completed_match_count"]) == (2, 1, 1)
+
+        for _ in range(3):
+            await _create_session(test_season, [MatchStatus.SCHEDULED] * 2, guest_count=2)
+        with capture_sql() as statements:
+            response = await client.get(url, cookies=cookies)
+        assert len(response.json()) == 4
+        assert len(statements) == baseline
+
+    async def test_season_detail_and_list(self, client, test_club, test_user, test_member, test_season):
+        cookies = {"access_token": create_access_token(test_user.id)}
+        await _create_session(test_season, [MatchStatus.COMPLETED, MatchStatus.SCHEDULED], guest_count=1)
+        await _create_session(test_season, [MatchStatus.COMPLETED])
+
+        detail = (await client.get(
+            f"/api/clubs/{test_club.id}/seasons/{test_season.id}", cookies=cookies
+        )).json()
+        assert (detail["session_count"], detail["match_count"], detail["completed_match_count"]) == (2, 3, 2)
+        assert sorted(s["participant_count"] for s in detail["sessions"]) == [0, 1]
+
+        seasons = (await client.get(f"/api/clubs/{test_club.id}/seasons", cookies=cookies)).json()
+        assert seasons[0]["match_count"] == 3
+        assert seasons[0]["completed_match_count"] == 2
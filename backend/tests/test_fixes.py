@@ -285,11 +285,11 @@ class TestListClubsQuery:
     """list_clubs의 N+1 쿼리 개선 테스트"""
 
     def test_list_clubs_uses_annotate(self):
-        """list_clubs가 annotate/aggregate를 사용하는지 확인"""
+        """list_clubs(목록 캐시 서비스)가 annotate/aggregate를 사용하는지 확인"""
         import inspect
-        from app.api.clubs import list_clubs
+        from app.services.club_listing_service import list_club_page
 
-        source = inspect.getsource(list_clubs)
+        source = inspect.getsource(list_club_page)
         assert "annotate" in source or "Count" in source or "member_count" in source, \
             "list_clubs는 배치 쿼리로 member_count를 계산해야 합니다"
 
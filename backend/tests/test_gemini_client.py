@@ -0,0 +1,116 @@
+"""
+Gemini 비동기 호출 모듈 테스트 (동시성 제한 / 타임아웃)
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from app.services import gemini_client
+from app.services.gemini_client import generate_content, GeminiError, GeminiTimeoutError, GeminiUnavailableError
+
+
+class _FakeModels:
+    def __init__(self, delay: float = 0):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.cancelled = 0
+
+    async def generate_content(self, model, contents):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return SimpleNamespace(text=f"{model}:{contents}")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+
+def _fake_client(delay: float = 0):
+    return SimpleNamespace(aio=SimpleNamespace(models=_FakeModels(delay)))
+
+
+@pytest.fixture(autouse=True)
+def reset_semaphore():
+    gemini_client._semaphore = None
+    gemini_client._semaphore_loop = None
+    yield
+    gemini_client._semaphore = None
+    gemini_client._semaphore_loop = None
+
+
+@pytest.mark.asyncio
+class TestGeminiClient:
+    """Gemini 호출 래퍼 테스트"""
+
+    async def test_uses_async_interface(self):
+        client = _fake_client()
+        response = await generate_content(client, model="m", contents="hi", timeout=1)
+        assert response.text == "m:hi"
+
+    async def test_concurrency_limited(self):
+        client = _fake_client(delay=0.02)
+        with patch("app.config.settings.GEMINI_MAX_CONCURRENCY", 2):
+            await asyncio.gather(*[
+                generate_content(client, model="m", contents=i, timeout=1) for i in range(6)
+            ])
+        assert client.aio.models.max_active == 2
+
+    async def test_timeout_cancels_call(self):
+        client = _fake_client(delay=1)
+        with pytest.raises(GeminiTimeoutError):
+            await generate_content(client, model="m", contents="slow", timeout=0.01)
+        assert client.aio.models.cancelled == 1
+        assert client.aio.models.active == 0
+
+    async def test_transient_errors_are_not_value_errors(self):
+        # 입력 오류(ValueError → 422)와 구분되는 별도 계열
+        for error in (GeminiTimeoutError, GeminiUnavailableError):
+            assert issubclass(error, GeminiError)
+            assert not issubclass(error, ValueError)
+
+    async def test_transient_api_errors_are_retryable(self):
+        from google.genai import errors
+
+        client = _fake_client()
+        for error, expected in (
+            (errors.ServerError(503, {"error": {"message": "overloaded"}}), GeminiUnavailableError),
+            (errors.ClientError(429, {"error": {"message": "quota"}}), GeminiUnavailableError),
+            (errors.ClientError(400, {"error": {"message": "bad image"}}), errors.ClientError),
+        ):
+            client.aio.models.generate_content = AsyncMock(side_effect=error)
+            with pytest.raises(expected):
+                await generate_content(client, model="m", contents="x", timeout=1)
+
+
+@pytest.mark.asyncio
+class TestGeminiErrorResponses:
+    """일시 오류의 API 응답 코드"""
+
+    async def test_extract_maps_timeout_and_unavailable(self, client, test_club, test_user):
+        from app.core.security import create_access_token
+
+        cookies = {"access_token": create_access_token(test_user.id)}
+        for error, expected in ((GeminiTimeoutError("시간 초과"), 504), (GeminiUnavailableError("일시 오류"), 503)):
+            with patch("app.api.ocr.ocr_service.extract_with_cache", AsyncMock(side_effect=error)):
+                response = await client.post(
+                    f"/api/clubs/{test_club.id}/ocr/extract",
+                    files={"file": ("sheet.png", b"image", "image/png")},
+                    cookies=cookies,
+                )
+            assert response.status_code == expected
+
+    async def test_ai_matching_passes_gemini_errors_through(self):
+        from app.services import ai_matching_service
+
+        session_config = {"start_time": "09:00", "end_time": "11:00", "match_duration": 30,
+                          "break_duration": 5, "num_courts": 1}
+        with patch.object(ai_matching_service, "_get_client", return_value=object()), \
+                patch.object(ai_matching_service, "generate_content",
+                             AsyncMock(side_effect=GeminiUnavailableError("일시 오류"))):
+            with pytest.raises(GeminiUnavailableError):
+                await ai_matching_service.ai_matching_service.generate_matches([], session_config)
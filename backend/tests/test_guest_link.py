@@ -0,0 +1,156 @@
+"""
+게스트-회원 연결 테스트 (기록 일괄 이전, 랭킹/전적/요약 통계 갱신, 일괄 연결)
+"""
+import pytest
+
+from app.core.security import create_access_token
+from app.models.event import SessionParticipant
+from app.models.guest import Guest
+from app.models.match import MatchParticipant, ParticipantCategory
+from app.models.member import ClubMember, Gender, MemberRole, MemberStatus
+from app.models.ranking import PlayerStatSummary, Ranking
+from app.models.user import User, UserRole
+from app.services.guest_link_service import link_guests
+from app.services.player_stats_service import GUEST, MEMBER, rebuild_player_stats
+from app.services.ranking_service import rebuild_club_rankings
+from tests.test_player_stats import _counters, _record, _setup
+
+
+async def _new_member(club, name, status=MemberStatus.ACTIVE):
+    user = await User.create(
+        email=f"{name}@example.com", cognito_sub=f"sub-{name}", name=name, role=UserRole.USER, gender="male",
+    )
+    return await ClubMember.create(club=club, user=user, role=MemberRole.MEMBER, status=status, gender=Gender.MALE)
+
+
+async def _assert_no_drift(club):
+    players = await rebuild_player_stats(club.id, dry_run=True)
+    rankings = await rebuild_club_rankings(club.id, dry_run=True)
+    assert players["drifted_member_ids"] == players["drifted_guest_ids"] == []
+    assert rankings["drifted_member_ids"] == []
+
+
+@pytest.mark.asyncio
+class TestLinkGuest:
+    """단일 연결"""
+
+    async def test_records_move_to_member(self, client, test_club, test_user, test_member):
+        session, matches, partner, opponent = await _setup(test_club, test_member, 2)
+        await SessionParticipant.create(session=session, guest=partner, participant_category=ParticipantCategory.GUEST)
+        await _record(client, test_club, test_user, session, [(matches[0], 6, 2), (matches[1], 3, 6)])
+        target = await _new_member(test_club, "가입자")
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/guests/{partner.id}/link",
+            json={"member_id": target.id},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["records_transferred"] is True
+        await target.refresh_from_db()
+        await partner.refresh_from_db()
+        assert partner.linked_member_id == target.id
+        assert _counters(target) == (2, 1, 0, 1)
+        assert _counters(partner) == (0, 0, 0, 0)
+        assert await MatchParticipant.filter(guest_id=partner.id).count() == 0
+        assert await MatchParticipant.filter(
+            club_member_id=target.id, participant_category=ParticipantCategory.MEMBER
+        ).count() == 2
+        assert await SessionParticipant.filter(club_member_id=target.id).count() == 1
+
+        ranking = await Ranking.get(club_id=test_club.id, club_member_id=target.id)
+        assert (ranking.wins, ranking.losses) == (1, 1)
+        # 같은 경기 다른 선수의 파트너/상대 키도 회원으로 바뀜
+        member_summary = await PlayerStatSummary.get(club_member_id=test_member.id)
+        assert member_summary.partners == {f"{MEMBER}:{target.id}": [1, 0, 1]}
+        opponent_summary = await PlayerStatSummary.get(guest_id=opponent.id)
+        assert f"{GUEST}:{partner.id}" not in opponent_summary.opponents
+        await _assert_no_drift(test_club)
+
+    async def test_without_transfer_only_links(self, client, test_club, test_user, test_member):
+        session, matches, partner, _ = await _setup(test_club, test_member, 1)
+        await _record(client, test_club, test_user, session, [(matches[0], 6, 2)])
+        target = await _new_member(test_club, "가입자")
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/guests/{partner.id}/link",
+            json={"member_id": target.id, "transfer_records": False},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+
+        assert response.json()["records_transferred"] is False
+        assert await MatchParticipant.filter(guest_id=partner.id).count() == 1
+        await target.refresh_from_db()
+        assert _counters(target) == (0, 0, 0, 0)
+
+    async def test_validation(self, client, test_club, test_user, test_member):
+        _, _, partner, opponent = await _setup(test_club, test_member, 1)
+        inactive = await _new_member(test_club, "대기", status=MemberStatus.PENDING)
+        cookies = {"access_token": create_access_token(test_user.id)}
+        api = f"/api/clubs/{test_club.id}/guests"
+
+        response = await client.post(f"{api}/999999/link", json={"member_id": test_member.id}, cookies=cookies)
+        assert response.status_code == 404
+        response = await client.post(f"{api}/{partner.id}/link", json={"member_id": inactive.id}, cookies=cookies)
+        assert response.json()["detail"] == "활성 상태인 회원만 연결할 수 있습니다"
+
+        await client.post(f"{api}/{partner.id}/link", json={"member_id": test_member.id}, cookies=cookies)
+        response = await client.post(f"{api}/{opponent.id}/link", json={"member_id": test_member.id}, cookies=cookies)
+        assert response.json()["detail"] == "해당 회원은 이미 다른 게스트와 연결되어 있습니다"
+
+
+@pytest.mark.asyncio
+class TestBulkLink:
+    """일괄 연결"""
+
+    async def test_bulk_link(self, client, test_club, test_user, test_member):
+        session, matches, partner, opponent = await _setup(test_club, test_member, 3)
+        await _record(client, test_club, test_user, session, [
+            (matches[0], 6, 2), (matches[1], 3, 6), (matches[2], 6, 4),
+        ])
+        first, second = await _new_member(test_club, "첫째"), await _new_member(test_club, "둘째")
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/guests/bulk-link",
+            json={"links": [
+                {"guest_id": partner.id, "member_id": first.id},
+                {"guest_id": opponent.id, "member_id": second.id},
+            ]},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+
+        assert response.status_code == 200
+        assert [item["records_transferred"] for item in response.json()["linked"]] == [3, 3]
+        await first.refresh_from_db()
+        await second.refresh_from_db()
+        assert _counters(first) == (3, 2, 0, 1)
+        assert _counters(second) == (3, 1, 0, 2)
+        assert await MatchParticipant.filter(guest_id__isnull=False).count() == 0
+        await _assert_no_drift(test_club)
+
+    async def test_bulk_link_is_all_or_nothing(self, client, test_club, test_user, test_member):
+        _, _, partner, opponent = await _setup(test_club, test_member, 1)
+        target = await _new_member(test_club, "가입자")
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/guests/bulk-link",
+            json={"links": [
+                {"guest_id": partner.id, "member_id": target.id},
+                {"guest_id": opponent.id, "member_id": target.id},
+            ]},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+
+        assert response.status_code == 400
+        assert await Guest.filter(linked_member_id__isnull=False).count() == 0
+
+    async def test_query_count_independent_of_history(self, db, test_club, test_member, capture_sql):
+        counts = []
+        for name, match_count in (("적음", 2), ("많음", 8)):
+            _, _, partner, _ = await _setup(test_club, test_member, match_count)
+            target = await _new_member(test_club, name)
+            with capture_sql() as statements:
+                await link_guests(test_club.id, {partner.id: target.id})
+            counts.append(len(statements))
+        assert counts[0] == counts[1]
@@ -0,0 +1,54 @@
+"""
+OCR 이미지 전처리 테스트
+"""
+import asyncio
+import io
+import pytest
+from unittest.mock import patch
+from PIL import Image
+
+from app.services.image_preprocess import preprocess_image
+
+
+class TestPreprocessImage:
+    """축소/방향 보정/재인코딩"""
+
+    def test_disabled_returns_original(self):
+        assert preprocess_image(b"raw", "image/png", max_dimension=0) == (b"raw", "image/png")
+
+    def test_downscale_and_reencode(self):
+        source = io.BytesIO()
+        Image.new("RGB", (4000, 3000), (200, 200, 200)).save(source, format="PNG")
+
+        processed, mime_type = preprocess_image(source.getvalue(), "image/png", max_dimension=1000)
+
+        assert mime_type == "image/jpeg"
+        with Image.open(io.BytesIO(processed)) as image:
+            assert image.size == (1000, 750)
+
+    def test_exif_orientation_applied(self):
+        source = io.BytesIO()
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전 필요
+        Image.new("RGB", (300, 100)).save(source, format="JPEG", exif=exif)
+
+        processed, _ = preprocess_image(source.getvalue(), "image/jpeg", max_dimension=1000)
+
+        with Image.open(io.BytesIO(processed)) as image:
+            assert image.size == (100, 300)
+
+    def test_invalid_image_returns_original(self):
+        assert preprocess_image(b"not-an-image", "image/png", max_dimension=1000) == (b"not-an-image", "image/png")
+
+
+@pytest.mark.asyncio
+class TestPrepareImage:
+    """OCRService 전처리 단계"""
+
+    async def test_runs_in_worker_thread(self):
+        from app.services.ocr_service import ocr_service
+
+        with patch("app.services.ocr_service.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await ocr_service.prepare_image(b"raw", "image/png")
+        assert to_thread.call_count == 1
+        assert result == (b"raw", "image/png")
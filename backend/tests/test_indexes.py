@@ -0,0 +1,121 @@
+"""
+복합/부분 인덱스 마이그레이션 테스트 (SQLite 실행 계획으로 확인)
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+from tortoise import Tortoise, connections
+from tortoise.indexes import Index, PartialIndex
+
+from app.models.announcement import Announcement
+from app.models.event import Session
+from app.models.fee import FeePayment
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus
+from app.models.member import ClubMember, MemberStatus
+
+MIGRATIONS_DIR = Path(__file__).parent.parent / "migrations/models"
+INDEX_MIGRATIONS = (
+    "10_20261018200000_add_hot_filter_indexes.py",
+    "11_20261018220000_add_session_match_club_id.py",
+)
+
+# API에서 실제로 쓰는 필터/정렬 조합 → 사용해야 하는 인덱스
+HOT_QUERIES = {
+    "session_matches": (lambda: Match.filter(session_id=1).order_by("match_number", "id"),
+                        "idx_matches_session_status"),
+    "match_counts": (lambda: Match.filter(is_deleted=False, session_id__in=[1, 2]).group_by("session_id")
+                     .values("session_id"), "idx_matches_session_status"),
+    "match_participants": (lambda: MatchParticipant.filter(match_id__in=[1, 2]).order_by("match_id", "team", "position"),
+                           "idx_match_participants_match"),
+    "member_history": (lambda: MatchParticipant.filter(club_member_id=1), "idx_match_participants_member"),
+    "active_members": (lambda: ClubMember.filter(club_id=1, status=MemberStatus.ACTIVE, is_deleted=False),
+                       "idx_club_members_club_status"),
+    "season_sessions": (lambda: Session.filter(season_id=1, is_deleted=False).order_by("-start_datetime").limit(20),
+                        "idx_sessions_season_start"),
+    "announcements": (lambda: Announcement.filter(club_id=1, is_deleted=False).order_by("-is_pinned", "-created_at"),
+                      "idx_announcements_club_pinned"),
+    "fee_payments": (lambda: FeePayment.filter(fee_setting_id=1, target_year=2026, target_month=3),
+                     "idx_fee_payments_setting_period"),
+    "club_sessions": (lambda: Session.filter(club_id=1, is_deleted=False).order_by("-start_datetime").limit(20),
+                      "idx_sessions_club_start"),
+    "club_results": (lambda: MatchResult.filter(match__club_id=1, match__status=MatchStatus.COMPLETED,
+                                                match__is_deleted=False), "idx_matches_club_status"),
+}
+
+
+async def migration_statements(db, filename: str) -> list:
+    """마이그레이션 upgrade SQL을 SQLite에서 실행할 문장 목록으로 변환
+
+    - 테스트 스키마는 모델에서 생성되므로 컬럼 추가(ALTER TABLE)는 건너뜀
+    - SQLite는 부분 인덱스 조건을 문자 그대로 비교하고 Tortoise는 False를 0으로 렌더링하므로
+      PostgreSQL용 `= false`를 `= 0`으로 바꿈
+    """
+    spec = importlib.util.spec_from_file_location(filename.removesuffix(".py"), MIGRATIONS_DIR / filename)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    sql = (await migration.upgrade(db)).replace('"is_deleted" = false', '"is_deleted" = 0')
+    statements = [statement.strip() for statement in sql.split(";")]
+    return [statement for statement in statements if statement and not statement.startswith("ALTER TABLE")]
+
+
+async def apply_index_migration(db) -> None:
+    """
+    인덱스 마이그레이션을 SQLite에 적용
+
+    모델 Meta.indexes로 이미 만들어진 같은 이름의 인덱스는 지우고 다시 만든다
+    (모델의 부분 인덱스 조건은 `= false`로 렌더링되어 SQLite 조회 조건 `= 0`과 맞지 않음)
+    """
+    for filename in INDEX_MIGRATIONS:
+        for statement in await migration_statements(db, filename):
+            if statement.startswith("CREATE INDEX IF NOT EXISTS"):
+                await db.execute_script(f"DROP INDEX IF EXISTS {statement.split()[5]}")
+            await db.execute_script(statement)
+
+
+def model_indexes() -> dict:
+    """모델 Meta.indexes에 선언된 인덱스 {이름: (모델, Index)}"""
+    return {
+        index.name: (model, index)
+        for model in Tortoise.apps["models"].values()
+        for index in model._meta.indexes
+        if isinstance(index, Index)
+    }
+
+
+async def explain(db, queryset) -> str:
+    rows = await db.execute_query_dict("EXPLAIN QUERY PLAN " + queryset.sql())
+    return " / ".join(row["detail"] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_hot_queries_use_indexes(db):
+    conn = connections.get("default")
+    before = {name: await explain(conn, build()) for name, (build, _) in HOT_QUERIES.items()}
+
+    await apply_index_migration(conn)
+
+    declared = model_indexes()
+    for name, (build, index) in HOT_QUERIES.items():
+        plan = await explain(conn, build())
+        assert index in plan, f"{name}: {plan}"
+        # 모델에 선언된 인덱스는 테스트 스키마에 이미 있음
+        if index not in declared:
+            assert index not in before[name]
+
+
+@pytest.mark.asyncio
+async def test_model_indexes_match_migrations(db):
+    statements = []
+    for filename in INDEX_MIGRATIONS:
+        migration_sql = await migration_statements(db, filename)
+        statements.extend(statement.replace('"is_deleted" = 0', '"is_deleted" = false') for statement in migration_sql)
+
+    declared = model_indexes()
+    assert declared
+    for name, (model, index) in declared.items():
+        columns = ", ".join(f'"{field}"' for field in index.fields)
+        expected = f'CREATE INDEX IF NOT EXISTS "{name}" ON "{model._meta.db_table}" ({columns})'
+        if isinstance(index, PartialIndex):
+            expected += ' WHERE "is_deleted" = false'
+        assert expected in statements, name
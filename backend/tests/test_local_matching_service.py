@@ -0,0 +1,111 @@
+"""
+로컬 경기 매칭 서비스 테스트
+"""
+import pytest
+from collections import Counter
+
+from app.services.local_matching_service import local_matching_service
+
+
+def _players(count: int, match_type: str, gender: str, start_id: int = 1, points=None) -> list:
+    return [
+        {
+            "id": start_id + i,
+            "name": f"선수{start_id + i}",
+            "gender": gender,
+            "match_type": match_type,
+            "ranking": {"points": points[i] if points else 0, "wins": 0, "losses": 0, "win_rate": 0},
+        }
+        for i in range(count)
+    ]
+
+
+CONFIG = {
+    "start_time": "19:00",
+    "end_time": "21:00",
+    "match_duration": 25,
+    "break_duration": 5,
+    "num_courts": 2,
+}
+
+
+class TestLocalMatchingService:
+    """로컬 스케줄러 테스트"""
+
+    def test_output_shape(self):
+        players = _players(8, "mens_doubles", "male")
+        result = local_matching_service.schedule(players, CONFIG, seed=1)
+
+        # 2시간 / 30분 라운드 = 4라운드 x 2코트
+        assert result["summary"]["total_matches"] == 8
+        assert result["summary"]["estimated_end_time"] == "20:55"
+        match = result["matches"][0]
+        assert set(match) == {
+            "match_number", "match_type", "court_number", "scheduled_time",
+            "team_a", "team_b", "balance_score",
+        }
+        assert [m["scheduled_time"] for m in result["matches"][:3]] == ["19:00", "19:00", "19:30"]
+
+    def test_no_player_twice_in_a_round_and_court_capacity(self):
+        players = _players(10, "mens_doubles", "male") + _players(6, "womens_doubles", "female", start_id=11)
+        result = local_matching_service.schedule(players, {**CONFIG, "num_courts": 3}, seed=2)
+
+        rounds = {}
+        for m in result["matches"]:
+            rounds.setdefault(m["scheduled_time"], []).append(m)
+        for matches in rounds.values():
+            assert len(matches) <= 3
+            ids = [i for m in matches for i in m["team_a"]["player_ids"] + m["team_b"]["player_ids"]]
+            assert len(ids) == len(set(ids))
+
+    def test_fair_distribution_and_rest(self):
+        # 5명 1코트: 매 라운드 1명이 쉬므로 연속 경기는 불가피하지만 출전 수는 고르게
+        players = _players(5, "mens_doubles", "male")
+        config = {**CONFIG, "num_courts": 1, "end_time": "21:30"}
+        result = local_matching_service.schedule(players, config, seed=3)
+
+        games = Counter(i for m in result["matches"] for i in m["team_a"]["player_ids"] + m["team_b"]["player_ids"])
+        assert max(games.values()) - min(games.values()) <= 1
+
+    def test_resting_players_preferred(self):
+        # 8명 1코트: 직전 라운드 선수는 다음 라운드에 쉬어야 함
+        players = _players(8, "mens_doubles", "male")
+        result = local_matching_service.schedule(players, {**CONFIG, "num_courts": 1}, seed=4)
+
+        previous = set()
+        for m in result["matches"]:
+            current = set(m["team_a"]["player_ids"] + m["team_b"]["player_ids"])
+            assert not current & previous
+            previous = current
+
+    def test_balanced_teams(self):
+        players = _players(4, "mens_doubles", "male", points=[30, 20, 10, 0])
+        result = local_matching_service.schedule(players, {**CONFIG, "end_time": "19:30"}, seed=5)
+
+        match = result["matches"][0]
+        assert sorted([sorted(match["team_a"]["player_ids"]), sorted(match["team_b"]["player_ids"])]) == [[1, 4], [2, 3]]
+        assert match["balance_score"] == 1.0
+
+    def test_unrated_players_use_initial_rating_in_rated_pool(self):
+        players = _players(4, "mens_doubles", "male", points=[0, 0, 30, 0])
+        players[0]["ranking"]["rating"] = 1800
+        players[1]["ranking"]["rating"] = 1200
+        result = local_matching_service.schedule(players, {**CONFIG, "end_time": "19:30"}, seed=5)
+
+        # 레이팅 없는 3, 4번은 포인트가 아니라 초기 레이팅(1500)으로 비교: 1800+1200 vs 1500+1500
+        match = result["matches"][0]
+        assert sorted([sorted(match["team_a"]["player_ids"]), sorted(match["team_b"]["player_ids"])]) == [[1, 2], [3, 4]]
+        assert match["balance_score"] == 1.0
+
+    def test_mixed_doubles_teams_are_one_male_one_female(self):
+        players = _players(4, "mixed_doubles", "male") + _players(4, "mixed_doubles", "female", start_id=11)
+        result = local_matching_service.schedule(players, CONFIG, seed=6)
+
+        assert result["summary"]["mixed_doubles_matches"] == result["summary"]["total_matches"] > 0
+        for m in result["matches"]:
+            for team in (m["team_a"], m["team_b"]):
+                assert sorted(i > 10 for i in team["player_ids"]) == [False, True]
+
+    def test_not_enough_players(self):
+        with pytest.raises(ValueError):
+            local_matching_service.schedule(_players(3, "mens_doubles", "male"), CONFIG)
@@ -2,7 +2,7 @@
 매칭 서비스 테스트
 
 참고: matching_service.py는 DB 의존성이 있는 async 함수들로 구성됨
-여기서는 헬퍼 함수와 로직만 테스트
+헬퍼 함수와 로직, 대진 계획/일괄 저장 흐름을 테스트
 """
 import pytest
 from datetime import time, datetime, timedelta
@@ -232,3 +232,96 @@ class TestCourtAllocation:
 
         # 2코트로 5경기 = 3개 시간대 (0, 1, 2)
         assert time_slot == 2
+
+
+@pytest.mark.asyncio
+class TestBulkMatchGeneration:
+    """대진 계획 + 일괄 저장 테스트"""
+
+    async def _create_session_with_players(self, club, males: int, females: int, guests: int = 0):
+        from app.core.timezone import utc_now
+        from app.models.user import User
+        from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+        from app.models.guest import Guest
+        from app.models.event import Event, EventType, Session, SessionStatus, SessionParticipant, ParticipantCategory
+
+        now = utc_now()
+        event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+        session = await Session.create(
+            event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+            num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+        )
+        for i in range(males + females):
+            gender = "male" if i < males else "female"
+            user = await User.create(email=f"gen{i}@test.com", cognito_sub=f"gen-sub-{i}", name=f"선수{i}", gender=gender)
+            member = await ClubMember.create(
+                club=club, user=user, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE, gender=Gender(gender),
+            )
+            await SessionParticipant.create(session=session, club_member=member)
+        for i in range(guests):
+            guest = await Guest.create(club=club, name=f"게스트{i}", gender=Gender.MALE)
+            await SessionParticipant.create(session=session, guest=guest, participant_category=ParticipantCategory.GUEST)
+
+        return await Session.get(id=session.id).prefetch_related(
+            "participants__club_member__user", "participants__guest", "participants__user"
+        )
+
+    async def test_plan_does_not_touch_db(self, db, test_club):
+        from app.services.matching_service import plan_session_matches
+        from app.models.match import Match
+
+        session = await self._create_session_with_players(test_club, males=6, females=2)
+        plans = plan_session_matches(session)
+
+        assert [plan["match_type"] for plan in plans] == [MatchType.MIXED_DOUBLES, MatchType.MENS_DOUBLES]
+        assert [plan["court_number"] for plan in plans] == [1, 2]
+        assert await Match.filter(session=session).count() == 0
+
+    async def test_generate_persists_matches_and_participants(self, db, test_club):
+        from app.services.matching_service import generate_matches_for_session_inline
+        from app.models.match import Match, MatchParticipant
+
+        session = await self._create_session_with_players(test_club, males=6, females=4, guests=2)
+        match_ids = await generate_matches_for_session_inline(session)
+
+        # 혼합 복식 2경기 + 남자 복식 (남 2 + 게스트 2) 1경기
+        assert len(match_ids) == 3
+        matches = await Match.filter(session=session).order_by("match_number")
+        assert [m.id for m in matches] == match_ids
+        assert [m.match_number for m in matches] == [1, 2, 3]
+
+        participants = await MatchParticipant.filter(match_id__in=match_ids).values("match_id", "team", "position", "guest_id")
+        assert len(participants) == 12
+        for match_id in match_ids:
+            positions = sorted((p["team"], p["position"]) for p in participants if p["match_id"] == match_id)
+            assert positions == [(Team.A, 1), (Team.A, 2), (Team.B, 1), (Team.B, 2)]
+        assert sum(1 for p in participants if p["guest_id"]) == 2
+
+    async def test_regenerate_replaces_existing_matches(self, db, test_club):
+        from app.services.matching_service import generate_matches_for_session_inline
+        from app.models.match import Match
+
+        session = await self._create_session_with_players(test_club, males=4, females=0)
+        first = await generate_matches_for_session_inline(session)
+        second = await generate_matches_for_session_inline(session)
+
+        assert len(first) == len(second) == 1
+        assert await Match.filter(session=session).count() == 1
+
+    async def test_persist_attaches_participants_to_new_matches(self, db, test_club):
+        from app.services.matching_service import persist_match_plans, plan_session_matches
+        from app.models.match import Match, MatchParticipant
+
+        session = await self._create_session_with_players(test_club, males=4, females=0)
+        plans = plan_session_matches(session)
+        # 번호가 같은 삭제된 경기가 남아 있어도 방금 저장한 경기에 참가자가 연결됨
+        stale = await Match.create(
+            session_id=session.id, match_number=plans[0]["match_number"], court_number=1,
+            scheduled_datetime=session.start_datetime, match_type=MatchType.MENS_DOUBLES, is_deleted=True,
+        )
+
+        matches = await persist_match_plans(session.id, plans)
+
+        assert len(matches) == 1 and matches[0].id != stale.id
+        assert await MatchParticipant.filter(match_id=matches[0].id).count() == 4
+        assert await MatchParticipant.filter(match_id=stale.id).count() == 0
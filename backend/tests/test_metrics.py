@@ -0,0 +1,104 @@
+"""
+요청 단위 DB 프로파일링 / 메트릭 테스트
+"""
+import logging
+import pytest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from app.core.metrics import (
+    Histogram,
+    QueryMetricsMiddleware,
+    RequestStats,
+    render_metrics,
+    reset_metrics,
+)
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+def _profiled_app(**options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/{name}")
+    async def count_users(name: str):
+        await User.filter(name=name).count()
+        return {"count": await User.all().count()}
+
+    app.add_middleware(QueryMetricsMiddleware, **options)
+    return app
+
+
+class TestHistogram:
+    """Prometheus 텍스트 포맷"""
+
+    def test_cumulative_buckets(self):
+        histogram = Histogram("db_queries", "쿼리 수", ("route",), (1, 5, 10))
+        for value in (1, 3, 7, 50):
+            histogram.observe(("/a",), value)
+
+        lines = histogram.render()
+
+        assert '# TYPE db_queries histogram' in lines
+        assert 'db_queries_bucket{route="/a",le="1"} 1' in lines
+        assert 'db_queries_bucket{route="/a",le="5"} 2' in lines
+        assert 'db_queries_bucket{route="/a",le="10"} 3' in lines
+        assert 'db_queries_bucket{route="/a",le="+Inf"} 4' in lines
+        assert 'db_queries_sum{route="/a"} 61' in lines
+        assert 'db_queries_count{route="/a"} 4' in lines
+
+    def test_request_stats_keeps_slowest(self):
+        stats = RequestStats()
+        for seconds in (0.1, 0.5, 0.2, 0.05, 0.3):
+            stats.record(f"q{seconds}", seconds)
+        assert stats.queries == 5
+        assert [sql for _, sql in stats.slowest] == ["q0.5", "q0.3", "q0.2"]
+
+
+@pytest.mark.asyncio
+class TestQueryMetricsMiddleware:
+    """미들웨어 집계"""
+
+    async def test_debug_headers_and_slow_log(self, db, caplog):
+        app = _profiled_app(debug_headers=True, slow_query_count=2)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+                response = await client.get("/users/someone")
+
+        assert response.headers["x-db-query-count"] == "2"
+        assert float(response.headers["x-db-time-ms"]) >= 0
+        assert "x-db-slowest-ms" in response.headers
+        assert "queries=2" in caplog.text
+        assert "/users/{name}" in caplog.text
+
+    async def test_no_headers_without_debug(self, db):
+        app = _profiled_app()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/users/someone")
+        assert "x-db-query-count" not in response.headers
+
+    async def test_metrics_endpoint(self, client, test_club, test_user, test_member):
+        reset_metrics()
+        cookies = {"access_token": create_access_token(test_user.id)}
+        await client.get(f"/api/clubs/{test_club.id}/sessions", cookies=cookies)
+        await client.get("/api/does-not-exist")
+
+        with patch("app.main.settings.METRICS_TOKEN", "secret"):
+            response = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert 'http_request_db_queries_count{method="GET",route="/api/clubs/{club_id}/sessions",status="200"} 1' in body
+        assert 'route="unmatched",status="404"' in body
+        assert render_metrics() == body  # /metrics 요청 자체는 집계하지 않음
+
+    async def test_metrics_token(self, client):
+        # 토큰이 없으면 엔드포인트를 노출하지 않음
+        assert (await client.get("/metrics")).status_code == 404
+        with patch("app.main.settings.METRICS_TOKEN", "secret"):
+            assert (await client.get("/metrics")).status_code == 401
+            response = await client.get("/metrics", headers={"Authorization": "Bearer secret"})
+        assert response.status_code == 200
@@ -0,0 +1,96 @@
+"""
+선수 이름 매칭 인덱스 테스트
+"""
+import pytest
+import warnings
+from unittest.mock import AsyncMock, patch
+
+from app.services.name_matcher import NameIndex, decompose_hangul, edit_distance, normalize_name
+
+
+class TestNameMatcher:
+    """이름 인덱스 단위 테스트"""
+
+    def _index(self):
+        return NameIndex([
+            ("member", 1, "김철수"),
+            ("member", 2, "김철"),
+            ("member", 3, "이영희"),
+            ("guest", 10, "Tom Lee"),
+        ])
+
+    def test_decompose_and_normalize(self):
+        assert decompose_hangul("김철수") == "ㄱㅣㅁㅊㅓㄹㅅㅜ"
+        assert normalize_name(" Tom  Lee ") == "tomlee"
+        assert edit_distance("kitten", "sitting") == 3
+
+    def test_exact_match_after_normalization(self):
+        index = self._index()
+        match = index.resolve("이 영희")
+        assert (match.kind, match.id, match.confidence) == ("member", 3, 1.0)
+        assert index.resolve("tom lee").id == 10
+
+    def test_substring_does_not_pick_wrong_member(self):
+        index = self._index()
+        # "김철"은 "김철수"의 부분 문자열이지만 정확히 일치하는 회원이 따로 있음
+        assert index.resolve("김철").id == 2
+        assert index.resolve("김철수").id == 1
+
+    def test_ocr_typo_is_only_suggested(self):
+        index = self._index()
+        # 받침 하나 차이 (영 → 연): 다른 사람일 수 있으므로 자동 해석하지 않고 후보로만 제공
+        assert index.resolve("이연희") is None
+        match = index.suggest("이연희")[0]
+        assert match.id == 3
+        assert 0.8 <= match.confidence < 1.0
+
+    def test_one_jamo_apart_member_is_not_auto_resolved(self):
+        index = NameIndex([("member", 1, "이민수")])
+        assert index.resolve("이민주") is None
+        assert index.suggest("이민주")[0].id == 1
+
+    def test_low_confidence_is_only_suggested(self):
+        index = self._index()
+        assert index.resolve("박민수") is None
+        suggestions = index.suggest("김철순")
+        assert [s.id for s in suggestions][:2] == [1, 2]
+        assert suggestions[0].confidence > suggestions[1].confidence
+
+    def test_ambiguous_exact_names_are_not_resolved(self):
+        index = NameIndex([("member", 1, "김철수"), ("guest", 5, "김철수")])
+        assert index.resolve("김철수") is None
+        assert len(index.suggest("김철수")) == 2
+
+
+@pytest.mark.asyncio
+class TestExtractSuggestions:
+    """OCR 미리보기 후보 제공 테스트"""
+
+    async def test_extract_returns_suggestions_for_members(self, client, test_club, test_user, test_member):
+        from app.core.security import create_access_token
+
+        extracted = {
+            "date": None, "location": None,
+            "matches": [{
+                "match_type": "mens_doubles", "court_number": 1,
+                "team_a": {"players": ["테스트유저", "모름"], "score": 6},
+                "team_b": {"players": ["테스트 유저"], "score": 3},
+            }],
+        }
+        with patch("app.api.ocr.ocr_service.extract_match_results", AsyncMock(return_value=extracted)), \
+                warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            response = await client.post(
+                f"/api/clubs/{test_club.id}/ocr/extract",
+                files={"file": ("sheet.png", b"fake", "image/png")},
+                cookies={"access_token": create_access_token(test_user.id)},
+            )
+        assert response.status_code == 200
+        # 응답 모델 타입과 일치하여 직렬화 경고가 없어야 함
+        assert not [w for w in caught if "serializ" in str(w.message).lower()]
+        suggestions = response.json()["player_suggestions"]
+        assert suggestions["테스트유저"][0] == {
+            "member_id": test_member.id, "guest_id": None, "name": "테스트유저", "confidence": 1.0,
+        }
+        assert suggestions["테스트 유저"][0]["member_id"] == test_member.id
+        assert suggestions["모름"] == []
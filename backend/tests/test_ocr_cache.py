@@ -0,0 +1,112 @@
+"""
+OCR 결과 캐시 테스트
+"""
+import json
+import os
+import threading
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.ocr_cache import OCRResultCache, ocr_cache_key
+
+
+def _result(name: str) -> dict:
+    return {"date": None, "location": None, "matches": [{
+        "match_type": "singles", "court_number": 1,
+        "team_a": {"players": [name], "score": 6},
+        "team_b": {"players": ["상대"], "score": 2},
+    }]}
+
+
+class TestOCRResultCache:
+    """디스크 LRU 캐시 테스트"""
+
+    def test_key_depends_on_image_and_prompt_version(self):
+        assert ocr_cache_key(b"img", "v1") == ocr_cache_key(b"img", "v1")
+        assert ocr_cache_key(b"img", "v1") != ocr_cache_key(b"img", "v2")
+        assert ocr_cache_key(b"img", "v1") != ocr_cache_key(b"img2", "v1")
+
+    def test_hit_miss_counters_and_persistence(self, tmp_path):
+        cache = OCRResultCache(str(tmp_path), max_bytes=10_000)
+        assert cache.get("a" * 64) is None
+        cache.set("a" * 64, _result("김철수"))
+        assert cache.get("a" * 64) == _result("김철수")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # 새 인스턴스(프로세스 재시작)에서도 디스크에서 조회
+        reopened = OCRResultCache(str(tmp_path), max_bytes=10_000)
+        assert reopened.get("a" * 64) == _result("김철수")
+        assert reopened.stats()["entries"] == 1
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        entry_size = len(json.dumps(_result("김철수"), ensure_ascii=False).encode())
+        cache = OCRResultCache(str(tmp_path), max_bytes=entry_size * 2)
+        cache.set("a" * 64, _result("김철수"))
+        cache.set("b" * 64, _result("이영희"))
+        cache.get("a" * 64)  # a를 최근 사용으로 갱신
+        cache.set("c" * 64, _result("박민수"))
+
+        assert cache.get("b" * 64) is None
+        assert cache.get("a" * 64) is not None
+        assert cache.evictions == 1
+        assert not os.path.exists(os.path.join(str(tmp_path), "bb", "b" * 64 + ".json"))
+
+    def test_disabled_when_max_bytes_zero(self, tmp_path):
+        cache = OCRResultCache(str(tmp_path), max_bytes=0)
+        cache.set("a" * 64, _result("김철수"))
+        assert cache.get("a" * 64) is None
+        assert cache.stats()["enabled"] is False
+
+
+@pytest.mark.asyncio
+class TestExtractCache:
+    """OCR 추출 API 캐시 적용 테스트"""
+
+    async def test_cache_io_runs_off_event_loop(self, tmp_path):
+        from app.services.ocr_service import OCRService
+
+        class _ThreadRecordingCache(OCRResultCache):
+            def get(self, key):
+                threads.append(threading.get_ident())
+                return super().get(key)
+
+            def set(self, key, value):
+                threads.append(threading.get_ident())
+                super().set(key, value)
+
+        threads = []
+        service = OCRService()
+        service.cache = _ThreadRecordingCache(str(tmp_path), max_bytes=10_000)
+        with patch.object(service, "extract_match_results", AsyncMock(return_value=_result("김철수"))):
+            assert await service.extract_with_cache(b"image", "image/png") == (_result("김철수"), False)
+
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
+
+    async def test_second_upload_uses_cache(self, client, test_club, test_user, test_admin):
+        from app.core.security import create_access_token
+
+        extract = AsyncMock(return_value=_result("김철수"))
+        cookies = {"access_token": create_access_token(test_user.id)}
+        with patch("app.api.ocr.ocr_service.extract_match_results", extract):
+            for _ in range(2):
+                response = await client.post(
+                    f"/api/clubs/{test_club.id}/ocr/extract",
+                    files={"file": ("sheet.png", b"same-image", "image/png")},
+                    cookies=cookies,
+                )
+                assert response.status_code == 200
+
+        assert extract.await_count == 1
+        assert response.json()["cached"] is True
+        assert response.json()["matches"][0]["team_a"]["players"] == ["김철수"]
+
+        stats = await client.get(
+            f"/api/clubs/{test_club.id}/ocr/cache-stats",
+            cookies={"access_token": create_access_token(test_admin.id)},
+        )
+        assert stats.status_code == 200
+        assert (stats.json()["hits"], stats.json()["misses"]) == (1, 1)
+
+        forbidden = await client.get(f"/api/clubs/{test_club.id}/ocr/cache-stats", cookies=cookies)
+        assert forbidden.status_code == 403
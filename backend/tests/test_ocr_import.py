@@ -0,0 +1,152 @@
+"""
+OCR 경기 결과 저장 테스트 (계획 + 일괄 저장)
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.user import User
+from app.models.guest import Guest
+from app.models.member import ClubMember, Gender, MemberRole, MemberStatus
+from app.models.event import Event, EventType, Session, SessionStatus, SessionParticipant
+from app.models.match import Match, MatchParticipant, MatchResult, MatchStatus, MatchType, Team
+from app.models.ranking import Ranking
+
+
+async def _setup(club):
+    now = utc_now()
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    session = await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+    members = []
+    for i, name in enumerate(["김철수", "이영희", "박민수"]):
+        user = await User.create(email=f"ocr{i}@test.com", cognito_sub=f"ocr-sub-{i}", name=name)
+        members.append(await ClubMember.create(
+            club=club, user=user, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        ))
+    guest = await Guest.create(club=club, name="손님", gender=Gender.FEMALE)
+    return session, members, guest
+
+
+def _match(team_a, team_b, score_a, score_b, court=1):
+    return {
+        "match_type": "mens_doubles", "court_number": court,
+        "team_a": {"players": team_a, "score": score_a},
+        "team_b": {"players": team_b, "score": score_b},
+    }
+
+
+@pytest.mark.asyncio
+class TestSaveExtractedMatches:
+    """OCR 결과 저장 테스트"""
+
+    async def test_save_into_existing_session(self, client, test_club, test_user, test_member):
+        session, members, guest = await _setup(test_club)
+        await SessionParticipant.create(session=session, club_member=members[0])
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/ocr/save-matches",
+            json={
+                "session_id": session.id,
+                "player_mappings": [{"extracted_name": "게스트1", "guest_id": guest.id}],
+                "matches": [
+                    _match(["김철수", "이 영희"], ["박민수", "게스트1"], 6, 3),
+                    _match(["김철수", "모르는사람"], ["박민수", "이영희"], 4, 4, court=2),
+                ],
+            },
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["match_ids"]) == 2
+        assert data["unmatched_players"] == ["모르는사람"]
+
+        matches = await Match.filter(session=session).order_by("match_number")
+        assert [m.match_number for m in matches] == [1, 2]
+        assert all(m.status == MatchStatus.COMPLETED for m in matches)
+
+        results = {r.match_id: r for r in await MatchResult.filter(match_id__in=data["match_ids"])}
+        assert results[matches[0].id].winner_team == Team.A
+        assert results[matches[1].id].winner_team is None
+        assert results[matches[0].id].sets_detail == {}
+        assert results[matches[0].id].recorded_by_id == test_user.id
+
+        assert await MatchParticipant.filter(match_id=matches[0].id).count() == 4
+        assert await MatchParticipant.filter(match_id=matches[1].id).count() == 3
+
+        # 세션 참가자는 중복 없이 추가 (기존 참가자 유지)
+        participant_rows = await SessionParticipant.filter(session=session).values("club_member_id", "guest_id")
+        assert len(participant_rows) == 4
+        assert {r["guest_id"] for r in participant_rows if r["guest_id"]} == {guest.id}
+
+        # 랭킹 반영: 김철수 1승 1무
+        ranking = await Ranking.get(club_id=test_club.id, club_member_id=members[0].id)
+        assert (ranking.wins, ranking.draws, ranking.losses) == (1, 1, 0)
+
+    async def test_similar_name_is_not_recorded_against_member(self, client, test_club, test_user, test_member):
+        session, members, _ = await _setup(test_club)
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/ocr/save-matches",
+            json={"session_id": session.id, "matches": [_match(["김철수", "박민주"], ["이영희"], 6, 3)]},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        # 박민수와 자모 하나 차이: 자동 연결하지 않고 후보로만 제공
+        assert data["unmatched_players"] == ["박민주"]
+        assert data["player_suggestions"]["박민주"][0]["member_id"] == members[2].id
+        assert not await MatchParticipant.filter(club_member_id=members[2].id).exists()
+
+    async def test_match_numbers_continue_existing(self, client, test_club, test_user, test_member):
+        session, _, _ = await _setup(test_club)
+        await Match.create(
+            session=session, match_number=1, court_number=1, scheduled_datetime=utc_now(),
+            match_type=MatchType.MENS_DOUBLES,
+        )
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/ocr/save-matches",
+            json={"session_id": session.id, "matches": [_match(["김철수"], ["박민수"], 6, 0)]},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        match = await Match.get(id=response.json()["match_ids"][0])
+        assert match.match_number == 2
+
+    async def test_fixed_statement_count(self, db, capture_sql, test_club, test_user, test_member):
+        from app.api.ocr import save_extracted_matches, SaveMatchesRequest
+
+        session, _, _ = await _setup(test_club)
+        counts = []
+        for match_count in (2, 4, 12):
+            request = SaveMatchesRequest(
+                session_id=session.id,
+                matches=[_match(["김철수", "이영희"], ["박민수", "손님"], 6, 2) for _ in range(match_count)],
+            )
+            with capture_sql() as statements:
+                result = await save_extracted_matches(test_club.id, request, test_member)
+            assert len(result["match_ids"]) == match_count
+            counts.append(len(statements))
+
+        # 첫 저장 이후에는 세션 참가자/랭킹 행이 이미 있으므로 경기 수와 무관하게 동일
+        assert counts[1] == counts[2]
+
+    async def test_missing_session_rolls_back_new_season(self, client, test_club, test_user, test_member):
+        from app.models.season import Season
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/ocr/save-matches",
+            json={
+                "create_new_season": True, "new_season_name": "새 시즌",
+                "new_season_start_date": "2026-01-01", "new_season_end_date": "2026-12-31",
+                "session_id": 99999,
+                "matches": [],
+            },
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 404
+        assert not await Season.filter(name="새 시즌").exists()
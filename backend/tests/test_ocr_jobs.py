@@ -0,0 +1,199 @@
+"""
+OCR 비동기 작업 큐 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.gemini_client import GeminiTimeoutError
+from app.services.ocr_jobs import OCRJobQueue, OCRJobLimitError, COMPLETED, FAILED
+
+
+def _result(name: str, date=None) -> dict:
+    return {"date": date, "location": None, "matches": [{
+        "match_type": "singles", "court_number": 1,
+        "team_a": {"players": [name], "score": 6},
+        "team_b": {"players": ["상대"], "score": 2},
+    }]}
+
+
+@pytest.mark.asyncio
+class TestOCRJobQueue:
+    """작업 큐 단위 테스트"""
+
+    async def test_pages_processed_in_parallel(self):
+        queue = OCRJobQueue(workers=2, max_retries=0, ttl=60, retry_delay=0)
+        running = 0
+        peak = 0
+
+        async def extract(data, mime_type):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _result(data.decode()), False
+
+        with patch("app.services.ocr_service.ocr_service.extract_with_cache", side_effect=extract):
+            job = await queue.submit(1, 1, [("a.png", "image/png", b"A"), ("b.png", "image/png", b"B"),
+                                            ("c.png", "image/png", b"C")])
+            await queue.join()
+        await queue.shutdown()
+
+        assert peak == 2
+        assert job.status == COMPLETED
+        assert [m["team_a"]["players"][0] for m in job.merged_result()["matches"]] == ["A", "B", "C"]
+        assert all(page.data is None for page in job.pages)
+
+    async def test_workers_do_not_inherit_request_context(self):
+        from app.core import cache
+
+        queue = OCRJobQueue(workers=1, max_retries=0, ttl=60, retry_delay=0)
+        seen = []
+
+        async def extract(data, mime_type):
+            seen.append(cache.get_request_cache())
+            return _result("김철수"), False
+
+        # 첫 제출 요청의 요청 캐시가 설정된 상태에서 워커 생성
+        token = cache._request_cache.set({"club": "요청 캐시"})
+        try:
+            with patch("app.services.ocr_service.ocr_service.extract_with_cache", side_effect=extract):
+                await queue.submit(1, 1, [("a.png", "image/png", b"A")])
+                await queue.join()
+        finally:
+            cache._request_cache.reset(token)
+        await queue.shutdown()
+
+        assert seen == [None]
+
+    async def test_retry_then_partial_failure(self):
+        queue = OCRJobQueue(workers=1, max_retries=1, ttl=60, retry_delay=0)
+        calls = {"good": 0, "bad": 0}
+
+        async def extract(data, mime_type):
+            key = data.decode()
+            calls[key] += 1
+            if key == "bad" or calls[key] == 1:
+                raise GeminiTimeoutError("일시 오류")
+            return _result("김철수", date="2026-05-01"), False
+
+        with patch("app.services.ocr_service.ocr_service.extract_with_cache", side_effect=extract):
+            job = await queue.submit(1, 1, [("1.png", "image/png", b"good"), ("2.png", "image/png", b"bad")])
+            await queue.join()
+        await queue.shutdown()
+
+        good, bad = job.pages
+        assert (good.status, good.attempts) == (COMPLETED, 2)
+        assert (bad.status, bad.attempts, bad.error) == (FAILED, 2, "일시 오류")
+        # 일부 페이지 실패 시에도 성공한 결과는 반환
+        assert job.status == COMPLETED
+        assert job.merged_result()["date"] == "2026-05-01"
+
+    async def test_non_retryable_error_fails_immediately(self):
+        queue = OCRJobQueue(workers=1, max_retries=2, ttl=60, retry_delay=0)
+        extract = AsyncMock(side_effect=ValueError("결과 파싱 실패"))
+
+        with patch("app.services.ocr_service.ocr_service.extract_with_cache", extract):
+            job = await queue.submit(1, 1, [("1.png", "image/png", b"bad")])
+            await queue.join()
+        await queue.shutdown()
+
+        assert (job.pages[0].status, job.pages[0].attempts) == (FAILED, 1)
+
+    async def test_pending_jobs_limited_and_never_expired(self):
+        queue = OCRJobQueue(workers=1, max_retries=0, ttl=0.01, retry_delay=0,
+                            max_pending=2, max_pending_per_user=1)
+        release = asyncio.Event()
+
+        async def extract(data, mime_type):
+            await release.wait()
+            return _result("김철수"), False
+
+        with patch("app.services.ocr_service.ocr_service.extract_with_cache", side_effect=extract):
+            first = await queue.submit(1, 1, [("1.png", "image/png", b"1")])
+            with pytest.raises(OCRJobLimitError) as per_user:
+                await queue.submit(1, 1, [("2.png", "image/png", b"2")])
+            await queue.submit(1, 2, [("3.png", "image/png", b"3")])
+            with pytest.raises(OCRJobLimitError) as total:
+                await queue.submit(1, 3, [("4.png", "image/png", b"4")])
+            assert (per_user.value.per_user, total.value.per_user) == (True, False)
+
+            # TTL이 지나도 처리 중인 작업은 조회 가능
+            await asyncio.sleep(0.05)
+            assert queue.get(first.id) is first
+            release.set()
+            await queue.join()
+
+        assert first.status == COMPLETED
+        # 끝난 작업은 제한에서 빠지고 TTL 후 만료
+        await queue.submit(1, 1, [("5.png", "image/png", b"5")])
+        await queue.join()
+        await asyncio.sleep(0.05)
+        assert queue.get(first.id) is None
+        await queue.shutdown()
+
+
+@pytest.mark.asyncio
+class TestOCRJobAPI:
+    """작업 제출/조회 API 테스트"""
+
+    async def test_submit_and_poll(self, client, test_club, test_user, test_member, test_admin):
+        from app.core.security import create_access_token
+        from app.services.ocr_jobs import ocr_job_queue
+
+        cookies = {"access_token": create_access_token(test_user.id)}
+        extract = AsyncMock(side_effect=[_result("테스트유저"), _result("손님")])
+        with patch("app.api.ocr.ocr_service.extract_match_results", extract):
+            response = await client.post(
+                f"/api/clubs/{test_club.id}/ocr/jobs",
+                files=[("files", ("p1.png", b"page-1", "image/png")), ("files", ("p2.png", b"page-2", "image/png"))],
+                cookies=cookies,
+            )
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            assert len(response.json()["pages"]) == 2
+            await ocr_job_queue.join()
+
+        response = await client.get(f"/api/clubs/{test_club.id}/ocr/jobs/{job_id}", cookies=cookies)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert len(data["result"]["matches"]) == 2
+        assert data["result"]["player_suggestions"]["테스트유저"][0]["member_id"] == test_member.id
+
+        # 다른 사용자/다른 클럽에서는 조회 불가
+        other = await client.get(f"/api/clubs/{test_club.id + 1}/ocr/jobs/{job_id}", cookies=cookies)
+        assert other.status_code == 404
+
+    async def test_rejects_invalid_files(self, client, test_club, test_user, test_member):
+        from app.core.security import create_access_token
+
+        response = await client.post(
+            f"/api/clubs/{test_club.id}/ocr/jobs",
+            files=[("files", ("doc.pdf", b"pdf", "application/pdf"))],
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 400
+
+    async def test_unknown_job(self, client, test_club, test_user, test_member):
+        from app.core.security import create_access_token
+
+        response = await client.get(
+            f"/api/clubs/{test_club.id}/ocr/jobs/unknown",
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 404
+
+    async def test_rejects_when_user_has_too_many_pending(self, client, test_club, test_user, test_member):
+        from app.core.security import create_access_token
+        from app.services.ocr_jobs import ocr_job_queue
+
+        with patch.object(ocr_job_queue, "check_capacity",
+                          side_effect=OCRJobLimitError("처리 중인 작업이 너무 많습니다", per_user=True)):
+            response = await client.post(
+                f"/api/clubs/{test_club.id}/ocr/jobs",
+                files=[("files", ("p1.png", b"page-1", "image/png"))],
+                cookies={"access_token": create_access_token(test_user.id)},
+            )
+        assert response.status_code == 429
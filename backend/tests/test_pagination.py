@@ -0,0 +1,105 @@
+"""
+커서(keyset) 페이지네이션 테스트
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.schemas.pagination import encode_cursor, decode_cursor
+
+
+class TestCursorEncoding:
+    """커서 인코딩/디코딩 테스트"""
+
+    def test_roundtrip_with_datetime(self):
+        now = utc_now()
+        assert decode_cursor(encode_cursor([now, 42]), 2) == [now, 42]
+
+    def test_invalid_cursor(self):
+        from fastapi import HTTPException
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor", 2)
+        assert exc.value.status_code == 400
+
+    def test_length_mismatch(self):
+        from fastapi import HTTPException
+        with pytest.raises(HTTPException):
+            decode_cursor(encode_cursor([1]), 2)
+
+
+async def _collect(client, url, cookies, page_size):
+    """next_cursor를 따라가며 전체 항목 수집"""
+    items, cursor, pages = [], "", 0
+    while cursor is not None:
+        response = await client.get(url, params={"cursor": cursor, "page_size": page_size}, cookies=cookies)
+        assert response.status_code == 200
+        data = response.json()
+        items.extend(data["items"])
+        assert data["has_next"] == (data["next_cursor"] is not None)
+        cursor = data["next_cursor"]
+        pages += 1
+    return items, pages
+
+
+@pytest.mark.asyncio
+class TestCursorPagination:
+    """목록 API 커서 페이지네이션 테스트"""
+
+    async def test_sessions_cursor_matches_offset_order(self, client, test_club, test_user, test_member):
+        event = await Event.create(club=test_club, title="정기 모임", event_type=EventType.REGULAR)
+        base = utc_now()
+        # 같은 시작 시간을 공유하는 세션 포함 (id로 순서 결정)
+        for i in range(7):
+            start = base - timedelta(days=i // 2)
+            await Session.create(
+                event=event, title=f"세션 {i}", start_datetime=start, end_datetime=start + timedelta(hours=2),
+                num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+            )
+
+        cookies = {"access_token": create_access_token(test_user.id)}
+        url = f"/api/clubs/{test_club.id}/sessions"
+        items, pages = await _collect(client, url, cookies, page_size=3)
+
+        assert pages == 3
+        ids = [item["id"] for item in items]
+        assert len(ids) == len(set(ids)) == 7
+
+        expected = await Session.filter(event=event).order_by("-start_datetime", "-id").values_list("id", flat=True)
+        assert ids == list(expected)
+
+    async def test_total_is_optional(self, client, test_club, test_user, test_member):
+        for i in range(3):
+            await Event.create(club=test_club, title=f"일정 {i}", event_type=EventType.REGULAR)
+
+        cookies = {"access_token": create_access_token(test_user.id)}
+        url = f"/api/clubs/{test_club.id}/events"
+
+        response = await client.get(url, params={"cursor": "", "page_size": 2}, cookies=cookies)
+        data = response.json()
+        assert data["total"] is None
+        assert len(data["items"]) == 2
+
+        response = await client.get(
+            url, params={"cursor": "", "page_size": 2, "include_total": True}, cookies=cookies
+        )
+        assert response.json()["total"] == 3
+
+    async def test_members_and_clubs_cursor(self, client, test_club, test_user, test_member):
+        cookies = {"access_token": create_access_token(test_user.id)}
+
+        members, _ = await _collect(client, f"/api/clubs/{test_club.id}/members", cookies, page_size=1)
+        assert [m["id"] for m in members] == [test_member.id]
+
+        clubs, _ = await _collect(client, "/api/clubs", cookies, page_size=1)
+        assert [c["id"] for c in clubs] == [test_club.id]
+        assert clubs[0]["member_count"] == 1
+
+    async def test_invalid_cursor_returns_400(self, client, test_club, test_user, test_member):
+        response = await client.get(
+            f"/api/clubs/{test_club.id}/sessions",
+            params={"cursor": "garbage"},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 400
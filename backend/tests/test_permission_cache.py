@@ -0,0 +1,128 @@
+"""
+권한 캐시 테스트 (TTL 캐시 / ClubPermission 멤버십 캐시 / 무효화)
+"""
+import pytest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+
+from app.core.cache import MISSING, TTLCache
+from app.core.dependencies import (
+    ClubPermission,
+    require_club_manager,
+    invalidate_membership_cache,
+    invalidate_club_cache,
+)
+from app.core.security import create_access_token
+from app.models.club import Club
+from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+from app.models.user import User
+
+
+class TestTTLCache:
+    """LRU + TTL 캐시 테스트"""
+
+    def test_expiry(self):
+        now = [0.0]
+        cache = TTLCache(maxsize=10, ttl=5, timer=lambda: now[0])
+        cache.set("a", None)
+        assert cache.get("a") is None
+        now[0] = 5.0
+        assert cache.get("a") is MISSING
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is MISSING
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_pop_where(self):
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set((1, 10), "x")
+        cache.set((2, 10), "y")
+        cache.set((1, 20), "z")
+        cache.pop_where(lambda key: key[1] == 10)
+        assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+class TestMembershipCache:
+    """ClubPermission 멤버십 캐시 테스트"""
+
+    async def test_cached_membership_skips_queries(self, db, test_club, test_user, test_member):
+        await require_club_manager(club_id=test_club.id, current_user=test_user)
+
+        with patch.object(ClubMember, "get_or_none") as member_query, \
+                patch.object(Club, "get_or_none") as club_query:
+            membership = await require_club_manager(club_id=test_club.id, current_user=test_user)
+
+        assert membership.id == test_member.id
+        member_query.assert_not_called()
+        club_query.assert_not_called()
+
+    async def test_returned_membership_is_a_copy(self, db, test_club, test_user, test_member):
+        first = await require_club_manager(club_id=test_club.id, current_user=test_user)
+        first.role = MemberRole.GUEST
+        second = await require_club_manager(club_id=test_club.id, current_user=test_user)
+        assert second.role == MemberRole.MANAGER
+
+    async def test_role_change_requires_invalidation(self, db, test_club, test_user, test_member):
+        await require_club_manager(club_id=test_club.id, current_user=test_user)
+        await ClubMember.filter(id=test_member.id).update(role=MemberRole.MEMBER)
+
+        invalidate_membership_cache(test_user.id, test_club.id)
+        with pytest.raises(HTTPException) as exc:
+            await require_club_manager(club_id=test_club.id, current_user=test_user)
+        assert exc.value.status_code == 403
+
+    async def test_club_delete_invalidates(self, db, test_club, test_user, test_member):
+        await require_club_manager(club_id=test_club.id, current_user=test_user)
+        await Club.filter(id=test_club.id).update(is_deleted=True)
+
+        invalidate_club_cache(test_club.id)
+        with pytest.raises(HTTPException) as exc:
+            await ClubPermission()(club_id=test_club.id, current_user=test_user)
+        assert exc.value.status_code == 404
+
+
+@pytest.mark.asyncio
+class TestMembershipCacheEndpoints:
+    """엔드포인트의 명시적 무효화 테스트"""
+
+    async def test_approve_then_access(self, client, test_club, test_user, test_member):
+        applicant = await User.create(email="new@test.com", cognito_sub="new-sub", name="신입")
+        pending = await ClubMember.create(
+            club=test_club, user=applicant, role=MemberRole.MEMBER,
+            status=MemberStatus.PENDING, gender=Gender.MALE,
+        )
+        applicant_cookie = {"access_token": create_access_token(applicant.id)}
+        manager_cookie = {"access_token": create_access_token(test_user.id)}
+        url = f"/api/clubs/{test_club.id}/members"
+
+        response = await client.get(url, cookies=applicant_cookie)
+        assert response.status_code == 403
+
+        response = await client.post(f"{url}/{pending.id}/approve", cookies=manager_cookie)
+        assert response.status_code == 200
+
+        response = await client.get(url, cookies=applicant_cookie)
+        assert response.status_code == 200
+
+    async def test_remove_member_revokes_access(self, client, test_club, test_user, test_member):
+        other = await User.create(email="other@test.com", cognito_sub="other-sub", name="회원")
+        member = await ClubMember.create(
+            club=test_club, user=other, role=MemberRole.MEMBER,
+            status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        )
+        other_cookie = {"access_token": create_access_token(other.id)}
+        url = f"/api/clubs/{test_club.id}/members"
+
+        assert (await client.get(url, cookies=other_cookie)).status_code == 200
+        response = await client.delete(
+            f"{url}/{member.id}", cookies={"access_token": create_access_token(test_user.id)}
+        )
+        assert response.status_code == 200
+        assert (await client.get(url, cookies=other_cookie)).status_code == 403
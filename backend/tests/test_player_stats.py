@@ -0,0 +1,236 @@
+"""
+회원/게스트 통계 서비스 테스트
+"""
+import pytest
+from datetime import timedelta
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.models.guest import Guest
+from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+from app.models.member import ClubMember, Gender
+from app.models.ranking import PlayerStatSummary
+from app.services import player_stats_service
+from app.services.player_stats_service import (
+    GUEST,
+    MEMBER,
+    SUMMARY_FIELDS,
+    compute_player_records,
+    rebuild_player_stats,
+    summarize_timeline,
+)
+
+
+async def _setup(club, member, match_count):
+    """회원 + 게스트(같은 팀) vs 게스트 경기 match_count개"""
+    now = utc_now()
+    partner = await Guest.create(club=club, name="파트너", gender=Gender.MALE)
+    opponent = await Guest.create(club=club, name="상대", gender=Gender.MALE)
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    session = await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+    matches = []
+    for number in range(1, match_count + 1):
+        match = await Match.create(
+            session=session, match_number=number, court_number=1,
+            scheduled_datetime=now + timedelta(minutes=30 * number),
+            match_type=MatchType.MENS_DOUBLES, status=MatchStatus.SCHEDULED,
+        )
+        await MatchParticipant.create(match=match, club_member=member, team=Team.A, position=1)
+        await MatchParticipant.create(match=match, guest=partner, team=Team.A, position=2)
+        await MatchParticipant.create(match=match, guest=opponent, team=Team.B, position=1)
+        matches.append(match)
+    return session, matches, partner, opponent
+
+
+async def _record(client, club, user, session, scores):
+    response = await client.put(
+        f"/api/clubs/{club.id}/sessions/{session.id}/matches/bulk-scores",
+        json={"scores": [
+            {"match_id": match.id, "team_a_score": a, "team_b_score": b} for match, a, b in scores
+        ]},
+        cookies={"access_token": create_access_token(user.id)},
+    )
+    assert response.status_code == 200
+
+
+def _counters(player):
+    return player.total_games, player.wins, player.draws, player.losses
+
+
+async def _assert_summaries_match_history(players):
+    """저장된 요약이 전체 기록으로 다시 계산한 값과 같은지 확인"""
+    records = await compute_player_records(players)
+    for (kind, player_id), record in records.items():
+        owner = {"club_member_id": player_id} if kind == MEMBER else {"guest_id": player_id}
+        summary = await PlayerStatSummary.get(**owner)
+        for name in SUMMARY_FIELDS:
+            if name != "last_updated":
+                assert getattr(summary, name) == record[name], name
+
+
+class TestSummarizeTimeline:
+    """파생 통계 계산"""
+
+    def test_streaks_and_form(self):
+        letters = "WWWLLDWLLL"
+        timeline = [(i, i, letter, ["member:2"], ["guest:9"]) for i, letter in enumerate(letters)]
+
+        stats = summarize_timeline(timeline)
+
+        assert (stats["wins"], stats["draws"], stats["losses"]) == (4, 1, 5)
+        assert stats["current_streak"] == -3
+        assert (stats["longest_win_streak"], stats["longest_loss_streak"]) == (3, 3)
+        assert stats["recent_form"] == letters[::-1]
+        assert stats["partners"] == {"member:2": [4, 1, 5]}
+        assert stats["opponents"] == {"guest:9": [4, 1, 5]}
+
+    def test_empty(self):
+        stats = summarize_timeline([])
+        assert (stats["total_games"], stats["current_streak"], stats["last_played_at"]) == (0, 0, None)
+
+
+@pytest.mark.asyncio
+class TestIncrementalStats:
+    """경기 결과 변경 시 증분 갱신"""
+
+    async def test_counters_follow_result_changes(self, client, test_club, test_user, test_member):
+        session, matches, partner, opponent = await _setup(test_club, test_member, 3)
+
+        await _record(client, test_club, test_user, session, [
+            (matches[0], 6, 2), (matches[1], 6, 4), (matches[2], 3, 6),
+        ])
+        await test_member.refresh_from_db()
+        await opponent.refresh_from_db()
+        assert _counters(test_member) == (3, 2, 0, 1)
+        assert _counters(opponent) == (3, 1, 0, 2)
+
+        # 결과 수정: 마지막 경기를 무승부로
+        await _record(client, test_club, test_user, session, [(matches[2], 5, 5)])
+        await test_member.refresh_from_db()
+        assert _counters(test_member) == (3, 2, 1, 0)
+
+        summary = await PlayerStatSummary.get(club_member_id=test_member.id)
+        assert summary.recent_form == "DWW"
+        assert (summary.current_streak, summary.longest_win_streak) == (0, 2)
+        assert summary.partners == {f"{GUEST}:{partner.id}": [2, 1, 0]}
+        assert summary.opponents == {f"{GUEST}:{opponent.id}": [2, 1, 0]}
+
+        guest_summary = await PlayerStatSummary.get(guest_id=opponent.id)
+        assert guest_summary.opponents[f"{MEMBER}:{test_member.id}"] == [0, 1, 2]
+
+    async def test_summaries_match_full_history(self, client, test_club, test_user, test_member):
+        session, matches, partner, opponent = await _setup(test_club, test_member, 14)
+        players = [(MEMBER, test_member.id), (GUEST, partner.id), (GUEST, opponent.id)]
+        cookies = {"access_token": create_access_token(test_user.id)}
+
+        steps = [
+            [(match, 6, 2) for match in matches[:4]] + [(match, 2, 6) for match in matches[4:11]],
+            [(matches[11], 2, 6)],            # 마지막에 추가 (연패 이어짐)
+            [(matches[12], 6, 1), (matches[13], 4, 4)],
+            [(matches[13], 1, 6)],            # 마지막 경기 수정
+            [(matches[12], 3, 6)],            # 마지막이 아닌 경기 수정
+            [(matches[2], 5, 5)],             # 오래된 경기 수정
+        ]
+        for scores in steps:
+            await _record(client, test_club, test_user, session, scores)
+            await _assert_summaries_match_history(players)
+
+        response = await client.delete(f"/api/clubs/{test_club.id}/matches/{matches[13].id}", cookies=cookies)
+        assert response.status_code == 204
+        await _assert_summaries_match_history(players)
+
+    async def test_latest_results_skip_full_history(self, client, test_club, test_user, test_member, monkeypatch):
+        session, matches, partner, _ = await _setup(test_club, test_member, 12)
+        await _record(client, test_club, test_user, session, [
+            (match, 6, 2) if letter == "W" else (match, 2, 6) for match, letter in zip(matches, "LLLWWLWLWW")
+        ])
+
+        recomputed = []
+        original = player_stats_service.compute_player_records
+
+        async def spy(players):
+            players = set(players)
+            recomputed.extend(players)
+            return await original(players)
+
+        monkeypatch.setattr(player_stats_service, "compute_player_records", spy)
+        # 마지막 경기 추가/수정은 저장된 요약에서 이어서 계산
+        await _record(client, test_club, test_user, session, [(matches[10], 6, 3), (matches[11], 2, 6)])
+        await _record(client, test_club, test_user, session, [(matches[11], 6, 4)])
+        assert recomputed == []
+
+        # 과거 경기 수정은 해당 선수만 다시 계산
+        await _record(client, test_club, test_user, session, [(matches[0], 6, 2)])
+        assert (MEMBER, test_member.id) in recomputed
+        await _assert_summaries_match_history([(MEMBER, test_member.id), (GUEST, partner.id)])
+
+    async def test_match_delete_reverts_counters(self, client, test_club, test_user, test_member):
+        session, matches, _, _ = await _setup(test_club, test_member, 2)
+        await _record(client, test_club, test_user, session, [(matches[0], 6, 2), (matches[1], 6, 3)])
+
+        for match in matches:
+            response = await client.delete(
+                f"/api/clubs/{test_club.id}/matches/{match.id}",
+                cookies={"access_token": create_access_token(test_user.id)},
+            )
+            assert response.status_code == 204
+
+        await test_member.refresh_from_db()
+        assert _counters(test_member) == (0, 0, 0, 0)
+        summary = await PlayerStatSummary.get(club_member_id=test_member.id)
+        assert (summary.recent_form, summary.partners) == ("", {})
+
+
+@pytest.mark.asyncio
+class TestRebuild:
+    """전체 재계산 (백필)"""
+
+    async def test_backfill_fixes_drift(self, db, test_club, test_user, test_member):
+        _, matches, partner, opponent = await _setup(test_club, test_member, 2)
+        # 증분 갱신 없이 직접 저장된 과거 기록
+        for match, winner in zip(matches, (Team.A, Team.B)):
+            await MatchResult.create(match=match, team_a_score=6, team_b_score=3, sets_detail={},
+                                     winner_team=winner)
+            match.status = MatchStatus.COMPLETED
+            await match.save()
+        await ClubMember.filter(id=test_member.id).update(total_games=7, wins=7)
+
+        report = await rebuild_player_stats(test_club.id, dry_run=True)
+        assert report["drifted_member_ids"] == [test_member.id]
+        assert report["drifted_guest_ids"] == sorted([partner.id, opponent.id])
+        assert not await PlayerStatSummary.exists()
+
+        await rebuild_player_stats(test_club.id)
+
+        await test_member.refresh_from_db()
+        await partner.refresh_from_db()
+        assert _counters(test_member) == (2, 1, 0, 1)
+        assert _counters(partner) == (2, 1, 0, 1)
+        assert (await PlayerStatSummary.get(club_member_id=test_member.id)).recent_form == "LW"
+        assert (await rebuild_player_stats(test_club.id, dry_run=True))["drifted_member_ids"] == []
+
+    async def test_stats_endpoints(self, client, test_club, test_user, test_member):
+        session, matches, partner, _ = await _setup(test_club, test_member, 1)
+        await _record(client, test_club, test_user, session, [(matches[0], 6, 0)])
+        cookies = {"access_token": create_access_token(test_user.id)}
+
+        response = await client.get(
+            f"/api/clubs/{test_club.id}/player-stats/members/{test_member.id}", cookies=cookies
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["total_games"], data["wins"], data["current_streak"]) == (1, 1, 1)
+        assert data["partners"][0] == {
+            "type": GUEST, "id": partner.id, "name": "파트너", "games": 1, "wins": 1, "draws": 0, "losses": 0,
+        }
+
+        response = await client.post(f"/api/clubs/{test_club.id}/player-stats/rebuild", cookies=cookies)
+        assert response.status_code == 200
+        assert response.json()["drifted_players"] == 0
+
+        response = await client.get(f"/api/clubs/{test_club.id}/player-stats/guests/99999", cookies=cookies)
+        assert response.status_code == 404
@@ -0,0 +1,295 @@
+"""
+랭킹 서비스 테스트 (증분 갱신 / 전체 재계산)
+"""
+import pytest
+from datetime import timedelta
+
+from app.models.user import User
+from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+from app.models.ranking import Ranking
+from app.models.season import Season, SeasonRanking, SeasonStatus
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.services.ranking_service import (
+    DRAW,
+    result_outcome,
+    apply_outcome_changes,
+    revert_session_outcomes,
+    rebuild_club_rankings,
+    rebuild_season_rankings,
+    assign_ranks,
+)
+
+
+async def _create_members(club, count: int) -> list:
+    """테스트용 회원 생성"""
+    return await _create_members_with_prefix(club, "player", count)
+
+
+async def _create_members_with_prefix(club, prefix: str, count: int) -> list:
+    members = []
+    for i in range(count):
+        user = await User.create(email=f"{prefix}{i}@test.com", cognito_sub=f"{prefix}-sub-{i}", name=f"{prefix}{i}")
+        members.append(await ClubMember.create(
+            club=club, user=user, role=MemberRole.MEMBER,
+            status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        ))
+    return members
+
+
+async def _create_session(club, season=None) -> Session:
+    now = utc_now()
+    event = None
+    if season is None:
+        event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    return await Session.create(
+        event=event, season=season, title="테스트 세션",
+        start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+
+
+async def _create_match(session, team_a, team_b, number: int = 1) -> Match:
+    match = await Match.create(
+        session=session, match_number=number, court_number=1,
+        scheduled_datetime=session.start_datetime, match_type=MatchType.MENS_DOUBLES,
+        status=MatchStatus.COMPLETED,
+    )
+    for team, members in ((Team.A, team_a), (Team.B, team_b)):
+        for pos, member in enumerate(members, 1):
+            await MatchParticipant.create(match=match, club_member=member, team=team, position=pos)
+    return match
+
+
+class TestResultOutcome:
+    """랭킹 반영 결과 판정 테스트"""
+
+    def test_no_result(self):
+        match = Match(status=MatchStatus.COMPLETED, is_deleted=False)
+        assert result_outcome(match, None) is None
+
+    def test_incomplete_match_not_counted(self):
+        match = Match(status=MatchStatus.SCHEDULED, is_deleted=False)
+        result = MatchResult(winner_team=Team.A)
+        assert result_outcome(match, result) is None
+
+    def test_deleted_match_not_counted(self):
+        match = Match(status=MatchStatus.COMPLETED, is_deleted=True)
+        result = MatchResult(winner_team=Team.A)
+        assert result_outcome(match, result) is None
+
+    def test_winner_and_draw(self):
+        match = Match(status=MatchStatus.COMPLETED, is_deleted=False)
+        assert result_outcome(match, MatchResult(winner_team=Team.B)) == "B"
+        assert result_outcome(match, MatchResult(winner_team=None)) == DRAW
+
+
+@pytest.mark.asyncio
+class TestIncrementalRanking:
+    """증분 랭킹 갱신 테스트"""
+
+    async def test_create_edit_delete_result(self, db, test_club):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+
+        # 결과 등록: A팀 승리
+        await apply_outcome_changes(test_club.id, None, [(match.id, None, "A")])
+        ranking = await Ranking.get(club=test_club, club_member=a1)
+        assert (ranking.wins, ranking.losses, ranking.points) == (1, 0, 3)
+        ranking = await Ranking.get(club=test_club, club_member=b1)
+        assert (ranking.wins, ranking.losses, ranking.points) == (0, 1, 0)
+
+        # 결과 수정: 무승부
+        await apply_outcome_changes(test_club.id, None, [(match.id, "A", DRAW)])
+        ranking = await Ranking.get(club=test_club, club_member=a1)
+        assert (ranking.total_matches, ranking.wins, ranking.draws, ranking.points) == (1, 0, 1, 1)
+
+        # 결과 삭제
+        await apply_outcome_changes(test_club.id, None, [(match.id, DRAW, None)])
+        ranking = await Ranking.get(club=test_club, club_member=b2)
+        assert (ranking.total_matches, ranking.points) == (0, 0)
+
+    async def test_season_ranking_updated(self, db, test_club, test_season):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club, season=test_season)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+
+        await apply_outcome_changes(test_club.id, test_season.id, [(match.id, None, "B")])
+
+        season_ranking = await SeasonRanking.get(season=test_season, club_member=b2)
+        assert (season_ranking.wins, season_ranking.points) == (1, 3)
+
+    async def test_revert_session_outcomes(self, db, test_club, test_user):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        await MatchResult.create(
+            match=match, team_a_score=6, team_b_score=3, sets_detail={},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+        await apply_outcome_changes(test_club.id, None, [(match.id, None, "A")])
+
+        await revert_session_outcomes(test_club.id, session.id, None)
+
+        ranking = await Ranking.get(club=test_club, club_member=a1)
+        assert (ranking.total_matches, ranking.wins, ranking.points) == (0, 0, 0)
+
+
+@pytest.mark.asyncio
+class TestSessionRewrites:
+    """세션 경기 재생성 시 랭킹 반영분 처리"""
+
+    async def test_confirm_ai_rolls_back_on_failure(self, client, test_club, test_user, test_member):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        await MatchResult.create(
+            match=match, team_a_score=6, team_b_score=3, sets_detail={},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+        await apply_outcome_changes(test_club.id, None, [(match.id, None, "A")])
+
+        with pytest.raises(Exception):
+            await client.post(
+                f"/api/clubs/{test_club.id}/sessions/{session.id}/matches/confirm-ai",
+                json={"matches": [{"match_number": 1, "court_number": "코트"}]},
+                cookies={"access_token": create_access_token(test_user.id)},
+            )
+
+        # 되돌린 랭킹과 삭제한 경기가 모두 복구됨
+        assert await Match.filter(id=match.id).exists()
+        ranking = await Ranking.get(club=test_club, club_member=a1)
+        assert (ranking.wins, ranking.points) == (1, 3)
+
+    async def test_season_change_moves_season_rankings(self, client, test_club, test_season, test_user, test_member):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club, season=test_season)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        await MatchResult.create(
+            match=match, team_a_score=6, team_b_score=3, sets_detail={},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+        await apply_outcome_changes(test_club.id, test_season.id, [(match.id, None, "A")])
+        other = await Season.create(
+            club=test_club, name="2026년 하반기", start_date=test_season.start_date,
+            end_date=test_season.end_date, status=SeasonStatus.ACTIVE,
+        )
+
+        response = await client.put(
+            f"/api/clubs/{test_club.id}/sessions/{session.id}",
+            json={"date": "2026-05-01", "start_time": "09:00", "end_time": "12:00",
+                  "num_courts": 2, "season_id": other.id},
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+
+        old = await SeasonRanking.get(season=test_season, club_member=a1)
+        new = await SeasonRanking.get(season=other, club_member=a1)
+        assert (old.total_matches, old.points) == (0, 0)
+        assert (new.wins, new.points) == (1, 3)
+        # 클럽 랭킹은 그대로
+        ranking = await Ranking.get(club=test_club, club_member=a1)
+        assert (ranking.wins, ranking.points) == (1, 3)
+        # 전체 재계산 결과와 일치
+        assert {m: s["points"] for m, s in (await rebuild_season_rankings(other.id)).items()}[a1.id] == 3
+
+
+@pytest.mark.asyncio
+class TestRankingReconciliation:
+    """전체 재계산(drift 점검) 테스트"""
+
+    async def test_no_drift_after_incremental_updates(self, db, test_club, test_user):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        result = await MatchResult.create(
+            match=match, team_a_score=6, team_b_score=4, sets_detail={},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+        await apply_outcome_changes(test_club.id, None, [(match.id, None, result_outcome(match, result))])
+
+        report = await rebuild_club_rankings(test_club.id, dry_run=True)
+        assert report["total_members"] == 4
+        assert report["drifted_member_ids"] == []
+
+    async def test_drift_detected_and_fixed(self, db, test_club, test_user):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        await MatchResult.create(
+            match=match, team_a_score=6, team_b_score=4, sets_detail={},
+            winner_team=Team.A, recorded_by=test_user,
+        )
+        # 증분 갱신 없이 결과만 존재 → 전원 drift
+        report = await rebuild_club_rankings(test_club.id, dry_run=True)
+        assert sorted(report["drifted_member_ids"]) == sorted([a1.id, a2.id, b1.id, b2.id])
+        assert await Ranking.filter(club=test_club).count() == 0
+
+        await rebuild_club_rankings(test_club.id)
+        ranking = await Ranking.get(club=test_club, club_member=a2)
+        assert (ranking.wins, ranking.points) == (1, 3)
+
+        report = await rebuild_club_rankings(test_club.id, dry_run=True)
+        assert report["drifted_member_ids"] == []
+
+
+@pytest.mark.asyncio
+class TestSeasonRankingRebuild:
+    """시즌 랭킹 일괄 계산 테스트"""
+
+    async def test_rebuild_with_ranks(self, db, test_club, test_season, test_user):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        session = await _create_session(test_club, season=test_season)
+        results = [(Team.A, 6, 2), (Team.A, 6, 4), (None, 5, 5)]
+        for number, (winner, score_a, score_b) in enumerate(results, 1):
+            match = await _create_match(session, [a1, a2], [b1, b2], number=number)
+            await MatchResult.create(
+                match=match, team_a_score=score_a, team_b_score=score_b, sets_detail={},
+                winner_team=winner, recorded_by=test_user,
+            )
+        # 결과가 없는 완료 경기는 집계에서 제외
+        await _create_match(session, [a1, b1], [a2, b2], number=4)
+
+        stats = await rebuild_season_rankings(test_season.id)
+
+        assert stats[a1.id] == {
+            "total_matches": 3, "wins": 2, "draws": 1, "losses": 0, "points": 7, "rank": 1,
+        }
+        ranking = await SeasonRanking.get(season=test_season, club_member=b2)
+        assert (ranking.wins, ranking.draws, ranking.losses, ranking.points, ranking.rank) == (0, 1, 2, 1, 3)
+
+    async def test_rebuild_overwrites_and_resets_stale_rows(self, db, test_club, test_season, test_user):
+        a1, a2, b1, b2 = await _create_members(test_club, 4)
+        (outsider,) = await _create_members_with_prefix(test_club, "outsider", 1)
+        session = await _create_session(test_club, season=test_season)
+        match = await _create_match(session, [a1, a2], [b1, b2])
+        await MatchResult.create(
+            match=match, team_a_score=3, team_b_score=6, sets_detail={},
+            winner_team=Team.B, recorded_by=test_user,
+        )
+        await SeasonRanking.create(season=test_season, club_member=b1, wins=9, total_matches=9, points=27)
+        await SeasonRanking.create(season=test_season, club_member=outsider, wins=1, total_matches=1, points=3, rank=1)
+
+        await rebuild_season_rankings(test_season.id)
+
+        ranking = await SeasonRanking.get(season=test_season, club_member=b1)
+        assert (ranking.total_matches, ranking.wins, ranking.points, ranking.rank) == (1, 1, 3, 1)
+        stale = await SeasonRanking.get(season=test_season, club_member=outsider)
+        assert (stale.total_matches, stale.points, stale.rank) == (0, 0, None)
+        assert await SeasonRanking.filter(season=test_season).count() == 5
+
+
+class TestAssignRanks:
+    """순위 계산 테스트"""
+
+    def test_ties_share_rank(self):
+        stats = {
+            1: {"points": 6, "wins": 2, "losses": 0},
+            2: {"points": 3, "wins": 1, "losses": 1},
+            3: {"points": 3, "wins": 1, "losses": 1},
+            4: {"points": 3, "wins": 0, "losses": 0},
+        }
+        assert assign_ranks(stats) == {1: 1, 2: 2, 3: 2, 4: 4}
@@ -0,0 +1,134 @@
+"""
+레이팅 서비스 테스트 (팀 평균 Elo)
+"""
+import pytest
+from datetime import timedelta
+
+from app.models.user import User
+from app.models.member import ClubMember, MemberRole, MemberStatus, Gender
+from app.models.event import Event, EventType, Session, SessionStatus
+from app.models.guest import Guest
+from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+from app.core.timezone import utc_now
+from app.services.ranking_service import DRAW, apply_outcome_changes
+from app.services.rating_service import (
+    INITIAL_RATING,
+    PROVISIONAL_K_FACTOR,
+    expected_score,
+    replay_club_ratings,
+)
+from app.services.local_matching_service import _balance_score
+
+
+async def _players(club):
+    members = []
+    for i in range(3):
+        user = await User.create(email=f"elo{i}@test.com", cognito_sub=f"elo-sub-{i}", name=f"elo{i}")
+        members.append(await ClubMember.create(
+            club=club, user=user, role=MemberRole.MEMBER, status=MemberStatus.ACTIVE, gender=Gender.MALE,
+        ))
+    guest = await Guest.create(club=club, name="게스트", gender=Gender.MALE)
+    return members, guest
+
+
+async def _match(session, members, guest, number, winner):
+    """(회원0, 회원1) vs (회원2, 게스트), 결과 저장 후 match_id 반환"""
+    match = await Match.create(
+        session=session, match_number=number, court_number=1,
+        scheduled_datetime=session.start_datetime + timedelta(minutes=30 * number),
+        match_type=MatchType.MENS_DOUBLES, status=MatchStatus.COMPLETED,
+    )
+    await MatchParticipant.create(match=match, club_member=members[0], team=Team.A, position=1)
+    await MatchParticipant.create(match=match, club_member=members[1], team=Team.A, position=2)
+    await MatchParticipant.create(match=match, club_member=members[2], team=Team.B, position=1)
+    await MatchParticipant.create(match=match, guest=guest, team=Team.B, position=2)
+    await MatchResult.create(match=match, team_a_score=6, team_b_score=4, sets_detail={}, winner_team=winner)
+    return match.id
+
+
+async def _session(club):
+    now = utc_now()
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    return await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+
+
+async def _ratings(members, guest):
+    return [
+        (await ClubMember.get(id=m.id)).rating for m in members
+    ] + [(await Guest.get(id=guest.id)).rating]
+
+
+class TestElo:
+    """계산식"""
+
+    def test_expected_score(self):
+        assert expected_score(1500, 1500) == 0.5
+        assert round(expected_score(1900, 1500), 3) == 0.909
+
+    def test_balance_score_uses_ratings(self):
+        def player(rating):
+            return {"ranking": {"points": 0, "rating": rating}}
+
+        assert _balance_score([player(1600), player(1400)], [player(1500), player(1500)], True) == 1.0
+        assert _balance_score([player(1700), player(1700)], [player(1300), player(1300)], True) < 0.2
+        # 레이팅 없는 선수는 초기 레이팅으로 비교
+        assert _balance_score([player(1600), player(1400)], [player(None), player(None)], True) == 1.0
+
+
+@pytest.mark.asyncio
+class TestIncrementalRatings:
+    """결과 변경 시 증분 갱신"""
+
+    async def test_record_edit_and_delete(self, db, test_club):
+        members, guest = await _players(test_club)
+        session = await _session(test_club)
+        match_id = await _match(session, members, guest, 1, Team.A)
+
+        await apply_outcome_changes(test_club.id, None, [(match_id, None, "A")])
+        gain = PROVISIONAL_K_FACTOR * 0.5
+        assert await _ratings(members, guest) == [
+            INITIAL_RATING + gain, INITIAL_RATING + gain, INITIAL_RATING - gain, INITIAL_RATING - gain,
+        ]
+        changes = await MatchParticipant.filter(match_id=match_id).values_list("rating_change", flat=True)
+        assert sorted(changes) == [-gain, -gain, gain, gain]
+
+        # A 승 → 무승부: 되돌린 뒤 다시 계산 (동률 레이팅이므로 변화 없음)
+        await apply_outcome_changes(test_club.id, None, [(match_id, "A", DRAW)])
+        assert await _ratings(members, guest) == [INITIAL_RATING] * 4
+        assert (await ClubMember.get(id=members[0].id)).rating_games == 1
+
+        # 삭제
+        await apply_outcome_changes(test_club.id, None, [(match_id, DRAW, None)])
+        member = await ClubMember.get(id=members[0].id)
+        assert (member.rating, member.rating_games) == (INITIAL_RATING, 0)
+        assert set(await MatchParticipant.filter(match_id=match_id).values_list("rating_change", flat=True)) == {None}
+
+
+@pytest.mark.asyncio
+class TestReplay:
+    """전체 이력 재생"""
+
+    async def test_replay_matches_incremental_and_fixes_history_edits(self, db, test_club):
+        members, guest = await _players(test_club)
+        session = await _session(test_club)
+        first = await _match(session, members, guest, 1, Team.A)
+        second = await _match(session, members, guest, 2, Team.B)
+        for match_id, outcome in ((first, "A"), (second, "B")):
+            await apply_outcome_changes(test_club.id, None, [(match_id, None, outcome)])
+        incremental = await _ratings(members, guest)
+
+        report = await replay_club_ratings(test_club.id)
+        assert report == {"rated_matches": 2, "total_players": 4}
+        assert await _ratings(members, guest) == incremental
+
+        # 과거 경기(첫 경기)를 B 승으로 수정: 증분 갱신은 근사치, 재생 결과는 두 경기 모두 B 승
+        await MatchResult.filter(match_id=first).update(winner_team=Team.B)
+        await apply_outcome_changes(test_club.id, None, [(first, "A", "B")])
+        await replay_club_ratings(test_club.id)
+
+        ratings = await _ratings(members, guest)
+        assert ratings[0] == ratings[1] < INITIAL_RATING < ratings[2] == ratings[3]
+        assert (await ClubMember.get(id=members[0].id)).rating_games == 2
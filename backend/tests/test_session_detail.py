@@ -0,0 +1,101 @@
+"""
+세션 상세 조회 테스트 (.values() 프로젝션 기반 조회 경로)
+"""
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from tortoise import Tortoise
+
+from app.core.security import create_access_token
+from app.core.timezone import utc_now
+from app.models.user import User
+from app.models.guest import Guest
+from app.models.member import Gender
+from app.models.event import Event, EventType, Session, SessionStatus, SessionParticipant, ParticipantCategory
+from app.models.match import Match, MatchParticipant, MatchResult, MatchType, MatchStatus, Team
+
+
+async def _create_session_with_matches(club, member, recorder, match_count: int) -> Session:
+    now = utc_now()
+    event = await Event.create(club=club, title="정기 모임", event_type=EventType.REGULAR)
+    session = await Session.create(
+        event=event, title="테스트 세션", start_datetime=now, end_datetime=now + timedelta(hours=2),
+        num_courts=2, match_duration_minutes=30, status=SessionStatus.CONFIRMED,
+    )
+    guest = await Guest.create(club=club, name="손님", gender=Gender.FEMALE)
+    associate = await User.create(email="assoc@test.com", cognito_sub="assoc-sub", name="준회원")
+    await SessionParticipant.create(session=session, club_member=member)
+    await SessionParticipant.create(session=session, guest=guest, participant_category=ParticipantCategory.GUEST)
+    await SessionParticipant.create(session=session, user=associate, participant_category=ParticipantCategory.ASSOCIATE)
+
+    for number in range(1, match_count + 1):
+        match = await Match.create(
+            session=session, match_number=number, court_number=1, scheduled_datetime=now,
+            match_type=MatchType.MIXED_DOUBLES, status=MatchStatus.COMPLETED,
+        )
+        await MatchParticipant.create(match=match, club_member=member, team=Team.A, position=1)
+        await MatchParticipant.create(
+            match=match, guest=guest, team=Team.B, position=1, participant_category=ParticipantCategory.GUEST,
+        )
+        if number == 1:
+            await MatchResult.create(
+                match=match, team_a_score=6, team_b_score=4, sets_detail={},
+                winner_team=Team.A, recorded_by=recorder,
+            )
+    return session
+
+
+@pytest.mark.asyncio
+class TestSessionDetail:
+    """세션 상세 조회 테스트"""
+
+    async def test_response_shape(self, client, test_club, test_user, test_member):
+        session = await _create_session_with_matches(test_club, test_member, test_user, match_count=2)
+        response = await client.get(
+            f"/api/clubs/{test_club.id}/sessions/{session.id}",
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [p["name"] for p in data["participants"]] == ["테스트유저", "손님 (게스트)", "준회원 (준회원)"]
+        assert data["participants"][0] == {
+            "id": data["participants"][0]["id"], "category": "member", "name": "테스트유저",
+            "gender": "male", "member_id": test_member.id, "user_id": test_user.id,
+        }
+        assert data["participants"][2]["gender"] == "male"
+
+        first, second = data["matches"]
+        assert first["score"] == {"team_a": 6, "team_b": 4}
+        assert second["score"] is None
+        assert first["team_b"][0]["name"] == "손님"
+        assert first["team_b"][0]["guest_id"]
+        assert data["season_name"] is None
+        assert data["session_type"] == "league"
+
+    async def test_fixed_query_count(self, db, test_club, test_user, test_member):
+        from app.api.sessions import get_session
+
+        counts = []
+        for match_count in (1, 6):
+            session = await _create_session_with_matches(test_club, test_member, test_user, match_count)
+            connection = Tortoise.get_connection("default")
+            original = connection.execute_query_dict
+            with patch.object(connection, "execute_query_dict", side_effect=original) as spy:
+                await get_session(test_club.id, session.id, test_user)
+            counts.append(spy.call_count)
+            await User.filter(email="assoc@test.com").delete()
+
+        assert counts[0] == counts[1] == 4
+
+    async def test_other_club_session_not_found(self, client, test_club, test_user, test_member):
+        from app.models.club import Club
+
+        session = await _create_session_with_matches(test_club, test_member, test_user, match_count=1)
+        other = await Club.create(name="다른 동호회", created_by=test_user)
+        response = await client.get(
+            f"/api/clubs/{other.id}/sessions/{session.id}",
+            cookies={"access_token": create_access_token(test_user.id)},
+        )
+        assert response.status_code == 404